@@ -0,0 +1,125 @@
+import logging
+import maya.api.OpenMaya as om2
+from PySide2.QtCore import QObject, QTimer
+
+import Instrumentation
+
+# Widget refreshes are batched to at most one per UI frame
+REFRESH_INTERVAL_MS = 16
+
+
+class AttributeDispatcher(QObject):
+	"""Route attribute changes to bindings through one callback per node.
+
+	Each watched node gets a single MNodeMessage attribute-changed callback.
+	Changed plugs are looked up in a reverse index of node and attribute name
+	to bindings, and the affected bindings are handed to the refresh callable
+	in one debounced batch. Changes the echo filter recognises as the tool's
+	own writes are skipped. Each callback is timed as a python span of the
+	given Profiler.
+	"""
+	def __init__(self, plug_cache, refresh, echo_filter=None, interval=REFRESH_INTERVAL_MS, parent=None,
+				 profiler=None):
+		super(AttributeDispatcher, self).__init__(parent)
+		self.plug_cache 	= plug_cache
+		self.profiler 		= profiler or Instrumentation.Profiler(enabled=False)
+		self.refresh 		= refresh		# callable([SliderBinding])
+		self.echo_filter 	= echo_filter	# callable((control, attribute), value) -> True for own writes
+		self.callbacks 		= {}			# control -> callback id
+		self.index 			= {}			# control -> {long attribute name: [SliderBinding]}
+		self.dirty 			= {}			# binding index -> SliderBinding
+		self.dispatched 	= 0
+		self.refreshes 		= 0
+		self.suppressed 	= 0
+
+		self._timer = QTimer(self)
+		self._timer.setSingleShot(True)
+		self._timer.setInterval(interval)
+		self._timer.timeout.connect(self.flush)
+
+	@property
+	def callback_count(self):
+		"""Number of callbacks currently registered with Maya."""
+		return len(self.callbacks)
+
+	def watch(self, bindings):
+		"""Index bindings by plug and register one callback per node they live on."""
+		for binding in bindings:
+			plug = self.plug_cache.plug(binding.control, binding.attribute)
+			if plug is None:
+				continue
+			attributes = self.index.setdefault(binding.control, {})
+			attributes.setdefault(plug.partialName(useLongNames=True), []).append(binding)
+			if binding.control not in self.callbacks:
+				self.callbacks[binding.control] = om2.MNodeMessage.addAttributeChangedCallback(
+					plug.node(), self._on_attribute_changed, binding.control)
+
+	def teardown(self):
+		"""Remove every registered callback and forget all pending refreshes."""
+		self._timer.stop()
+		for control, callback_id in self.callbacks.items():
+			try:
+				om2.MMessage.removeCallback(callback_id)
+			except RuntimeError as e:
+				logging.warning(f"Failed to remove callback for {control}: {e}")
+		self.callbacks.clear()
+		self.index.clear()
+		self.dirty.clear()
+
+	def flush(self):
+		"""Hand every binding changed since the last flush to the refresh callable."""
+		self._timer.stop()
+		if not self.dirty:
+			return
+		dirty, self.dirty = list(self.dirty.values()), {}
+		self.refreshes += 1
+		self.refresh(dirty)
+
+	def _lookup(self, control, plug):
+		"""Return [(plug, bindings)] for a changed plug, or for its children if it is a compound."""
+		attributes = self.index.get(control)
+		if not attributes:
+			return []
+		bindings = attributes.get(plug.partialName(useLongNames=True))
+		if bindings:
+			return [(plug, bindings)]
+		changed = []
+		if plug.isCompound:
+			for i in range(plug.numChildren()):
+				child = plug.child(i)
+				bindings = attributes.get(child.partialName(useLongNames=True))
+				if bindings:
+					changed.append((child, bindings))
+		return changed
+
+	def _is_echo(self, plug, bindings):
+		if not self.echo_filter:
+			return False
+		key = bindings[0].plug
+		try:
+			value = self.plug_cache.to_ui(key, plug.asDouble())
+		except RuntimeError:
+			return False
+		if self.echo_filter(key, value):
+			self.suppressed += 1
+			return True
+		return False
+
+	def _on_attribute_changed(self, msg, plug, other_plug, control):
+		if not msg & om2.MNodeMessage.kAttributeSet:
+			return
+		with self.profiler.span(Instrumentation.PYTHON, 'callback dispatch', control):
+			self._dispatch(control, plug)
+
+	def _dispatch(self, control, plug):
+		changed = self._lookup(control, plug)
+		if not changed:
+			return
+		self.dispatched += 1
+		for changed_plug, bindings in changed:
+			if self._is_echo(changed_plug, bindings):
+				continue
+			for binding in bindings:
+				self.dirty[binding.index] = binding
+		if self.dirty and not self._timer.isActive():
+			self._timer.start()
@@ -0,0 +1,173 @@
+import logging
+import maya.cmds as cmds
+from PySide2.QtCore import QObject, QTimer
+
+import Instrumentation
+
+# One UI frame at ~60 Hz
+FRAME_INTERVAL_MS = 16
+
+# Largest difference between a written and a reported value still treated as our own echo
+ECHO_TOLERANCE = 1e-6
+
+class AttributeWriteQueue(QObject):
+	"""Coalesce attribute writes per plug and flush them once per UI frame.
+
+	Frame flushes go to the cached MPlugs of a PlugCache as one batched
+	MDGModifier covering every target namespace; immediate commits from line
+	edits and reset buttons go through cmds.setAttr so they stay in Maya's
+	undo queue.
+
+	Every value the queue writes is remembered as the expected origin of the
+	next change reported for that plug, so attribute-changed callbacks caused
+	by the tool itself can be told apart from outside edits.
+
+	With a Symmetry.SymmetryTable set, every pushed or committed value is
+	also written to the opposite-side plug in the same flush or undo chunk,
+	and both writes are expected as echoes.
+
+	With a KeyRecorder set, every value written by a flush or commit is
+	sampled just before it is written.
+
+	Each write is timed as a maya span of the given Profiler.
+	"""
+	def __init__(self, plug_cache, interval=FRAME_INTERVAL_MS, parent=None, profiler=None):
+		super(AttributeWriteQueue, self).__init__(parent)
+		self.plug_cache 	= plug_cache
+		self.profiler 		= profiler or Instrumentation.Profiler(enabled=False)
+		self.pending 		= {}		# (control, attribute) -> latest value
+		self.frames 		= 0
+		self.flushed_total 	= 0
+		self.dropped_total 	= 0
+		self.last_frame 	= {'flushed': 0, 'dropped': 0}
+		self.expected 		= {}		# (control, attribute) -> value written by the tool, not yet reported back
+		self.echoes 		= 0
+		self.symmetry 		= None		# Symmetry.SymmetryTable while mirroring is on
+		self.recorder 		= None		# KeyRecorder.KeyRecorder sampling every written value
+		self._dropped 		= 0
+
+		self._timer = QTimer(self)
+		self._timer.setSingleShot(True)
+		self._timer.setInterval(interval)
+		self._timer.timeout.connect(self.flush)
+
+	def push(self, control, attribute, value, mirror=True):
+		"""Queue a write, replacing any value still waiting for the same plug."""
+		key = (control, attribute)
+		if key in self.pending:
+			self._dropped += 1
+		self.pending[key] = value
+		if mirror and self.symmetry:
+			pair = self.symmetry.get(key)
+			if pair:
+				self.pending[pair[0]] = pair[1] * value
+		if not self._timer.isActive():
+			self._timer.start()
+
+	def linked(self, key):
+		"""Return the plugs a write to key changes: key and, while mirroring, its opposite side."""
+		return self.symmetry.linked(key) if self.symmetry else [key]
+
+	def mirrored(self, values):
+		"""Return values plus the opposite-side values written with them while mirroring."""
+		return self.symmetry.mirrored(values) if self.symmetry else dict(values)
+
+	def write_now(self, control, attribute, value):
+		"""Write a value immediately, superseding any queued value for the plug."""
+		if self.pending.pop((control, attribute), None) is not None:
+			self._dropped += 1
+		if not self.plug_cache.exists(control, attribute):
+			return False
+		# Callbacks fire inside setAttr, so the expectation must exist before the write
+		self.expected[(control, attribute)] = value
+		try:
+			with self.profiler.span(Instrumentation.MAYA, 'setAttr', (control, attribute)):
+				for path in self.plug_cache.paths(control, attribute):
+					cmds.setAttr(path, value)
+		except RuntimeError as e:
+			logging.warning(f"Failed to set {control}.{attribute}: {e}")
+			self.expected.pop((control, attribute), None)
+			return False
+		return True
+
+	def commit(self, values, chunk_name, restore=None, mirror=True):
+		"""Write many values immediately as one undoable step.
+
+		restore maps plugs to the values they had before any uncommitted API
+		writes, such as a preview drag, as one float or one per target
+		namespace (PlugCache.read_targets); they are put back silently first
+		so undoing the chunk returns to them.
+		"""
+		if mirror:
+			values = self.mirrored(values)
+		restore = {key: value for key, value in (restore or {}).items() if value is not None and key in values}
+		if restore:
+			for key, value in restore.items():
+				self.pending.pop(key, None)
+				self.expected[key] = value[0] if isinstance(value, (list, tuple)) else value
+			written = self.plug_cache.write_many(restore)
+			for key in restore:
+				if key not in written:
+					self.expected.pop(key, None)
+
+		if self.recorder:
+			self.recorder.sample(values)
+
+		written = 0
+		cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+		try:
+			for (control, attribute), value in values.items():
+				if self.write_now(control, attribute, value):
+					written += 1
+		finally:
+			cmds.undoInfo(closeChunk=True)
+		return written
+
+	def flush(self):
+		"""Write every pending value once and record the frame statistics."""
+		self._timer.stop()
+		if not self.pending:
+			return 0
+		pending, self.pending = self.pending, {}
+		flushed = self._write(pending)
+
+		self.frames 		+= 1
+		self.flushed_total 	+= flushed
+		self.dropped_total 	+= self._dropped
+		self.last_frame 	= {'flushed': flushed, 'dropped': self._dropped}
+		self._dropped 		= 0
+		logging.debug("Write queue frame %d: flushed %d, dropped %d",
+					  self.frames, flushed, self.last_frame['dropped'])
+		return flushed
+
+	def consume_echo(self, plug, value):
+		"""Return True if a reported change of plug is the echo of the tool's own write."""
+		expected = self.expected.pop(plug, None)
+		if expected is None or abs(expected - value) > ECHO_TOLERANCE:
+			return False
+		self.echoes += 1
+		return True
+
+	def stats(self):
+		"""Return the write counters collected so far."""
+		return {
+			'frames'			: self.frames,
+			'flushed'			: self.flushed_total,
+			'dropped'			: self.dropped_total,
+			'last_flushed'		: self.last_frame['flushed'],
+			'last_dropped'		: self.last_frame['dropped'],
+			'flushed_per_frame'	: self.flushed_total / float(self.frames) if self.frames else 0.0,
+			'echoes_suppressed'	: self.echoes,
+		}
+
+	def _write(self, values):
+		"""Set every attribute in every target through one batched modifier."""
+		if self.recorder:
+			self.recorder.sample(values)
+		self.expected.update(values)
+		with self.profiler.span(Instrumentation.MAYA, 'plug write'):
+			written = self.plug_cache.write_many(values)
+		for key in values:
+			if key not in written:
+				self.expected.pop(key, None)
+		return len(written)
@@ -0,0 +1,97 @@
+import json
+import logging
+
+
+class SliderBinding(object):
+	"""One slider row: its widgets, the plug it drives and how values map to slider steps."""
+	__slots__ = ('index', 'ui', 'slider', 'line_edit', 'reset', 'control', 'attribute',
+				 'default', 'minimum', 'maximum', 'scale')
+
+	def __init__(self, ui, slider, control, attribute, line_edit=None, reset=None,
+				 default=None, minimum=None, maximum=None, scale=10):
+		self.index 		= -1
+		self.ui 		= ui			# Window attribute holding the widgets, e.g. 'headUI'
+		self.slider 	= slider
+		self.line_edit 	= line_edit
+		self.reset 		= reset
+		self.control 	= control
+		self.attribute 	= attribute
+		self.default 	= default
+		self.minimum 	= minimum
+		self.maximum 	= maximum
+		self.scale 		= scale
+
+	@property
+	def plug(self):
+		return (self.control, self.attribute)
+
+	def to_slider(self, value):
+		"""Convert an attribute value to a slider step."""
+		return int(round(value * self.scale))
+
+	def from_slider(self, slider_value):
+		"""Convert a slider step to an attribute value."""
+		return slider_value / float(self.scale)
+
+	def __repr__(self):
+		return f"SliderBinding({self.slider} -> {self.control}.{self.attribute})"
+
+
+class BindingRegistry(object):
+	"""Every slider binding of the tool, indexed by slider, line edit, reset button and plug."""
+	def __init__(self, bindings=()):
+		self.bindings 		= []
+		self.by_slider 		= {}
+		self.by_line_edit 	= {}
+		self.by_reset 		= {}
+		self.by_plug 		= {}	# (control, attribute) -> [SliderBinding]
+		self.by_ui 			= {}	# ui name -> [SliderBinding]
+		for binding in bindings:
+			self.add(binding)
+
+	@classmethod
+	def load(cls, spec_file):
+		"""Build a registry from a JSON spec file."""
+		with open(spec_file, 'r') as f:
+			spec = json.load(f)
+		registry = cls()
+		for entry in spec.get('bindings', []):
+			try:
+				registry.add(SliderBinding(**entry))
+			except TypeError as e:
+				logging.warning(f"Skipping invalid binding {entry} in {spec_file}: {e}")
+		return registry
+
+	def add(self, binding):
+		"""Register a binding and index it."""
+		if binding.slider in self.by_slider:
+			raise ValueError(f"Slider '{binding.slider}' is already bound.")
+		binding.index = len(self.bindings)
+		self.bindings.append(binding)
+		self.by_slider[binding.slider] = binding
+		if binding.line_edit:
+			self.by_line_edit[binding.line_edit] = binding
+		if binding.reset:
+			self.by_reset[binding.reset] = binding
+		self.by_plug.setdefault(binding.plug, []).append(binding)
+		self.by_ui.setdefault(binding.ui, []).append(binding)
+		return binding
+
+	def __iter__(self):
+		return iter(self.bindings)
+
+	def __len__(self):
+		return len(self.bindings)
+
+	def in_ui(self, ui):
+		"""Return the bindings whose widgets live in the given UI."""
+		return self.by_ui.get(ui, [])
+
+	def plugs(self):
+		"""Return every bound (control, attribute) pair once, in binding order."""
+		return list(self.by_plug)
+
+	def controls(self, ui=None):
+		"""Return every bound control once, optionally limited to one UI."""
+		bindings = self.in_ui(ui) if ui else self.bindings
+		return list(dict.fromkeys(binding.control for binding in bindings))
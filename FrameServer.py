@@ -0,0 +1,292 @@
+import os
+import json
+import stat
+import time
+import socket
+import struct
+import logging
+import selectors
+import threading
+
+import numpy as np
+from PySide2.QtCore import QObject, QTimer
+
+# Wire format, little endian. On connect the server sends its schema once: a uint32 length and that many
+# bytes of JSON [{"id", "control", "attribute"}, ...]. The client then sends frames, each a header
+#   4s magic | uint32 sequence | float64 send time (time.time()) | uint16 count
+# followed by count entries of
+#   uint16 binding id | float32 value
+MAGIC 			= b'ACF1'
+HEADER 			= struct.Struct('<4sIdH')
+ENTRY_DTYPE 	= np.dtype([('id', '<u2'), ('value', '<f4')])
+SCHEMA_LENGTH 	= struct.Struct('<I')
+
+# Loopback only; set ATTR_CONTROLLER_FRAME_SOCKET to a path to listen on a Unix socket instead
+DEFAULT_HOST 	= '127.0.0.1'
+DEFAULT_PORT 	= int(os.environ.get('ATTR_CONTROLLER_FRAME_PORT', 7821))
+DEFAULT_SOCKET 	= os.environ.get('ATTR_CONTROLLER_FRAME_SOCKET')
+
+# Drain interval of the UI side, one frame at ~60 Hz
+DRAIN_INTERVAL_MS = 16
+
+# Largest frame accepted; anything bigger is treated as a corrupt stream
+MAX_ENTRIES = 4096
+
+# Seconds stop() waits for the worker before unblocking its sockets
+STOP_TIMEOUT = 1.0
+
+
+def encode_frame(sequence, ids, values, sent=None):
+	"""Return the bytes of one frame."""
+	entries = np.empty(len(ids), dtype=ENTRY_DTYPE)
+	entries['id'] 		= ids
+	entries['value'] 	= values
+	return HEADER.pack(MAGIC, sequence, time.time() if sent is None else sent, len(entries)) + entries.tobytes()
+
+
+def encode_schema(schema):
+	"""Return the bytes of the schema message."""
+	payload = json.dumps(schema).encode()
+	return SCHEMA_LENGTH.pack(len(payload)) + payload
+
+
+def remove_socket(path):
+	"""Delete a Unix socket file left at path; anything else there is left alone."""
+	try:
+		if stat.S_ISSOCK(os.stat(path).st_mode):
+			os.remove(path)
+	except FileNotFoundError:
+		pass
+
+
+class FrameReceiver(object):
+	"""Accept connections and decode frames on a worker thread; no Qt and no Maya involved.
+
+	Decoded values go into a mailbox holding the newest value per binding;
+	take() hands it to the consumer. Values replaced before they were taken,
+	and frames older than the newest one seen on the same connection, are
+	dropped and counted, as are NaN and infinite values.
+	"""
+	def __init__(self, schema=(), host=DEFAULT_HOST, port=DEFAULT_PORT, path=DEFAULT_SOCKET):
+		self.schema 		= list(schema)
+		self.host 			= host
+		self.port 			= port
+		self.path 			= path
+		self.address 		= None
+		self.received 		= 0		# frames decoded
+		self.stale 			= 0		# frames older than one already seen on the same connection
+		self.superseded 	= 0		# values replaced in the mailbox before they were taken
+		self.rejected 		= 0		# connections closed for a corrupt stream
+		self.invalid 		= 0		# NaN or infinite values dropped
+		self.decode_time 	= 0.0	# seconds spent decoding
+		self._mailbox 		= {}	# binding id -> value
+		self._newest_sent 	= None
+		self._lock 			= threading.Lock()
+		self._stop 			= threading.Event()
+		self._thread 		= None
+		self._listener 		= None
+		self._connections 	= {}	# connection -> [bytearray, last sequence], owned by the worker
+
+	@property
+	def running(self):
+		return self._thread is not None and self._thread.is_alive()
+
+	def start(self):
+		"""Listen and start the worker thread. Returns the bound address."""
+		if self.running:
+			return self.address
+		if self.path:
+			remove_socket(self.path)
+			listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		else:
+			listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		try:
+			if self.path:
+				listener.bind(self.path)
+				address = self.path
+			else:
+				listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+				listener.bind((self.host, self.port))
+				address = listener.getsockname()
+			listener.listen()
+			listener.setblocking(False)
+		except OSError:
+			# e.g. the port is in use: nothing is left open or half-stored
+			listener.close()
+			raise
+		self.address 	= address
+		self._listener 	= listener
+		self._stop.clear()
+		self._thread = threading.Thread(target=self._serve, name="FrameReceiver", daemon=True)
+		self._thread.start()
+		return self.address
+
+	def stop(self):
+		"""Stop the worker thread; it closes every socket on its way out."""
+		self._stop.set()
+		if self._thread:
+			self._thread.join(timeout=STOP_TIMEOUT)
+			if self._thread.is_alive():
+				# Blocked sending the schema to a client that does not read: unblock it and wait
+				logging.warning("Frame server: worker did not stop in time; shutting its connections down.")
+				for connection in list(self._connections):
+					try:
+						connection.shutdown(socket.SHUT_RDWR)
+					except OSError:
+						pass
+				self._thread.join()
+		self._thread = None
+		if self.path:
+			remove_socket(self.path)
+
+	def take(self):
+		"""Return ({binding id: value}, newest send time) received since the last call."""
+		with self._lock:
+			values, self._mailbox = self._mailbox, {}
+			sent, self._newest_sent = self._newest_sent, None
+		return values, sent
+
+	# -------------------------------------------------------------------------------------------------------
+	def _serve(self):
+		selector = selectors.DefaultSelector()
+		selector.register(self._listener, selectors.EVENT_READ, None)
+		buffers = self._connections = {}
+		try:
+			while not self._stop.is_set():
+				for key, events in selector.select(timeout=0.1):
+					if key.data is None:
+						self._accept(selector, buffers)
+						continue
+					connection = key.fileobj
+					try:
+						chunk = connection.recv(1 << 16)
+					except OSError:
+						chunk = b''
+					if not chunk or not self._feed(buffers[connection], chunk):
+						selector.unregister(connection)
+						connection.close()
+						del buffers[connection]
+		finally:
+			for connection in buffers:
+				connection.close()
+			buffers.clear()
+			selector.close()
+			self._listener.close()
+
+	def _accept(self, selector, buffers):
+		try:
+			connection, _ = self._listener.accept()
+		except OSError:
+			return
+		connection.setblocking(True)
+		# Registered first so stop() can shut it down if the send blocks
+		buffers[connection] = None
+		try:
+			connection.sendall(encode_schema(self.schema))
+		except OSError:
+			del buffers[connection]
+			connection.close()
+			return
+		connection.setblocking(False)
+		selector.register(connection, selectors.EVENT_READ, True)
+		buffers[connection] = [bytearray(), -1]
+
+	def _feed(self, state, chunk):
+		"""Decode every complete frame in the connection buffer. Returns False on a corrupt stream."""
+		buffer = state[0]
+		buffer.extend(chunk)
+		start = time.perf_counter()
+		offset = 0
+		frames = []
+		while len(buffer) - offset >= HEADER.size:
+			magic, sequence, sent, count = HEADER.unpack_from(buffer, offset)
+			if magic != MAGIC or count > MAX_ENTRIES:
+				self.rejected += 1
+				logging.warning("Frame server: closing a connection that sent a corrupt frame.")
+				return False
+			end = offset + HEADER.size + count * ENTRY_DTYPE.itemsize
+			if len(buffer) < end:
+				break
+			self.received += 1
+			if sequence <= state[1]:
+				self.stale += 1
+			else:
+				state[1] = sequence
+				entries = np.frombuffer(buffer, dtype=ENTRY_DTYPE, count=count, offset=offset + HEADER.size).copy()
+				finite 	= np.isfinite(entries['value'])
+				if not finite.all():
+					self.invalid 	+= count - int(finite.sum())
+					entries 		= entries[finite]
+				frames.append((entries, sent))
+			offset = end
+		del buffer[:offset]
+
+		# Oldest first so the newest value of each binding wins
+		if frames:
+			with self._lock:
+				for entries, sent in frames:
+					for binding_id, value in zip(entries['id'].tolist(), entries['value'].tolist()):
+						if binding_id in self._mailbox:
+							self.superseded += 1
+						self._mailbox[binding_id] = value
+					self._newest_sent = sent
+		self.decode_time += time.perf_counter() - start
+		return True
+
+
+class FrameServer(QObject):
+	"""Drain a FrameReceiver on the UI thread once per frame into a callable.
+
+	apply receives {binding id: value} with only the newest value of each
+	binding; everything older was dropped off the UI thread.
+	"""
+	def __init__(self, apply, schema=(), interval=DRAIN_INTERVAL_MS, parent=None, **address):
+		super(FrameServer, self).__init__(parent)
+		self.apply 		= apply
+		self.receiver 	= FrameReceiver(schema, **address)
+		self.applied 	= 0
+		self.latency 	= 0.0		# seconds from send to apply of the last drained frame
+
+		self._timer = QTimer(self)
+		self._timer.setInterval(interval)
+		self._timer.timeout.connect(self.drain)
+
+	@property
+	def running(self):
+		return self.receiver.running
+
+	def start(self, schema=None):
+		"""Listen, sending schema (default: the one given before) to every client that connects."""
+		if schema is not None:
+			self.receiver.schema = list(schema)
+		address = self.receiver.start()
+		self._timer.start()
+		return address
+
+	def stop(self):
+		"""Stop listening and apply whatever was received last."""
+		self._timer.stop()
+		self.receiver.stop()
+		self.drain()
+
+	def drain(self):
+		values, sent = self.receiver.take()
+		if not values:
+			return
+		self.apply(values)
+		self.applied += 1
+		self.latency = time.time() - sent
+
+	def stats(self):
+		"""Return the receive counters collected so far."""
+		receiver = self.receiver
+		return {
+			'received'		: receiver.received,
+			'applied'		: self.applied,
+			'stale'			: receiver.stale,
+			'superseded'	: receiver.superseded,
+			'rejected'		: receiver.rejected,
+			'invalid'		: receiver.invalid,
+			'decode_ms'		: receiver.decode_time * 1000.0,
+			'latency_ms'	: self.latency * 1000.0,
+		}
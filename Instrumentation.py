@@ -0,0 +1,267 @@
+import os
+import csv
+import json
+import time
+import logging
+import collections
+from contextlib import contextmanager
+from PySide2.QtCore import Qt, QObject, QEvent, QTimer
+from PySide2.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+							   QPushButton, QCheckBox, QLabel, QFileDialog, QHeaderView, QAbstractItemView)
+
+# Where the time of an interaction goes
+MAYA 	= 'maya'	# setAttr and MPlug reads/writes, including the evaluation Maya runs inside them
+PYTHON 	= 'python'	# the tool's own handlers: slider ticks, line edits, callback dispatch
+QT 		= 'qt'		# widget refreshes and repaints
+
+CATEGORIES = (MAYA, PYTHON, QT)
+
+# Spans kept for export; older ones are dropped, totals keep counting
+MAX_EVENTS = 50000
+
+# Panel refresh while visible
+PANEL_INTERVAL_MS = 500
+
+# Set ATTR_CONTROLLER_PROFILE=1 to record spans from startup; otherwise recording is started from the panel
+PROFILE = os.environ.get("ATTR_CONTROLLER_PROFILE", "0").lower() in ("1", "true", "yes")
+
+
+def key_name(key):
+	"""Return a readable name for a span key: a (control, attribute) plug or a plain string."""
+	if key is None:
+		return ''
+	if isinstance(key, tuple):
+		return '.'.join(key)
+	return str(key)
+
+
+class Profiler(object):
+	"""Timed spans and per-binding call counts of the tool's hot paths.
+
+	Spans are grouped by category (maya, python, qt) and name. Totals are
+	kept for every span recorded; the individual spans go to a bounded
+	buffer for Chrome-trace and CSV export. Recording is off until enabled,
+	so the hot paths pay nothing for it in production.
+	"""
+	def __init__(self, enabled=False, max_events=MAX_EVENTS):
+		self.enabled 	= enabled
+		self.events 	= collections.deque(maxlen=max_events)	# (category, name, start s, duration s, key)
+		self.totals 	= {}									# (category, name) -> [calls, total s, max s]
+		self.counts 	= collections.Counter()					# (name, key) -> calls
+		self.origin 	= time.perf_counter()
+
+	@contextmanager
+	def span(self, category, name, key=None):
+		"""Time the enclosed block."""
+		if not self.enabled:
+			yield
+			return
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.record(category, name, start, time.perf_counter(), key)
+
+	def mark(self, category, name, key=None):
+		"""Count an instant event such as a slider press."""
+		if self.enabled:
+			now = time.perf_counter()
+			self.record(category, name, now, now, key)
+
+	def record(self, category, name, start, end, key=None):
+		"""Add one span measured by the caller."""
+		duration = end - start
+		self.events.append((category, name, start, duration, key))
+		total = self.totals.get((category, name))
+		if total is None:
+			self.totals[(category, name)] = [1, duration, duration]
+		else:
+			total[0] += 1
+			total[1] += duration
+			if duration > total[2]:
+				total[2] = duration
+		if key is not None:
+			self.counts[(name, key)] += 1
+
+	def reset(self):
+		"""Forget every span and count."""
+		self.events.clear()
+		self.totals.clear()
+		self.counts.clear()
+		self.origin = time.perf_counter()
+
+	def rows(self):
+		"""Return [(category, name, calls, total ms, mean ms, max ms)], most expensive first."""
+		rows = []
+		for (category, name), (calls, total, longest) in self.totals.items():
+			rows.append((category, name, calls, total * 1000.0, total * 1000.0 / calls, longest * 1000.0))
+		rows.sort(key=lambda row: row[3], reverse=True)
+		return rows
+
+	def category_totals(self):
+		"""Return {category: total ms}."""
+		totals = dict.fromkeys(CATEGORIES, 0.0)
+		for (category, name), (calls, total, longest) in self.totals.items():
+			totals[category] = totals.get(category, 0.0) + total * 1000.0
+		return totals
+
+	def binding_rows(self):
+		"""Return [(plug or widget name, span name, calls)], most called first."""
+		return [(key_name(key), name, calls) for (name, key), calls in self.counts.most_common()]
+
+	def export_chrome_trace(self, path):
+		"""Write the buffered spans as Chrome trace JSON (chrome://tracing, Perfetto)."""
+		pid 	= os.getpid()
+		tids 	= {category: i + 1 for i, category in enumerate(CATEGORIES)}
+		events 	= [{'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': category}}
+				   for category, tid in tids.items()]
+		for category, name, start, duration, key in self.events:
+			event = {
+				'name'	: name,
+				'cat'	: category,
+				'ph'	: 'X' if duration else 'i',
+				'ts'	: (start - self.origin) * 1e6,
+				'pid'	: pid,
+				'tid'	: tids.get(category, 0),
+			}
+			if duration:
+				event['dur'] = duration * 1e6
+			else:
+				event['s'] = 't'
+			if key is not None:
+				event['args'] = {'key': key_name(key)}
+			events.append(event)
+		with open(path, 'w') as f:
+			json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+		return len(events)
+
+	def export_csv(self, path):
+		"""Write the buffered spans as CSV, one row per span."""
+		with open(path, 'w', newline='') as f:
+			writer = csv.writer(f)
+			writer.writerow(['category', 'name', 'key', 'start_ms', 'duration_ms'])
+			for category, name, start, duration, key in self.events:
+				writer.writerow([category, name, key_name(key),
+								 f"{(start - self.origin) * 1000.0:.3f}", f"{duration * 1000.0:.4f}"])
+		return len(self.events)
+
+
+class PaintTimer(QObject):
+	"""Event filter that times the paint events of the widgets it is installed on."""
+	def __init__(self, profiler, parent=None):
+		super(PaintTimer, self).__init__(parent)
+		self.profiler 	= profiler
+		self._painting 	= False
+
+	def eventFilter(self, watched, event):
+		if event.type() != QEvent.Paint or not self.profiler.enabled or self._painting:
+			return False
+		# Deliver the paint event ourselves so its duration can be measured
+		self._painting = True
+		start = time.perf_counter()
+		try:
+			watched.event(event)
+		finally:
+			self._painting = False
+			self.profiler.record(QT, 'repaint', start, time.perf_counter(), watched.objectName())
+		return True
+
+
+class InstrumentPanel(QDockWidget):
+	"""Dockable view of a Profiler with reset and export buttons."""
+	def __init__(self, profiler, parent=None):
+		super(InstrumentPanel, self).__init__("Instrumentation", parent)
+		self.setObjectName("InstrumentPanel")
+		self.profiler = profiler
+
+		content = QWidget(self)
+		layout 	= QVBoxLayout(content)
+
+		buttons = QHBoxLayout()
+		self.record_box = QCheckBox("Record", content)
+		self.record_box.setChecked(profiler.enabled)
+		self.record_box.toggled.connect(self.set_recording)
+		buttons.addWidget(self.record_box)
+		buttons.addStretch()
+		for label, slot in (("Reset", self.reset), ("Export Trace...", self.export_trace),
+							("Export CSV...", self.export_csv)):
+			button = QPushButton(label, content)
+			button.clicked.connect(slot)
+			buttons.addWidget(button)
+		layout.addLayout(buttons)
+
+		self.summary = QLabel(content)
+		layout.addWidget(self.summary)
+		self.totals_table 	= self._table(content, ["Category", "Span", "Calls", "Total ms", "Mean ms", "Max ms"])
+		self.binding_table 	= self._table(content, ["Plug / Widget", "Span", "Calls"])
+		layout.addWidget(self.totals_table, 2)
+		layout.addWidget(self.binding_table, 1)
+		self.setWidget(content)
+
+		self._timer = QTimer(self)
+		self._timer.setInterval(PANEL_INTERVAL_MS)
+		self._timer.timeout.connect(self.refresh)
+
+	@staticmethod
+	def _table(parent, headers):
+		table = QTableWidget(0, len(headers), parent)
+		table.setHorizontalHeaderLabels(headers)
+		table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+		table.verticalHeader().setVisible(False)
+		table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+		table.horizontalHeader().setStretchLastSection(True)
+		return table
+
+	@staticmethod
+	def _fill(table, rows):
+		table.setRowCount(len(rows))
+		for r, row in enumerate(rows):
+			for c, value in enumerate(row):
+				text = f"{value:.3f}" if isinstance(value, float) else str(value)
+				item = QTableWidgetItem(text)
+				if not isinstance(value, str):
+					item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+				table.setItem(r, c, item)
+
+	def refresh(self):
+		"""Show the current totals."""
+		totals = self.profiler.category_totals()
+		self.summary.setText("   ".join(f"{category}: {totals[category]:.1f} ms" for category in CATEGORIES))
+		self._fill(self.totals_table, self.profiler.rows())
+		self._fill(self.binding_table, self.profiler.binding_rows())
+
+	def set_recording(self, enabled):
+		self.profiler.enabled = enabled
+
+	def reset(self):
+		self.profiler.reset()
+		self.refresh()
+
+	def export_trace(self):
+		"""Save the buffered spans as a Chrome trace."""
+		path, _ = QFileDialog.getSaveFileName(self, "Export Chrome Trace", "trace.json", "Chrome Trace (*.json)")
+		if path:
+			self._export(self.profiler.export_chrome_trace, path)
+
+	def export_csv(self):
+		"""Save the buffered spans as CSV."""
+		path, _ = QFileDialog.getSaveFileName(self, "Export CSV", "trace.csv", "CSV (*.csv)")
+		if path:
+			self._export(self.profiler.export_csv, path)
+
+	def _export(self, export, path):
+		try:
+			count = export(path)
+		except OSError as e:
+			logging.warning(f"Failed to write {path}: {e}")
+			return
+		logging.info(f"Wrote {count} trace events to {path}")
+
+	def showEvent(self, event):
+		self.refresh()
+		self._timer.start()
+		super(InstrumentPanel, self).showEvent(event)
+
+	def hideEvent(self, event):
+		self._timer.stop()
+		super(InstrumentPanel, self).hideEvent(event)
@@ -0,0 +1,166 @@
+import time
+import logging
+from array import array
+import numpy as np
+import maya.cmds as cmds
+
+# Frames per second of Maya's named time units
+TIME_UNIT_FPS = {'game': 15, 'film': 24, 'pal': 25, 'ntsc': 30, 'show': 48, 'palf': 50, 'ntscf': 60}
+
+# Largest value error a dropped sample may leave behind
+DEFAULT_TOLERANCE = 0.01
+
+# Anim curve node per attribute type; anything else is keyed unitless
+CURVE_TYPES = {'doubleLinear': 'animCurveTL', 'doubleAngle': 'animCurveTA'}
+
+
+def scene_fps():
+	"""Return the frames per second of the scene time unit."""
+	unit = cmds.currentUnit(query=True, time=True)
+	if unit in TIME_UNIT_FPS:
+		return float(TIME_UNIT_FPS[unit])
+	try:
+		return float(unit[:-3] if unit.endswith('fps') else unit)
+	except ValueError:
+		logging.warning(f"Unknown time unit '{unit}', recording at 24 fps.")
+		return 24.0
+
+
+def simplify(times, values, tolerance=DEFAULT_TOLERANCE):
+	"""Return the indices of the samples to keep (Ramer-Douglas-Peucker on the value axis).
+
+	Linear interpolation between the kept samples stays within tolerance of
+	every dropped one. times must be strictly increasing.
+	"""
+	count = len(times)
+	if count <= 2:
+		return np.arange(count)
+	keep = np.zeros(count, dtype=bool)
+	keep[0] = keep[-1] = True
+	stack = [(0, count - 1)]
+	while stack:
+		first, last = stack.pop()
+		if last - first < 2:
+			continue
+		inner 	= slice(first + 1, last)
+		line 	= values[first] + (values[last] - values[first]) * (times[inner] - times[first]) / (times[last] - times[first])
+		error 	= np.abs(values[inner] - line)
+		worst 	= int(np.argmax(error))
+		if error[worst] > tolerance:
+			split = first + 1 + worst
+			keep[split] = True
+			stack.append((first, split))
+			stack.append((split, last))
+	return np.flatnonzero(keep)
+
+
+class KeyRecorder(object):
+	"""Capture the values the tool writes while recording and key them in bulk when it stops.
+
+	Samples are appended to flat array('d') buffers per plug with their time
+	since the start of the recording; nothing touches Maya until stop. The
+	first sample of a plug is preceded by the value it had, held from the
+	start of the recording until one frame before it changed.
+	"""
+	def __init__(self, read, tolerance=DEFAULT_TOLERANCE):
+		self.read 			= read			# callable(control, attribute) -> value before it is written
+		self.tolerance 		= tolerance
+		self.recording 		= False
+		self.start_frame 	= 1.0
+		self.fps 			= 24.0
+		self.samples 		= 0
+		self.buffers 		= {}			# (control, attribute) -> (array of seconds, array of values)
+		self._start 		= 0.0
+
+	def start(self, start_frame=None, fps=None):
+		"""Start recording at the current frame (or start_frame) in scene time."""
+		self.buffers 		= {}
+		self.samples 		= 0
+		self.fps 			= fps or scene_fps()
+		self.start_frame 	= cmds.currentTime(query=True) if start_frame is None else start_frame
+		self._start 		= time.perf_counter()
+		self.recording 		= True
+
+	def cancel(self):
+		"""Stop recording and drop every sample."""
+		self.recording 	= False
+		self.buffers 	= {}
+
+	def sample(self, values):
+		"""Record {plug: value} about to be written now."""
+		if not self.recording:
+			return
+		now = time.perf_counter() - self._start
+		for plug, value in values.items():
+			if isinstance(value, (list, tuple)):
+				value = value[0]
+			if value is None:
+				continue
+			buffer = self.buffers.get(plug)
+			if buffer is None:
+				buffer = self.buffers[plug] = (array('d'), array('d'))
+				held = self.read(*plug)
+				if held is not None:
+					buffer[0].extend((0.0, max(0.0, now - 1.0 / self.fps)))
+					buffer[1].extend((held, held))
+			buffer[0].append(now)
+			buffer[1].append(value)
+			self.samples += 1
+
+	def stop(self):
+		"""Stop recording; return {plug: (frames, values)} reduced to the keys worth setting."""
+		if not self.recording:
+			return {}
+		self.recording = False
+		curves = {}
+		for plug, (seconds, values) in self.buffers.items():
+			sampled = self.start_frame + np.frombuffer(seconds) * self.fps
+			# Resampled onto whole frames; the last value holds until the frame after it was written
+			frames 	= np.arange(np.floor(sampled[0]), np.ceil(sampled[-1]) + 1.0)
+			values 	= np.interp(frames, sampled, np.frombuffer(values))
+			keep 	= simplify(frames, values, self.tolerance)
+			curves[plug] = (frames[keep], values[keep])
+		self.buffers = {}
+		return curves
+
+	# =======================================================================================================
+	# Keying
+	# =======================================================================================================
+	def commit(self, curves, paths, chunk_name="Record Keys"):
+		"""Key every recorded plug in every target path as one undoable step.
+
+		paths(control, attribute) returns the 'node.attribute' of each target.
+		A new anim curve gets all its keys in a single ktv setAttr; on an
+		existing one the recorded range is cut and keyed again, so keys
+		outside it keep their tangents.
+		"""
+		keyed = 0
+		cmds.undoInfo(openChunk=True, chunkName=chunk_name)
+		try:
+			for (control, attribute), (frames, values) in curves.items():
+				for path in paths(control, attribute):
+					try:
+						self._key(path, frames, values)
+						keyed += 1
+					except (RuntimeError, ValueError) as e:
+						logging.warning(f"Failed to key {path}: {e}")
+		finally:
+			cmds.undoInfo(closeChunk=True)
+		return keyed
+
+	@staticmethod
+	def _key(path, frames, values):
+		"""Set frames/values on the anim curve of path, replacing its keys inside the recorded range."""
+		curve_type = CURVE_TYPES.get(cmds.getAttr(path, type=True), 'animCurveTU')
+		curve = (cmds.listConnections(path, source=True, destination=False, type='animCurve') or [None])[0]
+		if curve is None:
+			curve = cmds.createNode(curve_type, name=path.replace(':', '_').replace('.', '_'))
+			cmds.connectAttr(f"{curve}.output", path)
+			count = len(frames)
+			cmds.setAttr(f"{curve}.ktv[0:{count - 1}]", *np.column_stack([frames, values]).ravel().tolist(), size=count)
+			return
+
+		# Rewriting ktv would shift kept keys onto the tangents and flags of other indices
+		cmds.cutKey(curve, time=(float(frames[0]), float(frames[-1])), clear=True)
+		for frame, value in zip(frames.tolist(), values.tolist()):
+			cmds.setKeyframe(curve, time=frame, value=value)
@@ -0,0 +1,58 @@
+import time
+import logging
+from PySide2.QtWidgets import QLabel
+from PySide2.QtCore import Qt
+
+import Collapsible
+
+
+class LazyCollapsibleTab(Collapsible.CollapsibleTab):
+	"""Collapsible tab that builds its content the first time it is expanded.
+
+	Until then the tab only holds a placeholder label. The loader is a callable
+	returning the content widget; it is called once, before the tab opens.
+	"""
+	def __init__(self, title, loader, parent=None):
+		super(LazyCollapsibleTab, self).__init__(title, parent)
+		self.title 			= title
+		self.loader 		= loader
+		self.content 		= None
+		self.load_time 		= None		# Milliseconds spent in the loader
+
+		self.placeholder = QLabel("Loading...", self.content_area)
+		self.placeholder.setAlignment(Qt.AlignCenter)
+		self.content_layout.addWidget(self.placeholder)
+
+		# toggled fires before clicked, so the content exists before the area is shown
+		self.toggle_button.toggled.connect(self._on_toggled)
+		self.collapse()
+
+	@property
+	def loaded(self):
+		return self.content is not None
+
+	def ensure_loaded(self):
+		"""Build the content if it has not been built yet and return it."""
+		if self.content is not None:
+			return self.content
+
+		start = time.perf_counter()
+		content = self.loader()
+		self.load_time = (time.perf_counter() - start) * 1000.0
+		logging.info(f"Loaded {self.title} in {self.load_time:.1f} ms")
+
+		self.content_layout.removeWidget(self.placeholder)
+		self.placeholder.deleteLater()
+		self.placeholder = None
+		self.content_layout.addWidget(content)
+		self.content = content
+		return content
+
+	def expand(self):
+		"""Load the content if needed, then expand."""
+		self.ensure_loaded()
+		super(LazyCollapsibleTab, self).expand()
+
+	def _on_toggled(self, checked):
+		if checked:
+			self.ensure_loaded()
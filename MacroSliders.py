@@ -0,0 +1,152 @@
+import json
+import logging
+import numpy as np
+
+# Range of a macro slider and slider steps per unit when the spec does not give them
+MACRO_RANGE = (-1.0, 1.0)
+MACRO_SCALE = 100
+
+
+class MacroSlider(object):
+	"""One macro: a UI value mixed into many plugs through a column of the weight matrix."""
+	__slots__ = ('index', 'name', 'default', 'minimum', 'maximum', 'scale')
+
+	def __init__(self, name, default=0.0, minimum=MACRO_RANGE[0], maximum=MACRO_RANGE[1], scale=MACRO_SCALE):
+		self.index 		= -1
+		self.name 		= name
+		self.default 	= default
+		self.minimum 	= minimum
+		self.maximum 	= maximum
+		self.scale 		= scale
+
+	def to_slider(self, value):
+		"""Convert a macro value to a slider step."""
+		return int(round(value * self.scale))
+
+	def from_slider(self, slider_value):
+		"""Convert a slider step to a macro value."""
+		return slider_value / float(self.scale)
+
+	def __repr__(self):
+		return f"MacroSlider({self.name})"
+
+
+class MacroMixer(object):
+	"""Mix macro values into plug offsets: offsets = curves(weights @ values).
+
+	Rows of the weight matrix are output plugs, columns are macros. An output
+	may carry a curve, piecewise-linear (x, y) keys through which its mixed
+	value is remapped. A drag writes each driven plug as the value it had
+	when the drag began plus the change of its offset, so macros layer on top
+	of hand-set values instead of replacing them.
+	"""
+	def __init__(self):
+		self.macros 	= []
+		self.by_name 	= {}
+		self.outputs 	= []			# row -> (control, attribute)
+		self.rows 		= {}			# (control, attribute) -> row
+		self.weights 	= np.zeros((0, 0))
+		self.values 	= np.zeros(0)	# current value of every macro
+		self.curves 	= {}			# row -> (xs, ys)
+		self.dragging 	= None			# MacroSlider being dragged
+		self._drag 		= None			# (rows, base values, offsets, macro value) at the start of a drag
+
+	@classmethod
+	def load(cls, spec_file):
+		"""Build a mixer from the 'macros' section of a JSON spec file."""
+		with open(spec_file, 'r') as f:
+			spec = json.load(f)
+		mixer = cls()
+		for entry in spec.get('macros', []):
+			entry = dict(entry)
+			outputs = entry.pop('outputs', [])
+			try:
+				mixer.add(MacroSlider(**entry), outputs)
+			except (TypeError, KeyError, ValueError) as e:
+				logging.warning(f"Skipping invalid macro {entry} in {spec_file}: {e}")
+		return mixer
+
+	def add(self, macro, outputs):
+		"""Register a macro driving outputs [{control, attribute, weight, curve}] and grow the matrix."""
+		if macro.name in self.by_name:
+			raise ValueError(f"Macro '{macro.name}' already exists.")
+		entries = []
+		for output in outputs:
+			curve = output.get('curve')
+			if curve is not None:
+				curve = np.array(curve, dtype=float)
+				if curve.ndim != 2 or curve.shape[1] != 2 or np.any(np.diff(curve[:, 0]) <= 0):
+					raise ValueError(f"Curve of {output['control']}.{output['attribute']} needs increasing (x, y) keys.")
+			entries.append(((output['control'], output['attribute']), float(output.get('weight', 1.0)), curve))
+
+		macro.index = len(self.macros)
+		self.macros.append(macro)
+		self.by_name[macro.name] = macro
+		for plug, _, _ in entries:
+			if plug not in self.rows:
+				self.rows[plug] = len(self.outputs)
+				self.outputs.append(plug)
+		weights = np.zeros((len(self.outputs), len(self.macros)))
+		weights[:self.weights.shape[0], :self.weights.shape[1]] = self.weights
+		for plug, weight, curve in entries:
+			row = self.rows[plug]
+			weights[row, macro.index] = weight
+			if curve is not None:
+				self.curves[row] = (curve[:, 0], curve[:, 1])
+		self.weights 	= weights
+		self.values 	= np.append(self.values, float(macro.default or 0.0))
+		return macro
+
+	def __iter__(self):
+		return iter(self.macros)
+
+	def __len__(self):
+		return len(self.macros)
+
+	def driven(self, macro):
+		"""Return the plugs a macro drives."""
+		return [self.outputs[row] for row in np.flatnonzero(self.weights[:, macro.index])]
+
+	def rebase(self):
+		"""Put every macro back at its default without writing, e.g. after undo changed the plugs under it.
+
+		A drag in progress is cancelled; later moves of it are ignored.
+		"""
+		self.end()
+		self.values = np.array([float(macro.default or 0.0) for macro in self.macros])
+
+	def offsets(self):
+		"""Return the offset of every output plug for the current macro values."""
+		offsets = self.weights @ self.values
+		for row, (xs, ys) in self.curves.items():
+			offsets[row] = np.interp(offsets[row], xs, ys)
+		return offsets
+
+	# =======================================================================================================
+	# Drag: begin once, then every move is one matrix-vector product
+	# =======================================================================================================
+	def begin(self, macro, base):
+		"""Start moving a macro from the plug values base, given in driven() order."""
+		rows = np.flatnonzero(self.weights[:, macro.index])
+		base = np.array([np.nan if value is None else value for value in base], dtype=float)
+		self._drag 		= (rows, base, self.offsets()[rows], self.values[macro.index])
+		self.dragging 	= macro
+
+	def move(self, macro, value):
+		"""Set a macro value and return {plug: value} of the plugs it drives, {} outside begin()/end()."""
+		if self._drag is None:
+			logging.warning(f"Macro {macro.name} moved without an active drag; ignored.")
+			return {}
+		self.values[macro.index] = value
+		rows, base, start, _ = self._drag
+		result = base + self.offsets()[rows] - start
+		return {self.outputs[row]: float(value) for row, value in zip(rows, result) if not np.isnan(value)}
+
+	def moved(self, value):
+		"""True if value differs from the macro value the drag began at."""
+		return self._drag is not None and abs(value - self._drag[3]) > 1e-9
+
+	def end(self):
+		"""Finish the drag, if any."""
+		self._drag 		= None
+		self.dragging 	= None
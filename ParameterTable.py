@@ -0,0 +1,238 @@
+from PySide2.QtCore import Qt, QAbstractTableModel, QModelIndex, Signal
+from PySide2.QtWidgets import (QTableView, QStyledItemDelegate, QSlider, QStyle, QStyleOptionSlider, QApplication,
+							   QAbstractItemView, QHeaderView)
+
+# Columns
+CONTROL 	= 0
+ATTRIBUTE 	= 1
+VALUE 		= 2
+SLIDER 		= 3
+
+HEADERS = ("Control", "Attribute", "Value", "")
+
+# Slider range used for bindings without a minimum or maximum
+DEFAULT_RANGE = (-10.0, 10.0)
+
+
+def slider_range(binding):
+	"""Return the (minimum, maximum) slider steps of a binding."""
+	minimum = DEFAULT_RANGE[0] if binding.minimum is None else binding.minimum
+	maximum = DEFAULT_RANGE[1] if binding.maximum is None else binding.maximum
+	return binding.to_slider(minimum), binding.to_slider(maximum)
+
+
+class ParameterModel(QAbstractTableModel):
+	"""One row per slider binding: control, attribute, value and a slider column.
+
+	Values are read through the given callable the first time a row is shown
+	and cached until set_values() or invalidate() is called, so building the
+	model costs nothing per row. Edits of the value column are not written
+	here; they are emitted as edited(binding, value) for the window to commit.
+	"""
+	edited = Signal(object, float)
+
+	def __init__(self, bindings, read, parent=None):
+		super(ParameterModel, self).__init__(parent)
+		self.bindings 	= list(bindings)
+		self.read 		= read			# callable(control, attribute) -> float or None
+		self.values 	= {}			# binding index -> cached value
+		self.rows 		= {binding.index: row for row, binding in enumerate(self.bindings)}
+
+	def rowCount(self, parent=QModelIndex()):
+		return 0 if parent.isValid() else len(self.bindings)
+
+	def columnCount(self, parent=QModelIndex()):
+		return 0 if parent.isValid() else len(HEADERS)
+
+	def headerData(self, section, orientation, role=Qt.DisplayRole):
+		if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+			return HEADERS[section]
+		return None
+
+	def flags(self, index):
+		flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+		if index.column() in (VALUE, SLIDER):
+			flags |= Qt.ItemIsEditable
+		return flags
+
+	def binding(self, index):
+		return self.bindings[index.row()]
+
+	def value(self, binding):
+		"""Return the cached value of a binding, reading it on first use."""
+		if binding.index not in self.values:
+			self.values[binding.index] = self.read(binding.control, binding.attribute)
+		return self.values[binding.index]
+
+	def data(self, index, role=Qt.DisplayRole):
+		if not index.isValid():
+			return None
+		binding = self.bindings[index.row()]
+		column 	= index.column()
+		if role == Qt.DisplayRole:
+			if column == CONTROL:
+				return binding.control
+			if column == ATTRIBUTE:
+				return binding.attribute
+			if column == VALUE:
+				value = self.value(binding)
+				return "-" if value is None else f"{value:.1f}"
+		elif role == Qt.EditRole and column in (VALUE, SLIDER):
+			return self.value(binding)
+		elif role == Qt.TextAlignmentRole and column == VALUE:
+			return int(Qt.AlignRight | Qt.AlignVCenter)
+		elif role == Qt.ToolTipRole and column in (CONTROL, ATTRIBUTE):
+			return f"{binding.control}.{binding.attribute} ({binding.slider})"
+		return None
+
+	def setData(self, index, value, role=Qt.EditRole):
+		if role != Qt.EditRole or index.column() != VALUE:
+			return False
+		try:
+			value = float(value)
+		except (TypeError, ValueError):
+			return False
+		self.edited.emit(self.bindings[index.row()], value)
+		return True
+
+	def add_bindings(self, bindings):
+		"""Append rows for bindings not shown yet."""
+		bindings = [binding for binding in bindings if binding.index not in self.rows]
+		if not bindings:
+			return
+		first = len(self.bindings)
+		self.beginInsertRows(QModelIndex(), first, first + len(bindings) - 1)
+		for binding in bindings:
+			self.rows[binding.index] = len(self.bindings)
+			self.bindings.append(binding)
+		self.endInsertRows()
+
+	def set_values(self, bindings, values):
+		"""Cache known values of bindings and repaint their rows."""
+		rows = []
+		for binding, value in zip(bindings, values):
+			row = self.rows.get(binding.index)
+			if row is not None and value is not None:
+				self.values[binding.index] = value
+				rows.append(row)
+		self._rows_changed(rows)
+
+	def invalidate(self, bindings=None):
+		"""Drop cached values (default: all) so they are read again when next shown."""
+		if bindings is None:
+			self.values.clear()
+			if self.bindings:
+				self._rows_changed([0, len(self.bindings) - 1])
+			return
+		rows = []
+		for binding in bindings:
+			row = self.rows.get(binding.index)
+			if row is not None:
+				self.values.pop(binding.index, None)
+				rows.append(row)
+		self._rows_changed(rows)
+
+	def _rows_changed(self, rows):
+		if rows:
+			self.dataChanged.emit(self.index(min(rows), VALUE), self.index(max(rows), SLIDER))
+
+
+class SliderDelegate(QStyledItemDelegate):
+	"""Paint a slider in every row and create a real QSlider only for the row being used.
+
+	The editor reports pressed(binding), moved(binding, value) and
+	released(binding, value) so the window can run its usual drag
+	transaction; the model is updated by the window, not by the editor.
+	"""
+	pressed 	= Signal(object)
+	moved 		= Signal(object, float)
+	released 	= Signal(object, float)
+
+	def paint(self, painter, option, index):
+		binding = index.model().binding(index)
+		value 	= index.data(Qt.EditRole)
+		style 	= option.widget.style() if option.widget else QApplication.style()
+
+		slider_option = QStyleOptionSlider()
+		slider_option.rect 			= option.rect.adjusted(4, 0, -4, 0)
+		slider_option.palette 		= option.palette
+		slider_option.state 		= option.state | QStyle.State_Horizontal
+		slider_option.orientation 	= Qt.Horizontal
+		slider_option.minimum, slider_option.maximum = slider_range(binding)
+		step = binding.to_slider(value) if value is not None else slider_option.minimum
+		slider_option.sliderPosition 	= min(max(step, slider_option.minimum), slider_option.maximum)
+		slider_option.sliderValue 		= slider_option.sliderPosition
+		slider_option.subControls 		= QStyle.SC_SliderGroove | QStyle.SC_SliderHandle
+		style.drawComplexControl(QStyle.CC_Slider, slider_option, painter, option.widget)
+
+	def createEditor(self, parent, option, index):
+		binding = index.model().binding(index)
+		slider 	= QSlider(Qt.Horizontal, parent)
+		slider.setRange(*slider_range(binding))
+		slider.sliderPressed.connect(lambda: self.pressed.emit(binding))
+		slider.valueChanged.connect(lambda step: self.moved.emit(binding, binding.from_slider(step)))
+		slider.sliderReleased.connect(lambda: self.released.emit(binding, binding.from_slider(slider.value())))
+		return slider
+
+	def setEditorData(self, editor, index):
+		if editor.isSliderDown():
+			return
+		value = index.data(Qt.EditRole)
+		if value is None:
+			return
+		binding = index.model().binding(index)
+		editor.blockSignals(True)
+		editor.setValue(binding.to_slider(value))
+		editor.blockSignals(False)
+
+	def setModelData(self, editor, model, index):
+		# Values reach the model through the window once they are written
+		pass
+
+	def updateEditorGeometry(self, editor, option, index):
+		editor.setGeometry(option.rect.adjusted(4, 0, -4, 0))
+
+
+class ParameterView(QTableView):
+	"""Virtualized parameter table: rows are painted, one live slider follows the mouse."""
+	def __init__(self, model, parent=None):
+		super(ParameterView, self).__init__(parent)
+		self.setModel(model)
+		self.delegate = SliderDelegate(self)
+		self.setItemDelegateForColumn(SLIDER, self.delegate)
+		self.setSelectionBehavior(QAbstractItemView.SelectRows)
+		self.setEditTriggers(QAbstractItemView.DoubleClicked | QAbstractItemView.EditKeyPressed)
+		self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+		self.verticalHeader().setVisible(False)
+		self.verticalHeader().setDefaultSectionSize(22)
+		self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+		header = self.horizontalHeader()
+		header.setSectionResizeMode(QHeaderView.Interactive)
+		header.setStretchLastSection(True)
+		self.setColumnWidth(CONTROL, 140)
+		self.setColumnWidth(ATTRIBUTE, 110)
+		self.setColumnWidth(VALUE, 60)
+
+		self.hovered = QModelIndex()
+		self.setMouseTracking(True)
+		self.entered.connect(self._on_entered)
+
+	def _on_entered(self, index):
+		"""Move the single live slider editor to the slider cell under the mouse."""
+		if index.column() != SLIDER or index == self.hovered:
+			return
+		if self.hovered.isValid():
+			editor = self.indexWidget(self.hovered)
+			if editor and editor.isSliderDown():
+				return
+			self.closePersistentEditor(self.hovered)
+		self.hovered = index
+		self.openPersistentEditor(index)
+
+	def leaveEvent(self, event):
+		if self.hovered.isValid():
+			editor = self.indexWidget(self.hovered)
+			if not (editor and editor.isSliderDown()):
+				self.closePersistentEditor(self.hovered)
+				self.hovered = QModelIndex()
+		super(ParameterView, self).leaveEvent(event)
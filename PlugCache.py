@@ -0,0 +1,326 @@
+import logging
+import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+
+# Unit kinds of plugs whose API values are in internal units (radians, centimetres) rather than UI units
+ANGLE 		= 'angle'
+DISTANCE 	= 'distance'
+UNIT_KINDS 	= {
+	om2.MFn.kDoubleAngleAttribute 	: ANGLE,
+	om2.MFn.kFloatAngleAttribute 	: ANGLE,
+	om2.MFn.kDoubleLinearAttribute 	: DISTANCE,
+	om2.MFn.kFloatLinearAttribute 	: DISTANCE,
+}
+
+
+def qualify(control, namespace):
+	"""Return the node name of a control in a namespace; names that already carry one are kept."""
+	if not namespace or ':' in control:
+		return control
+	return f"{namespace}:{control}"
+
+
+def selected_namespaces():
+	"""Return the namespaces of the selected nodes in selection order, '' for the root namespace."""
+	selection = cmds.ls(selection=True) or []
+	return list(dict.fromkeys(node.rpartition('|')[2].rpartition(':')[0] for node in selection))
+
+
+def ui_factors():
+	"""Return {unit kind: UI units per internal unit} for the current unit preferences."""
+	return {
+		ANGLE 		: om2.MAngle(1.0).asUnits(om2.MAngle.uiUnit()),
+		DISTANCE 	: om2.MDistance(1.0).asUnits(om2.MDistance.uiUnit()),
+	}
+
+
+class PlugCache(object):
+	"""Resolve (control, attribute) pairs to MPlugs once and keep them valid.
+
+	Entries are dropped when their node is deleted or renamed, and the whole
+	cache is cleared when a new scene is created or opened, so lookups on the
+	hot path are a single dict access with no name parsing.
+
+	Controls are given without namespace. The cache drives a target set of
+	namespaces: the first one, the lead, is what plug/read/write use, while
+	write_many fans every value out to the same control in each target
+	through one MDGModifier.
+
+	Values go in and out in UI units, like cmds.getAttr/setAttr: angle and
+	distance plugs are read and written through the API in internal units
+	and converted once at this boundary. The conversion factors are cached
+	until Maya reports a change of the linear or angular UI unit.
+	"""
+	def __init__(self, namespaces=('',)):
+		self.namespaces 		= list(namespaces) or ['']
+		self.plugs 				= {}	# (control, attribute) -> MPlug of the lead target
+		self.targets 			= {}	# (control, attribute) -> [MPlug or None] per namespace
+		self.nodes 				= {}	# node name -> MObjectHandle
+		self.misses 			= set()	# (node name, attribute) pairs that did not resolve
+		self.kinds 				= {}	# (control, attribute) -> ANGLE, DISTANCE or None
+		self._factors 			= None	# ui_factors(), until the UI units change
+		self.resolves 			= 0
+		self._node_callbacks 	= {}	# control -> [callback ids]
+		self._stale_callbacks 	= []
+		self._scene_callbacks 	= []
+		self._add_scene_callbacks()
+
+	# -------------------------------------------------------------------------------------------------------
+	@property
+	def lead(self):
+		"""Namespace whose values the UI shows."""
+		return self.namespaces[0]
+
+	def set_targets(self, namespaces):
+		"""Drive the given namespaces, the first one as lead. '' is the root namespace."""
+		self.namespaces = list(dict.fromkeys(namespaces)) or ['']
+		self.clear()
+
+	def plug(self, control, attribute):
+		"""Return the cached MPlug for control.attribute in the lead namespace, or None if it does not exist."""
+		try:
+			return self.plugs[(control, attribute)]
+		except KeyError:
+			plug = self._resolve(qualify(control, self.lead), attribute)
+			if plug is not None:
+				self.plugs[(control, attribute)] = plug
+			return plug
+
+	def target_plugs(self, control, attribute):
+		"""Return the MPlug of control.attribute in every target namespace, None where missing."""
+		try:
+			return self.targets[(control, attribute)]
+		except KeyError:
+			plugs = [self._resolve(qualify(control, namespace), attribute) for namespace in self.namespaces]
+			self.targets[(control, attribute)] = plugs
+			return plugs
+
+	def paths(self, control, attribute):
+		"""Return 'node.attribute' of control.attribute in every target namespace where it exists."""
+		return [f"{qualify(control, namespace)}.{attribute}"
+				for namespace, plug in zip(self.namespaces, self.target_plugs(control, attribute)) if plug is not None]
+
+	def resolve_all(self, pairs):
+		"""Warm the cache for an iterable of (control, attribute) pairs."""
+		for control, attribute in pairs:
+			self.plug(control, attribute)
+
+	def read(self, control, attribute):
+		"""Return the attribute value as a float, or None if the plug is missing."""
+		plug = self.plug(control, attribute)
+		if plug is None:
+			return None
+		return self.to_ui((control, attribute), plug.asDouble())
+
+	def read_many(self, pairs):
+		"""Read many plugs in one pass, grouped by node.
+
+		Returns a flat list of floats in the order of pairs, with None where
+		the node or attribute does not exist.
+		"""
+		values 	= [None] * len(pairs)
+		by_node = {}
+		for i, (control, attribute) in enumerate(pairs):
+			by_node.setdefault(control, []).append((i, attribute))
+
+		for control, attributes in by_node.items():
+			if self.node(control) is None:
+				continue
+			for i, attribute in attributes:
+				plug = self.plug(control, attribute)
+				if plug is None:
+					continue
+				try:
+					values[i] = plug.asDouble()
+				except RuntimeError:
+					continue
+				kind = self.kind((control, attribute))
+				if kind:
+					values[i] *= self.factors[kind]
+		return values
+
+	def read_targets(self, control, attribute):
+		"""Return the value of control.attribute in every target namespace, None where missing."""
+		values = []
+		for plug in self.target_plugs(control, attribute):
+			try:
+				values.append(None if plug is None else plug.asDouble())
+			except RuntimeError:
+				values.append(None)
+		kind = self.kind((control, attribute))
+		if kind:
+			factor 	= self.factors[kind]
+			values 	= [None if value is None else value * factor for value in values]
+		return values
+
+	def write(self, control, attribute, value):
+		"""Set the attribute in every target through the API. Returns True if the lead was written."""
+		return bool(self.write_many({(control, attribute): value}))
+
+	def write_many(self, values):
+		"""Set many attributes in every target as one batched MDGModifier.
+
+		A value is either one float for all targets or a sequence with one
+		float (or None to skip) per target namespace. Returns the set of keys
+		whose lead plug was written.
+		"""
+		modifier 	= om2.MDGModifier()
+		written 	= set()
+		for key, value in values.items():
+			per_target 	= isinstance(value, (list, tuple))
+			kind 		= self.kind(key)
+			factor 		= self.factors[kind] if kind else 1.0
+			for i, plug in enumerate(self.target_plugs(*key)):
+				target_value = value[i] if per_target else value
+				if plug is None or target_value is None:
+					continue
+				modifier.newPlugValueDouble(plug, target_value / factor)
+				if i == 0:
+					written.add(key)
+		try:
+			modifier.doIt()
+		except RuntimeError as e:
+			logging.warning(f"Failed to set {len(values)} attributes: {e}")
+			return set()
+		return written
+
+	def kind(self, key):
+		"""Return the unit kind of a (control, attribute) plug: ANGLE, DISTANCE or None for plain values."""
+		try:
+			return self.kinds[key]
+		except KeyError:
+			plug = self.plug(*key)
+			if plug is None:
+				return None
+			kind = self.kinds[key] = UNIT_KINDS.get(plug.attribute().apiType())
+			return kind
+
+	def to_ui(self, key, value):
+		"""Convert an internal-unit value read from the API for a (control, attribute) plug to UI units."""
+		kind = self.kind(key)
+		return value * self.factors[kind] if kind else value
+
+	@property
+	def factors(self):
+		"""{unit kind: UI units per internal unit}, computed once per UI unit change."""
+		if self._factors is None:
+			self._factors = ui_factors()
+		return self._factors
+
+	def node(self, control):
+		"""Return the MObjectHandle of a control in the lead namespace, or None if it does not exist."""
+		return self._node(qualify(control, self.lead))
+
+	def exists(self, control, attribute):
+		"""Return True if control.attribute resolves to a plug."""
+		return self.plug(control, attribute) is not None
+
+	# -------------------------------------------------------------------------------------------------------
+	def invalidate(self, node_name):
+		"""Drop every cached plug of a node."""
+		self.nodes.pop(node_name, None)
+		for key in [key for key in self.plugs if qualify(key[0], self.lead) == node_name]:
+			del self.plugs[key]
+		# Fan-out lists are cheap to rebuild
+		self.targets.clear()
+		# Removing a callback from inside itself is unsafe; retire it on the next resolve
+		self._stale_callbacks.extend(self._node_callbacks.pop(node_name, []))
+
+	def clear(self):
+		"""Drop every cached plug and node watcher."""
+		self.plugs.clear()
+		self.targets.clear()
+		self.nodes.clear()
+		self.misses.clear()
+		self.kinds.clear()
+		for callback_ids in self._node_callbacks.values():
+			self._stale_callbacks.extend(callback_ids)
+		self._node_callbacks.clear()
+
+	def teardown(self):
+		"""Clear the cache and remove every callback it registered."""
+		self.clear()
+		self._remove_stale_callbacks()
+		for callback_id in self._scene_callbacks:
+			om2.MMessage.removeCallback(callback_id)
+		self._scene_callbacks = []
+
+	# -------------------------------------------------------------------------------------------------------
+	def _node(self, node_name):
+		handle = self.nodes.get(node_name)
+		if handle is not None and handle.isValid():
+			return handle
+		selection = om2.MSelectionList()
+		try:
+			selection.add(node_name)
+		except RuntimeError:
+			return None
+		node = selection.getDependNode(0)
+		handle = om2.MObjectHandle(node)
+		self.nodes[node_name] = handle
+		self._watch_node(node_name, node)
+		return handle
+
+	def _resolve(self, node_name, attribute):
+		"""Look the plug up by name, remembering misses."""
+		key = (node_name, attribute)
+		if key in self.misses:
+			return None
+		self._remove_stale_callbacks()
+		self.resolves += 1
+
+		handle = self._node(node_name)
+		if handle is None:
+			self.misses.add(key)
+			return None
+
+		try:
+			return om2.MFnDependencyNode(handle.object()).findPlug(attribute, False)
+		except RuntimeError:
+			self.misses.add(key)
+			return None
+
+	def _watch_node(self, node_name, node):
+		"""Invalidate a node's plugs when it is deleted or renamed."""
+		if node_name in self._node_callbacks:
+			return
+		self._node_callbacks[node_name] = [
+			om2.MNodeMessage.addNodePreRemovalCallback(node, self._on_node_removed, node_name),
+			om2.MNodeMessage.addNameChangedCallback(node, self._on_name_changed, node_name),
+		]
+
+	def _add_scene_callbacks(self):
+		"""Clear the cache whenever the scene contents are replaced; drop the unit factors when the UI units change."""
+		for message in (om2.MSceneMessage.kBeforeNew,
+						om2.MSceneMessage.kBeforeOpen,
+						om2.MSceneMessage.kAfterLoadReference,
+						om2.MSceneMessage.kAfterUnloadReference):
+			self._scene_callbacks.append(om2.MSceneMessage.addCallback(message, self._on_scene_changed))
+		# Unresolved names may start resolving once new nodes appear
+		self._scene_callbacks.append(om2.MDGMessage.addNodeAddedCallback(self._on_node_added, "dependNode"))
+		for event in ('linearUnitChanged', 'angularUnitChanged'):
+			self._scene_callbacks.append(om2.MEventMessage.addEventCallback(event, self._on_units_changed))
+
+	def _remove_stale_callbacks(self):
+		while self._stale_callbacks:
+			try:
+				om2.MMessage.removeCallback(self._stale_callbacks.pop())
+			except RuntimeError:
+				pass
+
+	def _on_node_removed(self, node, node_name):
+		self.invalidate(node_name)
+
+	def _on_name_changed(self, node, previous_name, node_name):
+		self.invalidate(node_name)
+
+	def _on_scene_changed(self, *args):
+		self.clear()
+
+	def _on_node_added(self, node, *args):
+		self.misses.clear()
+		# Fan-out lists may hold None for a target namespace that now exists
+		self.targets.clear()
+
+	def _on_units_changed(self, *args):
+		self._factors = None
@@ -0,0 +1,179 @@
+import json
+import numpy as np
+from PySide2.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QScrollArea, QWidget, QLabel,
+							   QSlider, QPushButton)
+from PySide2.QtCore import Qt, Signal
+
+
+class PresetSet(object):
+	"""Pose presets stored as rows of one float matrix with a fixed plug schema.
+
+	Column i of every row holds the value of schema[i]; NaN marks a plug the
+	preset does not set. Blending adds the weighted differences of the rows
+	from a base pose.
+	"""
+	def __init__(self, schema):
+		self.schema 	= [tuple(plug) for plug in schema]		# [(control, attribute)]
+		self.columns 	= {plug: i for i, plug in enumerate(self.schema)}
+		self.names 		= []
+		self.matrix 	= np.empty((0, len(self.schema)))
+		self._filled 	= self.matrix		# matrix with NaN replaced by 0
+		self._known 	= self.matrix		# 1.0 where the preset sets the plug
+
+	@classmethod
+	def from_rows(cls, schema, names, matrix):
+		"""Build presets from a name list and a matching (names x schema) matrix."""
+		presets 		= cls(schema)
+		presets.names 	= list(names)
+		presets.matrix 	= np.array(matrix, dtype=np.float64).reshape(len(presets.names), len(presets.schema))
+		presets._update()
+		return presets
+
+	def __len__(self):
+		return len(self.names)
+
+	def add(self, name, values):
+		"""Store a pose vector under a name, replacing any preset of the same name."""
+		row = np.asarray(values, dtype=np.float64).reshape(1, len(self.schema))
+		if name in self.names:
+			self.matrix[self.names.index(name)] = row
+		else:
+			self.names.append(name)
+			self.matrix = np.vstack([self.matrix, row])
+		self._update()
+
+	def remove(self, name):
+		"""Delete a preset."""
+		index = self.names.index(name)
+		del self.names[index]
+		self.matrix = np.delete(self.matrix, index, axis=0)
+		self._update()
+
+	def vector(self, name):
+		"""Return the pose vector of a preset."""
+		return self.matrix[self.names.index(name)]
+
+	def blend(self, weights, base):
+		"""Return base + weights @ (presets - base) as one pose vector.
+
+		Weight 0 leaves a plug at its base value, 1 moves it all the way to
+		the preset, 0.5 halfway. A preset only pulls the plugs it sets; plugs
+		missing from base (NaN) stay NaN.
+		"""
+		weights = np.asarray(weights, dtype=np.float64)
+		base 	= np.asarray(base, dtype=np.float64)
+		return base + weights @ self._filled - (weights @ self._known) * base
+
+	def conform(self, schema):
+		"""Return a copy of the presets re-ordered to another schema."""
+		conformed = PresetSet(schema)
+		conformed.names = list(self.names)
+		conformed.matrix = np.full((len(self.names), len(conformed.schema)), np.nan)
+		for j, plug in enumerate(conformed.schema):
+			i = self.columns.get(plug)
+			if i is not None:
+				conformed.matrix[:, j] = self.matrix[:, i]
+		conformed._update()
+		return conformed
+
+	def save(self, path):
+		"""Write the presets as JSON."""
+		data = {
+			'schema'	: [list(plug) for plug in self.schema],
+			'presets'	: {name: [None if np.isnan(v) else float(v) for v in row]
+						   for name, row in zip(self.names, self.matrix)},
+		}
+		with open(path, 'w') as f:
+			json.dump(data, f, indent=1)
+
+	@classmethod
+	def load(cls, path):
+		"""Read presets written by save()."""
+		with open(path, 'r') as f:
+			data = json.load(f)
+		presets = cls(data['schema'])
+		for name, row in data['presets'].items():
+			presets.add(name, [np.nan if v is None else v for v in row])
+		return presets
+
+	def _update(self):
+		known = ~np.isnan(self.matrix)
+		self._known 	= known.astype(np.float64)
+		self._filled 	= np.where(known, self.matrix, 0.0)
+
+
+class PresetBlendDialog(QDialog):
+	"""One weight slider per preset; scrubbing previews the blend, releasing commits it."""
+	preview = Signal(object)		# blended pose vector
+	started = Signal()
+	commit 	= Signal(object)		# blended pose vector
+
+	def __init__(self, presets, read_pose, parent=None):
+		super(PresetBlendDialog, self).__init__(parent)
+		self.setWindowTitle("Blend Presets")
+		self.resize(360, 400)
+		self.presets 	= presets
+		self.read_pose 	= read_pose			# callable() -> current pose vector in presets.schema order
+		self.base 		= read_pose()		# pose the weights blend away from
+		self.weights 	= np.zeros(len(presets))
+		self.sliders 	= []
+
+		rows = QWidget()
+		rows_layout = QVBoxLayout(rows)
+		for i, name in enumerate(presets.names):
+			row = QHBoxLayout()
+			row.addWidget(QLabel(name))
+			slider = QSlider(Qt.Horizontal)
+			slider.setRange(0, 100)
+			slider.sliderPressed.connect(self.on_pressed)
+			slider.valueChanged.connect(lambda value, i=i: self.on_weight_changed(i, value))
+			slider.sliderReleased.connect(self.on_released)
+			row.addWidget(slider)
+			apply_button = QPushButton("Apply")
+			apply_button.clicked.connect(lambda checked=False, i=i: self.apply_only(i))
+			row.addWidget(apply_button)
+			rows_layout.addLayout(row)
+			self.sliders.append(slider)
+		rows_layout.addStretch()
+
+		scroll_area = QScrollArea(self)
+		scroll_area.setWidget(rows)
+		scroll_area.setWidgetResizable(True)
+		layout = QVBoxLayout(self)
+		layout.addWidget(scroll_area)
+
+	def rebase(self):
+		"""Blend from the current pose when no preset is weighted in yet."""
+		if not self.weights.any():
+			self.base = self.read_pose()
+
+	def on_pressed(self):
+		self.rebase()
+		self.started.emit()
+
+	def on_weight_changed(self, index, value):
+		dragging = self.sliders[index].isSliderDown()
+		if not dragging:
+			self.rebase()
+		self.weights[index] = value / 100.0
+		pose = self.presets.blend(self.weights, self.base)
+		if dragging:
+			self.preview.emit(pose)
+		else:
+			# Keyboard and page steps are complete edits on their own
+			self.started.emit()
+			self.commit.emit(pose)
+
+	def on_released(self):
+		self.commit.emit(self.presets.blend(self.weights, self.base))
+
+	def apply_only(self, index):
+		"""Apply a single preset at full weight."""
+		self.weights[:] = 0.0
+		self.weights[index] = 1.0
+		for i, slider in enumerate(self.sliders):
+			slider.blockSignals(True)
+			slider.setValue(100 if i == index else 0)
+			slider.blockSignals(False)
+		self.started.emit()
+		self.commit.emit(self.presets.blend(self.weights, self.base))
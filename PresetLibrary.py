@@ -0,0 +1,390 @@
+import os
+import json
+import mmap
+import time
+import struct
+import getpass
+import logging
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import maya.cmds as cmds
+from PySide2.QtCore import Qt, QObject, Signal, QStringListModel, QSortFilterProxyModel
+from PySide2.QtGui import QPixmap
+from PySide2.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLineEdit, QListView, QLabel, QPushButton,
+							   QAbstractItemView)
+
+import PosePresets
+
+# File layout, little endian: header, then sections each starting on an ALIGNMENT boundary
+#   header 	magic | version | rows | columns | (offset, length) of each section
+#   schema 	JSON [[control, attribute], ...], one per column
+#   names 	JSON [name, ...], one per row
+#   matrix 	rows x columns float32, NaN where a preset does not set the plug
+#   meta 	JSON {'presets': {name: {...}}, 'thumbnails': {name: [offset, length]}}
+#   thumbs 	PNG bytes of every thumbnail, back to back
+MAGIC 		= b'APL1'
+VERSION 	= 1
+SECTIONS 	= ('schema', 'names', 'matrix', 'meta', 'thumbs')
+HEADER 		= struct.Struct('<4sIII' + 'QQ' * len(SECTIONS))
+ALIGNMENT 	= 64
+EXTENSION 	= '.apl'
+
+# Edge length in pixels of captured thumbnails
+THUMBNAIL_SIZE = 96
+
+
+def write_library(path, presets, metadata=None, thumbnails=None):
+	"""Write a PresetSet as a library file, replacing path only once the new file is complete.
+
+	metadata maps preset names to JSON-serializable dicts, thumbnails maps
+	preset names to PNG bytes; presets missing from either simply have none.
+	"""
+	metadata 	= {name: metadata[name] for name in presets.names if name in (metadata or {})}
+	thumbnails 	= {name: thumbnails[name] for name in presets.names if (thumbnails or {}).get(name)}
+	blob, index = bytearray(), {}
+	for name, data in thumbnails.items():
+		index[name] = [len(blob), len(data)]
+		blob.extend(data)
+	sections = [
+		json.dumps([list(plug) for plug in presets.schema]).encode(),
+		json.dumps(presets.names).encode(),
+		np.ascontiguousarray(presets.matrix, dtype='<f4').tobytes(),
+		json.dumps({'presets': metadata, 'thumbnails': index}).encode(),
+		bytes(blob),
+	]
+
+	layout, offset = [], HEADER.size
+	for data in sections:
+		offset += -offset % ALIGNMENT
+		layout += [offset, len(data)]
+		offset += len(data)
+
+	directory = os.path.dirname(os.path.abspath(path))
+	handle, temp_path = tempfile.mkstemp(suffix=EXTENSION, dir=directory)
+	try:
+		with os.fdopen(handle, 'wb') as f:
+			f.write(HEADER.pack(MAGIC, VERSION, len(presets.names), len(presets.schema), *layout))
+			for data, section_offset in zip(sections, layout[0::2]):
+				f.write(b'\0' * (section_offset - f.tell()))
+				f.write(data)
+		os.replace(temp_path, path)
+	except BaseException:
+		if os.path.exists(temp_path):
+			os.remove(temp_path)
+		raise
+
+
+def capture_thumbnail(size=THUMBNAIL_SIZE):
+	"""Grab the active viewport as PNG bytes, or None if it cannot be captured. Runs on the UI thread."""
+	handle, path = tempfile.mkstemp(suffix='.png')
+	os.close(handle)
+	try:
+		cmds.playblast(completeFilename=path, format='image', compression='png', viewer=False, offScreen=True,
+					   frame=[cmds.currentTime(query=True)], widthHeight=(size, size), percent=100,
+					   showOrnaments=False, forceOverwrite=True)
+		with open(path, 'rb') as f:
+			return f.read() or None
+	except (RuntimeError, OSError) as e:
+		logging.warning(f"Failed to capture a preset thumbnail: {e}")
+		return None
+	finally:
+		if os.path.exists(path):
+			os.remove(path)
+
+
+def preset_metadata():
+	"""Return the metadata stored with a preset saved now."""
+	return {
+		'author'	: getpass.getuser(),
+		'created'	: time.strftime('%Y-%m-%d %H:%M:%S'),
+		'scene'		: cmds.file(query=True, sceneName=True) or '',
+	}
+
+
+class PresetLibrary(object):
+	"""A preset library file mapped into memory.
+
+	Opening reads only the header, the schema and the name index; the
+	matrix is a float32 view onto the mapped file, and metadata and
+	thumbnails are decoded the first time they are asked for.
+	"""
+	def __init__(self, path):
+		self.path 	= path
+		self._file 	= open(path, 'rb')
+		try:
+			self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+			magic, version, rows, columns, *layout = HEADER.unpack_from(self._map, 0)
+		except (ValueError, struct.error):
+			self._file.close()
+			raise ValueError(f"{path} is not a preset library.")
+		if magic != MAGIC or version > VERSION:
+			self.close()
+			raise ValueError(f"{path} is not a preset library this tool can read.")
+		self._sections 	= dict(zip(SECTIONS, zip(layout[0::2], layout[1::2])))
+		self.schema 	= [tuple(plug) for plug in json.loads(self._section('schema'))]
+		self.names 		= json.loads(self._section('names'))
+		self.index 		= {name: row for row, name in enumerate(self.names)}
+		offset, length 	= self._sections['matrix']
+		if length != rows * columns * 4 or len(self.names) != rows or len(self.schema) != columns:
+			self.close()
+			raise ValueError(f"{path} is truncated or corrupt.")
+		self.matrix 	= np.frombuffer(self._map, dtype='<f4', count=rows * columns, offset=offset).reshape(rows, columns)
+		self._meta 		= None
+		self._columns 	= {}		# schema -> (library columns, schema columns) of the plugs both have
+
+	def __len__(self):
+		return len(self.names)
+
+	def _section(self, name):
+		offset, length = self._sections[name]
+		return self._map[offset:offset + length]
+
+	def columns(self, schema):
+		"""Return (library columns, schema columns) of the plugs the library and schema share."""
+		schema = tuple(tuple(plug) for plug in schema)
+		if schema not in self._columns:
+			library = {plug: i for i, plug in enumerate(self.schema)}
+			shared 	= [(library[plug], j) for j, plug in enumerate(schema) if plug in library]
+			self._columns[schema] = (np.array([i for i, j in shared], dtype=int), np.array([j for i, j in shared], dtype=int))
+		return self._columns[schema]
+
+	def vector(self, name, schema=None):
+		"""Return the pose vector of a preset as float64, re-ordered to schema if given (NaN for other plugs)."""
+		row = self._matrix()[self.index[name]]
+		if schema is None:
+			return row.astype(np.float64)
+		source, target = self.columns(schema)
+		vector = np.full(len(schema), np.nan)
+		vector[target] = row[source]
+		return vector
+
+	def preset_set(self, names=None, schema=None):
+		"""Return the named presets (default: all) as a PosePresets.PresetSet, copying only their rows."""
+		names 	= self.names if names is None else list(names)
+		presets = PosePresets.PresetSet.from_rows(self.schema, names, self._matrix()[[self.index[name] for name in names]])
+		return presets if schema is None else presets.conform(schema)
+
+	def _matrix(self):
+		if self.matrix is None:
+			raise ValueError(f"{self.path} was closed; it is being saved or another file was opened.")
+		return self.matrix
+
+	def metadata(self, name):
+		"""Return the metadata dict of a preset, empty if it has none."""
+		if self._meta is None:
+			self._meta = json.loads(self._section('meta'))
+		return self._meta['presets'].get(name, {})
+
+	def thumbnail(self, name):
+		"""Return the PNG bytes of a preset's thumbnail, or None."""
+		self.metadata(name)
+		entry = self._meta['thumbnails'].get(name)
+		if not entry:
+			return None
+		offset = self._sections['thumbs'][0] + entry[0]
+		return self._map[offset:offset + entry[1]]
+
+	def close(self):
+		"""Unmap the file. The matrix view must not be used afterwards."""
+		self.matrix = None
+		if self._map is not None and not self._map.closed:
+			try:
+				self._map.close()
+			except BufferError:
+				# A view onto the map is still alive; it is unmapped once that view is collected
+				pass
+		self._file.close()
+
+
+class PresetWorker(QObject):
+	"""Run preset file I/O on one background thread; results come back as signals on the UI thread.
+
+	The worker owns the open PresetLibrary and closes it when another file
+	is opened or the library is saved over. The UI thread reads its names
+	and single rows; metadata and thumbnails are read on the worker, so a
+	slow share never blocks Maya.
+	"""
+	opened 	= Signal(str, object, object)		# path, PresetLibrary or None for JSON, PresetSet for JSON or None
+	saved 	= Signal(str, object)				# path, PresetLibrary or None for JSON
+	details = Signal(str, object, object)		# preset name, metadata dict, thumbnail bytes or None
+	failed 	= Signal(str, str)					# path, message
+
+	def __init__(self, parent=None):
+		super(PresetWorker, self).__init__(parent)
+		self.library 	= None
+		self._executor 	= ThreadPoolExecutor(max_workers=1, thread_name_prefix="PresetIO")
+
+	def open(self, path, schema):
+		"""Map a library (.apl), or load a JSON preset file conformed to schema."""
+		self._executor.submit(self._open, path, list(schema))
+
+	def save(self, path, presets, metadata=None, thumbnails=None):
+		"""Write presets; saving over the open library keeps its other presets, metadata and thumbnails."""
+		self._executor.submit(self._save, path, presets, dict(metadata or {}), dict(thumbnails or {}))
+
+	def fetch(self, name):
+		"""Fetch the metadata and thumbnail of a preset of the open library."""
+		self._executor.submit(self._fetch, name)
+
+	def shutdown(self):
+		"""Finish queued work and close the open library."""
+		self._executor.shutdown(wait=True)
+		self._replace(None)
+
+	# -------------------------------------------------------------------------------------------------------
+	def _open(self, path, schema):
+		try:
+			if path.lower().endswith(EXTENSION):
+				# Rows stay in the mapped file until they are applied or picked for blending
+				library = PresetLibrary(path)
+				presets = None
+			else:
+				library = None
+				presets = PosePresets.PresetSet.load(path).conform(schema)
+		except (OSError, ValueError, KeyError) as e:
+			self.failed.emit(path, str(e))
+			return
+		self._replace(library)
+		self.opened.emit(path, library, presets)
+
+	def _save(self, path, presets, metadata, thumbnails):
+		try:
+			if path.lower().endswith(EXTENSION):
+				base = self.library
+				if base and os.path.abspath(base.path) == os.path.abspath(path):
+					# The file is rewritten whole: every preset of the library plus the ones given, over
+					# the library's plugs followed by any new ones, so columns from other rigs are kept
+					known 	= set(base.schema)
+					schema 	= base.schema + [plug for plug in presets.schema if plug not in known]
+					merged 	= base.preset_set(schema=schema)
+					for name, row in zip(presets.names, presets.conform(schema).matrix):
+						merged.add(name, row)
+					presets = merged
+					for name in presets.names:
+						if name in base.index:
+							metadata.setdefault(name, base.metadata(name))
+							if not thumbnails.get(name):
+								thumbnail = base.thumbnail(name)
+								thumbnails[name] = bytes(thumbnail) if thumbnail else None
+				# Unmapped before the file is replaced; a mapped file cannot be replaced on Windows
+				self._replace(None)
+				write_library(path, presets, metadata, thumbnails)
+				library = PresetLibrary(path)
+			else:
+				presets.save(path)
+				library = None
+		except (OSError, ValueError) as e:
+			self.failed.emit(path, str(e))
+			return
+		if library:
+			self._replace(library)
+		self.saved.emit(path, library)
+
+	def _fetch(self, name):
+		library = self.library
+		if library is None or name not in library.index:
+			return
+		try:
+			thumbnail = library.thumbnail(name)
+			self.details.emit(name, library.metadata(name), bytes(thumbnail) if thumbnail else None)
+		except (OSError, ValueError) as e:
+			self.failed.emit(library.path, str(e))
+
+	def _replace(self, library):
+		if self.library is not None and self.library is not library:
+			self.library.close()
+		self.library = library
+
+
+class PresetBrowser(QDialog):
+	"""Filterable list of a library's presets; details of the current one are fetched in the background.
+
+	The list is a model over the name index, so thousands of presets cost
+	one row of painting each as they scroll into view.
+	"""
+	detailsRequested 	= Signal(str)
+	applyRequested 		= Signal(str)
+	blendRequested 		= Signal(list)
+
+	def __init__(self, names, title="Preset Library", parent=None):
+		super(PresetBrowser, self).__init__(parent)
+		self.setWindowTitle(title)
+		self.resize(420, 480)
+		self.current = None
+
+		self.model = QStringListModel(list(names), self)
+		self.proxy = QSortFilterProxyModel(self)
+		self.proxy.setSourceModel(self.model)
+		self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+		self.filter_edit = QLineEdit()
+		self.filter_edit.setPlaceholderText("Filter presets")
+		self.filter_edit.textChanged.connect(self.proxy.setFilterFixedString)
+
+		self.view = QListView()
+		self.view.setModel(self.proxy)
+		self.view.setUniformItemSizes(True)
+		self.view.setSelectionMode(QAbstractItemView.ExtendedSelection)
+		self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+		self.view.selectionModel().currentChanged.connect(self._on_current_changed)
+		self.view.doubleClicked.connect(lambda index: self.applyRequested.emit(index.data()))
+
+		self.thumbnail_label = QLabel()
+		self.thumbnail_label.setFixedSize(THUMBNAIL_SIZE, THUMBNAIL_SIZE)
+		self.thumbnail_label.setAlignment(Qt.AlignCenter)
+		self.details_label = QLabel()
+		self.details_label.setWordWrap(True)
+		self.details_label.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+
+		apply_button = QPushButton("Apply")
+		apply_button.clicked.connect(self._apply_current)
+		blend_button = QPushButton("Blend Selected...")
+		blend_button.clicked.connect(self._blend_selected)
+
+		details = QHBoxLayout()
+		details.addWidget(self.thumbnail_label)
+		details.addWidget(self.details_label, 1)
+		buttons = QHBoxLayout()
+		buttons.addStretch()
+		buttons.addWidget(apply_button)
+		buttons.addWidget(blend_button)
+		layout = QVBoxLayout(self)
+		layout.addWidget(self.filter_edit)
+		layout.addWidget(self.view, 1)
+		layout.addLayout(details)
+		layout.addLayout(buttons)
+
+	def set_names(self, names):
+		"""Show another name list, e.g. after the library was saved."""
+		self.model.setStringList(list(names))
+
+	def show_details(self, name, metadata, thumbnail):
+		"""Show fetched details if they belong to the current preset."""
+		if name != self.current:
+			return
+		pixmap = QPixmap()
+		if thumbnail and pixmap.loadFromData(thumbnail):
+			self.thumbnail_label.setPixmap(pixmap.scaled(THUMBNAIL_SIZE, THUMBNAIL_SIZE, Qt.KeepAspectRatio,
+														 Qt.SmoothTransformation))
+		else:
+			self.thumbnail_label.setText("No thumbnail")
+		lines = [f"<b>{name}</b>"] + [f"{key}: {value}" for key, value in metadata.items()]
+		self.details_label.setText("<br>".join(lines))
+
+	def _on_current_changed(self, current, previous):
+		self.current = current.data() if current.isValid() else None
+		self.thumbnail_label.clear()
+		self.details_label.setText(f"<b>{self.current}</b><br>Loading..." if self.current else "")
+		if self.current:
+			self.detailsRequested.emit(self.current)
+
+	def _apply_current(self):
+		if self.current:
+			self.applyRequested.emit(self.current)
+
+	def _blend_selected(self):
+		names = [index.data() for index in self.view.selectionModel().selectedRows()]
+		if names:
+			self.blendRequested.emit(names)
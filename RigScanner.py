@@ -0,0 +1,219 @@
+import os
+import json
+import hashlib
+import logging
+import maya.cmds as cmds
+
+import BindingRegistry
+
+# Scanned schemas live next to the compiled forms
+CACHE_DIR = os.environ.get("ATTR_CONTROLLER_SCHEMA_CACHE",
+						   os.path.join(os.path.expanduser("~"), ".cache", "mayaAttributeController", "schemas"))
+
+# Bump when the schema layout changes so old cache files are rescanned
+SCHEMA_VERSION = 2
+
+# Controls are transforms matching one of these patterns, or carrying this tag attribute
+CONTROL_PATTERNS 	= ("con_*", "*:con_*")
+CONTROL_TAG 		= "attrControllerTag"
+
+# Attribute types a slider can drive
+NUMERIC_TYPES = {'double', 'float', 'doubleLinear', 'doubleAngle', 'long', 'short', 'byte', 'time'}
+
+# Window attribute of the generated bindings; they have no hand-built widgets and show in the parameter table
+SCAN_UI = "scan"
+
+# Slider steps per unit of the generated bindings
+SCAN_SCALE = 10
+
+
+def file_digest(path):
+	"""Hash the contents of a rig file."""
+	digest = hashlib.sha1()
+	with open(path, 'rb') as f:
+		for block in iter(lambda: f.read(1 << 20), b''):
+			digest.update(block)
+	return digest.hexdigest()
+
+
+def strip_namespace(node):
+	"""Return a node name without its namespaces: 'A:B:con_head' -> 'con_head'."""
+	return node.rpartition(':')[2]
+
+
+def rig_files():
+	"""Return the files the rig comes from: the referenced files, or the open scene if nothing is referenced."""
+	files = [cmds.referenceQuery(path, filename=True, withoutCopyNumber=True)
+			 for path in cmds.file(query=True, reference=True) or []]
+	if not files:
+		scene = cmds.file(query=True, sceneName=True)
+		files = [scene] if scene else []
+	return sorted(set(path for path in files if os.path.isfile(path)))
+
+
+class RigScanner(object):
+	"""Find rig controls by name pattern or tag and describe their keyable attributes.
+
+	The schema is a list of {control, attribute, default, minimum, maximum}
+	entries. Controls are stored without namespace: the schema describes the
+	rig, not one instance of it, and PlugCache.set_targets picks the
+	namespaces it drives. It is cached on disk per set of rig files; an
+	entry is reused while every file keeps its modification time and size,
+	or, if those changed, its content hash.
+	"""
+	def __init__(self, patterns=CONTROL_PATTERNS, tag=CONTROL_TAG, cache_dir=CACHE_DIR):
+		self.patterns 	= tuple(patterns)
+		self.tag 		= tag
+		self.cache_dir 	= cache_dir
+		self.hits 		= 0
+		self.misses 	= 0
+
+	# =======================================================================================================
+	# Scanning
+	# =======================================================================================================
+	def find_controls(self):
+		"""Return the transforms matching a control pattern or carrying the tag, in scene order."""
+		controls = cmds.ls(*self.patterns, type='transform') or []
+		if self.tag:
+			tagged = cmds.ls(f"*.{self.tag}", f"*:*.{self.tag}", objectsOnly=True) or []
+			controls += [control for control in tagged if control not in controls]
+		return list(dict.fromkeys(controls))
+
+	def describe(self, control):
+		"""Return the schema entries of the keyable numeric attributes of one control."""
+		entries = []
+		for attribute in cmds.listAttr(control, keyable=True, scalar=True) or []:
+			plug = f"{control}.{attribute}"
+			try:
+				if cmds.getAttr(plug, type=True) not in NUMERIC_TYPES:
+					continue
+				default = cmds.attributeQuery(attribute, node=control, listDefault=True)
+				minimum = self._limit(control, attribute, 'minimum')
+				maximum = self._limit(control, attribute, 'maximum')
+			except (RuntimeError, ValueError) as e:
+				logging.warning(f"Skipping {plug}: {e}")
+				continue
+			entries.append({
+				'control'	: strip_namespace(control),
+				'attribute'	: attribute,
+				'default'	: float(default[0]) if default else None,
+				'minimum'	: minimum,
+				'maximum'	: maximum,
+			})
+		return entries
+
+	@staticmethod
+	def _limit(control, attribute, side):
+		"""Return the hard limit of an attribute, else its soft limit, else None."""
+		if cmds.attributeQuery(attribute, node=control, **{f"{side[:3]}Exists": True}):
+			return float(cmds.attributeQuery(attribute, node=control, **{side: True})[0])
+		soft = 'softMin' if side == 'minimum' else 'softMax'
+		if cmds.attributeQuery(attribute, node=control, **{f"{soft}Exists": True}):
+			return float(cmds.attributeQuery(attribute, node=control, **{soft: True})[0])
+		return None
+
+	def scan(self):
+		"""Describe every control found in the scene, once per control of the rig.
+
+		A rig referenced several times is described from its first instance.
+		"""
+		schema, described = [], set()
+		for control in self.find_controls():
+			name = strip_namespace(control)
+			if name in described:
+				continue
+			described.add(name)
+			schema.extend(self.describe(control))
+		return schema
+
+	# =======================================================================================================
+	# Cache
+	# =======================================================================================================
+	def cache_path(self, files):
+		key = hashlib.sha1(json.dumps([files, self.patterns, self.tag]).encode()).hexdigest()
+		return os.path.join(self.cache_dir, f"schema_{key}.json")
+
+	def schema(self, rescan=False):
+		"""Return the schema of the current rig, scanning only if its files changed since the cached scan."""
+		files = rig_files()
+		if not files:
+			self.misses += 1
+			return self.scan()
+
+		path 	= self.cache_path(files)
+		cached 	= None if rescan else self._read_cache(path)
+		stamps 	= {f: self._stamp(f) for f in files}
+		if cached and self._still_valid(cached, stamps):
+			self.hits += 1
+			if cached['stamps'] != stamps:
+				# Touched but identical: keep the schema, remember the new times
+				cached['stamps'] = stamps
+				self._write_cache(path, cached)
+			return cached['schema']
+
+		self.misses += 1
+		schema = self.scan()
+		self._write_cache(path, {
+			'version'	: SCHEMA_VERSION,
+			'stamps'	: stamps,
+			'digests'	: {f: file_digest(f) for f in files},
+			'schema'	: schema,
+		})
+		return schema
+
+	@staticmethod
+	def _stamp(path):
+		stat = os.stat(path)
+		return [stat.st_mtime, stat.st_size]
+
+	@staticmethod
+	def _still_valid(cached, stamps):
+		"""True if every rig file kept its time and size, or else its content."""
+		if cached.get('version') != SCHEMA_VERSION or set(cached.get('stamps', {})) != set(stamps):
+			return False
+		for path, stamp in stamps.items():
+			if cached['stamps'][path] == stamp:
+				continue
+			if cached.get('digests', {}).get(path) != file_digest(path):
+				return False
+		return True
+
+	@staticmethod
+	def _read_cache(path):
+		try:
+			with open(path, 'r') as f:
+				return json.load(f)
+		except FileNotFoundError:
+			return None
+		except (OSError, ValueError) as e:
+			logging.warning(f"Ignoring unreadable schema cache {path}: {e}")
+			return None
+
+	@staticmethod
+	def _write_cache(path, data):
+		try:
+			os.makedirs(os.path.dirname(path), exist_ok=True)
+			with open(path, 'w') as f:
+				json.dump(data, f)
+		except OSError as e:
+			logging.warning(f"Failed to write schema cache {path}: {e}")
+
+
+def bindings_from_schema(schema, registry, ui=SCAN_UI):
+	"""Add a binding to registry for every schema entry whose plug is not bound yet; return the new bindings."""
+	added = []
+	for entry in schema:
+		plug = (entry['control'], entry['attribute'])
+		if plug in registry.by_plug:
+			continue
+		# 'a_b' + 'c' and 'a' + 'b_c' give the same name; number the later ones
+		name = base = f"{ui}_{entry['control']}_{entry['attribute']}".replace(':', '_')
+		suffix = 2
+		while name in registry.by_slider:
+			name = f"{base}_{suffix}"
+			suffix += 1
+		binding = BindingRegistry.SliderBinding(
+			ui, name, entry['control'], entry['attribute'], default=entry.get('default'),
+			minimum=entry.get('minimum'), maximum=entry.get('maximum'), scale=SCAN_SCALE)
+		added.append(registry.add(binding))
+	return added
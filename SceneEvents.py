@@ -0,0 +1,86 @@
+import logging
+import maya.api.OpenMaya as om2
+from PySide2.QtCore import QObject, QTimer, Signal
+
+# Bursts of scene messages (a reference load sends several) are handled once
+DEBOUNCE_MS = 16
+
+# Scene messages after which every bound plug may point at a different node
+SCENE_MESSAGES = ('kAfterOpen', 'kAfterNew', 'kAfterLoadReference', 'kAfterUnloadReference',
+				  'kAfterCreateReference', 'kAfterImport')
+
+# Events after which bound values may differ from what the UI shows
+VALUE_EVENTS = ('Undo', 'Redo')
+
+
+class SceneWatcher(QObject):
+	"""Turn Maya scene and undo/redo messages into debounced Qt signals.
+
+	sceneChanged fires once after a scene is opened or created or a
+	reference is loaded or unloaded; valuesChanged fires once after undo or
+	redo. Both are delivered on the next UI frame so Maya has finished the
+	operation when the handlers run.
+	"""
+	sceneChanged 	= Signal()
+	valuesChanged 	= Signal()
+
+	def __init__(self, interval=DEBOUNCE_MS, parent=None):
+		super(SceneWatcher, self).__init__(parent)
+		self.callbacks 		= []
+		self._scene_dirty 	= False
+		self._values_dirty 	= False
+
+		self._timer = QTimer(self)
+		self._timer.setSingleShot(True)
+		self._timer.setInterval(interval)
+		self._timer.timeout.connect(self.flush)
+
+	@property
+	def watching(self):
+		return bool(self.callbacks)
+
+	@property
+	def pending(self):
+		"""True while a notification waits for the next frame."""
+		return self._timer.isActive()
+
+	def watch(self):
+		"""Register the scene and event callbacks."""
+		if self.callbacks:
+			return
+		for name in SCENE_MESSAGES:
+			message = getattr(om2.MSceneMessage, name, None)
+			if message is not None:
+				self.callbacks.append(om2.MSceneMessage.addCallback(message, self._on_scene_message))
+		for event in VALUE_EVENTS:
+			self.callbacks.append(om2.MEventMessage.addEventCallback(event, self._on_value_event))
+
+	def teardown(self):
+		"""Remove every callback and drop pending notifications."""
+		self._timer.stop()
+		self._scene_dirty = self._values_dirty = False
+		for callback_id in self.callbacks:
+			try:
+				om2.MMessage.removeCallback(callback_id)
+			except RuntimeError as e:
+				logging.warning(f"Failed to remove scene callback: {e}")
+		self.callbacks = []
+
+	def flush(self):
+		"""Emit the pending notification; a scene change covers any value change."""
+		self._timer.stop()
+		if self._scene_dirty:
+			self._scene_dirty = self._values_dirty = False
+			self.sceneChanged.emit()
+		elif self._values_dirty:
+			self._values_dirty = False
+			self.valuesChanged.emit()
+
+	def _on_scene_message(self, *args):
+		self._scene_dirty = True
+		self._timer.start()
+
+	def _on_value_event(self, *args):
+		self._values_dirty = True
+		if not self._timer.isActive():
+			self._timer.start()
@@ -0,0 +1,97 @@
+import numpy as np
+
+# Grams of up to this many characters are indexed; longer terms intersect their trigrams and are then verified
+GRAM = 3
+
+def grams(text, size=GRAM):
+	"""Return every distinct substring of text of 1 to size characters."""
+	found = set(text)
+	for length in range(2, size + 1):
+		found.update([text[i:i + length] for i in range(len(text) - length + 1)])
+	return found
+
+
+class SearchIndex(object):
+	"""Substring search over the texts of many items, answered from a prebuilt n-gram index.
+
+	Each item is indexed under the 1-, 2- and 3-character grams of its
+	lowercase texts. A query is split on whitespace and every term must
+	occur in one of the texts, case-insensitively. Posting lists are int
+	bitsets over item numbers: a term of up to three characters is one
+	lookup, a longer one the AND of its trigrams, checked against the texts
+	to drop false positives. A query that only extends the previous one
+	narrows the previous result instead of starting over, which is the
+	common case while typing.
+	"""
+	def __init__(self):
+		self.items 		= []
+		self.texts 		= []			# item number -> lowercase texts joined by newlines
+		self.postings 	= {}			# gram -> bitset of item numbers
+		self._pending 	= {}			# gram -> item numbers added since the last search
+		self._last 		= ((), 0)		# (terms, bitset) of the previous query
+
+	def add(self, item, *texts):
+		"""Index an item under the given texts."""
+		number 	= len(self.items)
+		text 	= "\n".join(text.lower() for text in texts if text)
+		self.items.append(item)
+		self.texts.append(text)
+		pending = self._pending
+		for gram in grams(text):
+			if gram in pending:
+				pending[gram].append(number)
+			else:
+				pending[gram] = [number]
+		self._last = ((), 0)
+
+	def __len__(self):
+		return len(self.items)
+
+	def search(self, query):
+		"""Return the items matching every whitespace-separated term of query, in the order added."""
+		terms = tuple(query.lower().split())
+		if not terms:
+			return list(self.items)
+		if self._pending:
+			self.build()
+		last_terms, last_bits = self._last
+		if last_terms and len(terms) >= len(last_terms) and all(old in new for old, new in zip(last_terms, terms)):
+			# Typing on: every match must already have matched the shorter query
+			bits = last_bits
+		else:
+			bits = (1 << len(self.items)) - 1
+		for term in terms:
+			bits &= self._match(term, bits)
+			if not bits:
+				break
+		self._last = (terms, bits)
+		return [self.items[number] for number in self._numbers(bits)]
+
+	def _match(self, term, candidates):
+		if len(term) <= GRAM:
+			return self.postings.get(term, 0)
+		bits = candidates
+		for i in range(len(term) - GRAM + 1):
+			bits &= self.postings.get(term[i:i + GRAM], 0)
+			if not bits:
+				return 0
+		# Trigrams can all occur without the term itself; check the candidates left
+		texts = self.texts
+		false = [number for number in self._numbers(bits) if term not in texts[number]]
+		return bits & ~self._bitset(false) if false else bits
+
+	def build(self):
+		"""Merge the items added since the last search into the posting bitsets."""
+		for gram, numbers in self._pending.items():
+			self.postings[gram] = self.postings.get(gram, 0) | self._bitset(numbers)
+		self._pending = {}
+
+	def _bitset(self, numbers):
+		flags = np.zeros(len(self.items), dtype=bool)
+		flags[numbers] = True
+		return int.from_bytes(np.packbits(flags, bitorder='little').tobytes(), 'little')
+
+	def _numbers(self, bits):
+		"""Return the item numbers set in a bitset, lowest first."""
+		data = np.frombuffer(bits.to_bytes((len(self.items) + 7) // 8, 'little'), dtype=np.uint8)
+		return np.flatnonzero(np.unpackbits(data, bitorder='little')).tolist()
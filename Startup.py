@@ -0,0 +1,88 @@
+import os
+import sys
+import time
+import logging
+import importlib
+
+# Set ATTR_CONTROLLER_DEV=1 while editing the tool: its modules are then reloaded every time mainCoreC is imported
+DEV_MODE = os.environ.get("ATTR_CONTROLLER_DEV", "0").lower() in ("1", "true", "yes")
+
+# Imports plus window construction should stay under this many milliseconds
+STARTUP_BUDGET_MS = float(os.environ.get("ATTR_CONTROLLER_STARTUP_BUDGET_MS", 250.0))
+
+# module name -> (milliseconds, 'eager' | 'lazy' | 'reload'), in import order
+IMPORT_TIMES = {}
+
+
+def load(name, reload=None):
+	"""Import a module and record how long it took.
+
+	Tool modules pass reload=None and are reloaded only in dev mode;
+	third-party modules pass reload=False and are never reloaded.
+	"""
+	reload = DEV_MODE if reload is None else reload
+	start = time.perf_counter()
+	module = sys.modules.get(name)
+	if module is None:
+		kind = 'eager'
+		module = importlib.import_module(name)
+	elif reload:
+		kind = 'reload'
+		module = importlib.reload(module)
+	else:
+		return module
+	IMPORT_TIMES[name] = ((time.perf_counter() - start) * 1000.0, kind)
+	return module
+
+
+class LazyModule(object):
+	"""Stand-in for a module imported the first time one of its attributes is used."""
+	def __init__(self, name, reload=None):
+		self.__dict__['_name'] 		= name
+		self.__dict__['_reload'] 	= reload
+		self.__dict__['_module'] 	= None
+
+	@property
+	def loaded(self):
+		return self.__dict__['_module'] is not None
+
+	def __getattr__(self, attribute):
+		module = self.__dict__['_module']
+		if module is None:
+			name = self.__dict__['_name']
+			already = name in sys.modules
+			module = self.__dict__['_module'] = load(name, self.__dict__['_reload'])
+			if not already:
+				IMPORT_TIMES[name] = (IMPORT_TIMES[name][0], 'lazy')
+		return getattr(module, attribute)
+
+	def __repr__(self):
+		state = "loaded" if self.loaded else "not loaded"
+		return f"<lazy module '{self.__dict__['_name']}' ({state})>"
+
+
+def lazy(name, reload=None):
+	"""Return a LazyModule for name; see load() for reload."""
+	return LazyModule(name, reload)
+
+
+def import_report():
+	"""Return the lines of the import-time profile, slowest first."""
+	lines = [f"Imports ({'dev, reloading' if DEV_MODE else 'production'}):"]
+	for name, (elapsed, kind) in sorted(IMPORT_TIMES.items(), key=lambda item: -item[1][0]):
+		lines.append(f"  {name:<28}{elapsed:8.1f} ms  {kind}")
+	return lines
+
+
+def import_total(kinds=('eager', 'reload')):
+	"""Return the milliseconds spent in imports of the given kinds."""
+	return sum(elapsed for elapsed, kind in IMPORT_TIMES.values() if kind in kinds)
+
+
+def check_budget(window_ms):
+	"""Warn if imports plus window_ms exceed the startup budget. Returns the total."""
+	total = import_total() + window_ms
+	if total > STARTUP_BUDGET_MS:
+		logging.warning(f"Attribute controller startup took {total:.0f} ms, over its {STARTUP_BUDGET_MS:.0f} ms "
+						f"budget; see Help > Startup Report.")
+	return total
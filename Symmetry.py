@@ -0,0 +1,69 @@
+import re
+
+# Side tokens swapped to find the opposite control: con_world_L <-> con_world_R, L_arm <-> R_arm, ...
+SIDE_PATTERN = re.compile(r'(?<![A-Za-z])(L|R|l|r|Left|Right|left|right)(?![a-z])')
+OPPOSITE_SIDE = {'L': 'R', 'R': 'L', 'l': 'r', 'r': 'l',
+				 'Left': 'Right', 'Right': 'Left', 'left': 'right', 'right': 'left'}
+
+# Attributes whose value changes sign on the other side (behaviour mirroring across the YZ plane)
+MIRROR_SIGNS = {
+	'translateX': -1.0,
+	'rotateY'	: -1.0,
+	'rotateZ'	: -1.0,
+}
+
+
+def mirror_name(control):
+	"""Return the name of the opposite-side control, or None if the name has no side token."""
+	namespace, _, name = control.rpartition(':')
+	mirrored, count = SIDE_PATTERN.subn(lambda match: OPPOSITE_SIDE[match.group(1)], name)
+	if not count or mirrored == name:
+		return None
+	return f"{namespace}:{mirrored}" if namespace else mirrored
+
+
+class SymmetryTable(object):
+	"""Precomputed left/right pairing of plugs with the sign applied on the opposite side.
+
+	Built once from the bound plugs; afterwards mirroring a value is a single
+	dict lookup and a multiply.
+	"""
+	def __init__(self, signs=MIRROR_SIGNS):
+		self.signs = dict(signs)
+		self.pairs = {}		# (control, attribute) -> ((mirror control, attribute), sign)
+
+	@classmethod
+	def build(cls, plug_cache, plugs, signs=MIRROR_SIGNS):
+		"""Pair every plug with its opposite-side plug where that exists in the scene."""
+		table = cls(signs)
+		for control, attribute in plugs:
+			mirror = mirror_name(control)
+			if mirror and plug_cache.exists(mirror, attribute):
+				sign = table.signs.get(attribute, 1.0)
+				table.pairs[(control, attribute)] = ((mirror, attribute), sign)
+				table.pairs[(mirror, attribute)] = ((control, attribute), sign)
+		return table
+
+	def __len__(self):
+		return len(self.pairs) // 2
+
+	def __contains__(self, key):
+		return key in self.pairs
+
+	def get(self, key):
+		"""Return (mirror key, sign) of a plug, or None if it has no pair."""
+		return self.pairs.get(key)
+
+	def linked(self, key):
+		"""Return the plug and, if it has one, its opposite-side plug."""
+		pair = self.pairs.get(key)
+		return [key, pair[0]] if pair else [key]
+
+	def mirrored(self, values):
+		"""Return values plus the opposite side of every paired plug not given explicitly."""
+		result = dict(values)
+		for key, value in values.items():
+			pair = self.pairs.get(key)
+			if pair and pair[0] not in values:
+				result[pair[0]] = pair[1] * value
+		return result
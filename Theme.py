@@ -0,0 +1,69 @@
+# The tool's look, set once on the window so Qt parses it once for every widget below it.
+# Hover and pressed are pseudo-states Qt tracks itself; 'modified' is a dynamic property set by set_state().
+STYLESHEET = """
+QSlider::groove:horizontal {
+	border: 1px solid #999;
+	height: 6px;
+	background: #ccc;
+	margin: 0px;
+	border-radius: 3px;
+}
+QSlider::handle:horizontal {
+	background: #5c5c5c;
+	border: 1px solid #444;
+	width: 14px;
+	margin: -5px 0;
+	border-radius: 7px;
+}
+QSlider::handle:horizontal:hover {
+	background: #787878;
+	border: 1px solid #555;
+}
+QSlider::handle:horizontal:pressed {
+	background: #409eff;
+	border: 1px solid #2d7fd6;
+}
+QSlider::sub-page:horizontal {
+	background: #409eff;
+	border: 1px solid #5a9;
+	height: 6px;
+	border-radius: 3px;
+}
+QSlider[modified="true"]::sub-page:horizontal {
+	background: #e6a23c;
+	border: 1px solid #c98a2a;
+}
+QSlider::add-page:horizontal {
+	background: #ccc;
+	border: 1px solid #999;
+	height: 6px;
+	border-radius: 3px;
+}
+"""
+
+
+def apply(root):
+	"""Style root and everything parented under it, including docks and dialogs."""
+	root.setStyleSheet(STYLESHEET)
+
+
+def set_state(widget, name, value):
+	"""Set a dynamic property the stylesheet selects on; only a change re-polishes the widget.
+
+	An unset property counts as False, so widgets left in their default
+	state are never re-polished.
+	"""
+	current = widget.property(name)
+	if current == value or (current is None and not value):
+		return False
+	widget.setProperty(name, value)
+	style = widget.style()
+	style.unpolish(widget)
+	style.polish(widget)
+	widget.update()
+	return True
+
+
+def set_modified(slider, modified):
+	"""Tint a slider whose value differs from its default."""
+	return set_state(slider, 'modified', bool(modified))
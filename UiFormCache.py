@@ -0,0 +1,168 @@
+import os
+import sys
+import shutil
+import hashlib
+import logging
+import functools
+import subprocess
+import importlib.util
+import xml.etree.ElementTree as ET
+
+import PySide2
+from PySide2 import QtWidgets
+
+# Compiled forms live on local disk, away from network-mounted tool directories
+CACHE_DIR = os.environ.get("ATTR_CONTROLLER_FORM_CACHE",
+						   os.path.join(os.path.expanduser("~"), ".cache", "mayaAttributeController", "forms"))
+
+# Digests whose form could not be compiled or imported; they go straight to QUiLoader until restart
+FAILED_DIGESTS = set()
+
+
+def file_digest(path):
+	"""Hash a .ui file together with the PySide2 version its form is compiled for."""
+	digest = hashlib.sha1(PySide2.__version__.encode())
+	with open(path, 'rb') as f:
+		digest.update(f.read())
+	return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def find_uic():
+	"""Return the command line prefix of an available .ui compiler, or None. Searched once per process."""
+	maya_bin = os.path.dirname(sys.executable)
+	for name in ("uic", "uic.exe"):
+		path = os.path.join(maya_bin, name)
+		if os.path.isfile(path):
+			return (path, "-g", "python")
+	path = shutil.which("pyside2-uic")
+	if path:
+		return (path,)
+	path = shutil.which("uic")
+	if path:
+		return (path, "-g", "python")
+	return None
+
+
+class UiFormCache(object):
+	"""Compile .ui files into Python form classes cached by content hash.
+
+	A changed .ui file gets a new hash and is compiled again; load() returns
+	None when no form can be produced so callers can fall back to QUiLoader.
+	A digest that failed once is not retried for the life of the process.
+	"""
+	def __init__(self, cache_dir=CACHE_DIR):
+		self.cache_dir 	= cache_dir
+		self.hits 		= 0
+		self.misses 	= 0
+		self._digests 	= {}	# (path, mtime, size) -> digest
+		self._forms 	= {}	# digest -> (form class, top-level widget class name)
+
+	def digest(self, ui_file):
+		"""Return the content hash of a .ui file, rehashing only when it changes on disk."""
+		stat = os.stat(ui_file)
+		key = (os.path.abspath(ui_file), stat.st_mtime, stat.st_size)
+		digest = self._digests.get(key)
+		if digest is None:
+			digest = self._digests[key] = file_digest(ui_file)
+		return digest
+
+	def form_class(self, ui_file):
+		"""Return (form class, widget class name) for a .ui file, compiling it on a miss."""
+		digest = self.digest(ui_file)
+		form = self._forms.get(digest)
+		if form:
+			self.hits += 1
+			return form
+		if digest in FAILED_DIGESTS:
+			return None
+		form = self._import(ui_file, digest)
+		if form is None:
+			FAILED_DIGESTS.add(digest)
+		return form
+
+	def _import(self, ui_file, digest):
+		"""Compile the form of a digest if needed and import it. Returns None on failure."""
+		module_path = os.path.join(self.cache_dir, f"form_{digest}.py")
+		if os.path.exists(module_path):
+			self.hits += 1
+		else:
+			self.misses += 1
+			if not self.compile(ui_file, module_path):
+				return None
+
+		try:
+			spec = importlib.util.spec_from_file_location(f"form_{digest}", module_path)
+			module = importlib.util.module_from_spec(spec)
+			spec.loader.exec_module(module)
+		except Exception as e:
+			logging.warning(f"Failed to import compiled form for {ui_file}: {e}")
+			return None
+
+		form_classes = [value for name, value in vars(module).items() if name.startswith("Ui_")]
+		if not form_classes:
+			return None
+		form = self._forms[digest] = (form_classes[0], module.BASE_CLASS)
+		return form
+
+	def load(self, ui_file, parent=None):
+		"""Build the widget of a .ui file from its cached form, or return None."""
+		form = self.form_class(ui_file)
+		if not form:
+			return None
+		form_class, base_class = form
+		widget_class = getattr(QtWidgets, base_class, QtWidgets.QWidget)
+		widget = widget_class(parent)
+		ui_form = form_class()
+		try:
+			ui_form.setupUi(widget)
+		except Exception as e:
+			logging.warning(f"Compiled form for {ui_file} failed to build: {e}")
+			widget.deleteLater()
+			return None
+		# Expose child widgets as attributes of the widget, like QUiLoader does
+		for name, value in vars(ui_form).items():
+			setattr(widget, name, value)
+		return widget
+
+	def compile(self, ui_file, module_path):
+		"""Compile a .ui file into module_path. Returns True on success."""
+		uic = find_uic()
+		if not uic:
+			logging.info("No .ui compiler found; using QUiLoader.")
+			return False
+		try:
+			base_class = ET.parse(ui_file).getroot().find("widget").get("class")
+		except (ET.ParseError, AttributeError) as e:
+			logging.warning(f"Cannot read top-level widget of {ui_file}: {e}")
+			return False
+
+		os.makedirs(self.cache_dir, exist_ok=True)
+		temp_path = f"{module_path}.{os.getpid()}.tmp"
+		try:
+			subprocess.check_call(list(uic) + [ui_file, "-o", temp_path],
+								  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+			with open(temp_path, 'a') as f:
+				f.write(f"\nBASE_CLASS = {base_class!r}\n")
+			os.replace(temp_path, module_path)
+		except (OSError, subprocess.CalledProcessError) as e:
+			logging.warning(f"Failed to compile {ui_file}: {e}")
+			if os.path.exists(temp_path):
+				os.remove(temp_path)
+			return False
+		logging.info(f"Compiled {ui_file} -> {module_path}")
+		return True
+
+	def build(self, ui_dir):
+		"""Precompile every .ui file in a directory. Returns the number of forms ready."""
+		ready = 0
+		for name in sorted(os.listdir(ui_dir)):
+			if name.endswith(".ui") and self.form_class(os.path.join(ui_dir, name)):
+				ready += 1
+		return ready
+
+
+if __name__ == "__main__":
+	logging.basicConfig(level=logging.INFO)
+	ui_dir = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(os.path.abspath(__file__)), "ui")
+	print(f"{UiFormCache().build(ui_dir)} forms ready in {CACHE_DIR}")
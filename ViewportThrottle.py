@@ -0,0 +1,98 @@
+import logging
+import maya.cmds as cmds
+from PySide2.QtCore import QObject, QTimer
+
+import Instrumentation
+
+# Viewport redraws per second while a slider is dragged; 0 leaves Maya refreshing on every change
+DEFAULT_FPS = 15
+
+# displayAppearance used by every model panel during a drag when proxy display is on
+PROXY_APPEARANCE = 'boundingBox'
+
+
+class ViewportThrottle(QObject):
+	"""Cap viewport redraws while a slider is dragged.
+
+	begin() switches every model panel to a cheap display appearance if
+	proxy display is on and, unless fps is 0, suspends Maya's own refresh
+	handling. While the drag lasts, the current view is then redrawn at most
+	fps times per second and only when something changed. end() restores the panels, resumes refresh
+	handling and redraws once.
+
+	Each redraw is timed as a maya span of the given Profiler, and every
+	change that did not cause a redraw is counted as a 'redraw skipped' mark.
+	"""
+	def __init__(self, fps=DEFAULT_FPS, proxy=False, profiler=None, parent=None):
+		super(ViewportThrottle, self).__init__(parent)
+		self.fps 		= fps
+		self.proxy 		= proxy
+		self.profiler 	= profiler or Instrumentation.Profiler(enabled=False)
+		self.active 	= False
+		self.dirty 		= False
+		self.redraws 	= 0
+		self.skipped 	= 0
+		self._appearance = {}		# model panel -> displayAppearance before the drag
+
+		self._timer = QTimer(self)
+		self._timer.timeout.connect(self._redraw)
+
+	def begin(self):
+		"""Enter drag mode."""
+		if self.active or not (self.fps or self.proxy):
+			return
+		self.active = True
+		self.dirty 	= False
+		if self.proxy:
+			self._set_proxy()
+		if self.fps:
+			cmds.refresh(suspend=True)
+			self._timer.start(max(1, int(1000.0 / self.fps)))
+
+	def changed(self):
+		"""Note that the scene changed; the next frame tick redraws it."""
+		if not self._timer.isActive():
+			return
+		if self.dirty:
+			self.skipped += 1
+			self.profiler.mark(Instrumentation.MAYA, 'redraw skipped')
+		self.dirty = True
+
+	def end(self):
+		"""Leave drag mode and redraw once at full quality."""
+		if not self.active:
+			return
+		self._timer.stop()
+		self.active = False
+		self.dirty 	= False
+		self._restore_proxy()
+		cmds.refresh(suspend=False)
+		with self.profiler.span(Instrumentation.MAYA, 'final redraw'):
+			cmds.refresh(force=True)
+
+	def _redraw(self):
+		if not self.dirty:
+			return
+		self.dirty = False
+		self.redraws += 1
+		with self.profiler.span(Instrumentation.MAYA, 'viewport redraw'):
+			cmds.refresh(suspend=False)
+			cmds.refresh(currentView=True, force=True)
+			cmds.refresh(suspend=True)
+
+	def _set_proxy(self):
+		self._appearance = {}
+		for panel in cmds.getPanel(type='modelPanel') or []:
+			try:
+				self._appearance[panel] = cmds.modelEditor(panel, query=True, displayAppearance=True)
+				cmds.modelEditor(panel, edit=True, displayAppearance=PROXY_APPEARANCE)
+			except RuntimeError as e:
+				logging.warning(f"Failed to set proxy display on {panel}: {e}")
+
+	def _restore_proxy(self):
+		for panel, appearance in self._appearance.items():
+			try:
+				cmds.modelEditor(panel, edit=True, displayAppearance=appearance)
+			except RuntimeError as e:
+				logging.warning(f"Failed to restore display on {panel}: {e}")
+		self._appearance = {}
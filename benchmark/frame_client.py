@@ -0,0 +1,170 @@
+"""Stand-in external driver load-testing the frame server.
+
+By default it starts FrameServer's receiver in-process on a Unix socket in a
+temporary directory, drains it from a thread the way the window does once
+per UI frame, and streams frames into it from one or more client threads -
+no Maya and no network. Point it at a running tool instead with --socket or
+--port. Reports decode cost, dropped frames and send-to-apply latency:
+
+	python benchmark/frame_client.py --clients 2 --rate 120 --ui-ms 12
+"""
+import os
+import sys
+import json
+import time
+import random
+import socket
+import argparse
+import tempfile
+import threading
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+import FrameServer
+
+
+def percentile(samples, q):
+	return float(np.percentile(samples, q)) if samples else 0.0
+
+
+def connect(address):
+	"""Connect to a Unix socket path or (host, port) and read the schema the server sends first."""
+	if isinstance(address, str):
+		sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	else:
+		sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+	sock.connect(address)
+	header = recv_exactly(sock, FrameServer.SCHEMA_LENGTH.size)
+	length, = FrameServer.SCHEMA_LENGTH.unpack(header)
+	return sock, json.loads(recv_exactly(sock, length))
+
+
+def recv_exactly(sock, size):
+	data = bytearray()
+	while len(data) < size:
+		chunk = sock.recv(size - len(data))
+		if not chunk:
+			raise ConnectionError("server closed the connection")
+		data.extend(chunk)
+	return bytes(data)
+
+
+def drive(address, args, seed, sent):
+	"""Stream frames of every schema binding following a sine wave; count what was sent."""
+	sock, schema = connect(address)
+	ids 		= np.array([entry['id'] for entry in schema][:args.bindings], dtype=np.uint16)
+	phases 		= np.linspace(0.0, np.pi, len(ids))
+	rng 		= random.Random(seed)
+	interval 	= 1.0 / args.rate if args.rate else 0.0
+	deadline 	= time.perf_counter() + args.seconds
+	sequence 	= 0
+	held 		= None
+	try:
+		while time.perf_counter() < deadline:
+			sequence += 1
+			values = np.sin(phases + sequence * 0.05) * 5.0
+			frame = FrameServer.encode_frame(sequence, ids, values)
+			if held is None and rng.random() < args.reorder:
+				# Deliver this frame after the next one, as a late packet would arrive
+				held = frame
+				continue
+			sock.sendall(frame + held if held else frame)
+			sent[seed] += 2 if held else 1
+			held = None
+			if interval:
+				time.sleep(interval)
+	finally:
+		sock.close()
+
+
+def consume(receiver, args, stop, latencies, drains):
+	"""Drain the mailbox once per UI frame, spending --ui-ms on each drain like a busy window would."""
+	interval = FrameServer.DRAIN_INTERVAL_MS / 1000.0
+	while not stop.is_set():
+		time.sleep(interval)
+		values, sent = receiver.take()
+		if not values:
+			continue
+		latencies.append((time.time() - sent) * 1000.0)
+		drains.append(len(values))
+		if args.ui_ms:
+			time.sleep(args.ui_ms / 1000.0)
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument('--clients', type=int, default=1, help="concurrent driver connections")
+	parser.add_argument('--rate', type=float, default=120.0, help="frames per second per client, 0 for unthrottled")
+	parser.add_argument('--seconds', type=float, default=3.0, help="how long each client streams")
+	parser.add_argument('--bindings', type=int, default=64, help="bindings per frame")
+	parser.add_argument('--reorder', type=float, default=0.0, help="fraction of frames delivered late, out of order")
+	parser.add_argument('--ui-ms', type=float, default=0.0, help="simulated UI work per drain (in-process server)")
+	parser.add_argument('--socket', help="connect to a running tool on this Unix socket path")
+	parser.add_argument('--port', type=int, help="connect to a running tool on this loopback port")
+	parser.add_argument('--json', help="also write the results to this file")
+	args = parser.parse_args(argv)
+
+	receiver = None
+	if args.socket:
+		address = args.socket
+	elif args.port:
+		address = (FrameServer.DEFAULT_HOST, args.port)
+	else:
+		schema = [{'id': i, 'control': f"con_stub_{i}", 'attribute': 'translateX'} for i in range(args.bindings)]
+		address = os.path.join(tempfile.mkdtemp(prefix="frame_client_"), "frames.sock")
+		receiver = FrameServer.FrameReceiver(schema, path=address)
+		receiver.start()
+
+	stop 		= threading.Event()
+	latencies 	= []
+	drains 		= []
+	sent 		= {seed: 0 for seed in range(args.clients)}
+	consumer 	= None
+	if receiver:
+		consumer = threading.Thread(target=consume, args=(receiver, args, stop, latencies, drains), daemon=True)
+		consumer.start()
+
+	start = time.perf_counter()
+	clients = [threading.Thread(target=drive, args=(address, args, seed, sent)) for seed in range(args.clients)]
+	for client in clients:
+		client.start()
+	for client in clients:
+		client.join()
+	elapsed = time.perf_counter() - start
+
+	results = {
+		'clients'		: args.clients,
+		'frames_sent'	: sum(sent.values()),
+		'send_rate'		: sum(sent.values()) / elapsed,
+		'frame_bytes'	: FrameServer.HEADER.size + args.bindings * FrameServer.ENTRY_DTYPE.itemsize,
+	}
+	if receiver:
+		time.sleep(0.1)
+		stop.set()
+		consumer.join()
+		receiver.stop()
+		results.update({
+			'frames_received'		: receiver.received,
+			'frames_stale'			: receiver.stale,
+			'values_superseded'		: receiver.superseded,
+			'drains'				: len(drains),
+			'decode_us_per_frame'	: receiver.decode_time * 1e6 / max(receiver.received, 1),
+			'latency_ms_p50'		: percentile(latencies, 50),
+			'latency_ms_p99'		: percentile(latencies, 99),
+		})
+
+	for key, value in results.items():
+		print(f"{key:<24}{value:12.2f}" if isinstance(value, float) else f"{key:<24}{value:12d}")
+	if args.json:
+		with open(args.json, 'w') as f:
+			json.dump(results, f, indent=2)
+	return results
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,435 @@
+"""Headless benchmark of the attribute controller hot paths.
+
+Runs MyWindow under offscreen Qt against the counting stand-ins in
+benchmark/stubs (maya.cmds, maya.api.OpenMaya, Collapsible) and scripts slider
+and macro drags, line-edit commits, reset clicks, external attribute
+changes, search keystrokes and large preset file loads. Reports p50/p99
+latency per interaction, setAttr/getAttr call counts and window startup
+time, so hot-path regressions show up on a plain Linux box:
+
+	python benchmark/run_benchmark.py --latency-us 50 --json bench.json
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from xml.sax.saxutils import escape
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+sys.path[:0] = [os.path.join(HERE, 'stubs'), ROOT]
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ.setdefault('ATTR_CONTROLLER_PROFILE', '1')
+
+from PySide2.QtWidgets import QApplication
+
+from maya import _fake
+from maya._fake import SCENE_STATE, CALLS
+
+SET_CALLS = ('setAttr', 'MPlug.setDouble', 'MDGModifier.newPlugValueDouble')
+GET_CALLS = ('getAttr', 'MPlug.asDouble')
+
+
+# =======================================================================================================
+# Scene and UI fixtures
+# =======================================================================================================
+def build_scene(registry, rig_file=None):
+	"""Create every bound control with its attributes at their defaults, plus unbound translates to discover."""
+	for binding in registry:
+		node = SCENE_STATE.nodes.get(binding.control) or SCENE_STATE.create(binding.control)
+		value = float(binding.default if binding.default is not None else binding.minimum or 0.0)
+		node.attrs[binding.attribute] 		= _fake.to_internal(binding.attribute, value)
+		node.defaults[binding.attribute] 	= value
+		node.limits[binding.attribute] = (binding.minimum, binding.maximum)
+	for node in SCENE_STATE.nodes.values():
+		for attribute in ('translateX', 'translateY', 'translateZ'):
+			node.attrs.setdefault(attribute, 0.0)
+	if rig_file:
+		with open(rig_file, 'w') as f:
+			f.write("//Maya ASCII scene standing in for the rig\n")
+		SCENE_STATE.scene_name = rig_file
+
+
+def form_xml(bindings, with_tab_button=False):
+	"""Return a .ui document with one slider row per binding in a CollapseLayout."""
+	items = []
+	if with_tab_button:
+		items.append('<item><widget class="QPushButton" name="pushButton_2"/></item>')
+	for binding in bindings:
+		items.append(f'<item><widget class="QSlider" name="{escape(binding.slider)}">'
+					 '<property name="orientation"><enum>Qt::Horizontal</enum></property>'
+					 '<property name="minimum"><number>-100</number></property>'
+					 '<property name="maximum"><number>100</number></property></widget></item>')
+		if binding.line_edit:
+			items.append(f'<item><widget class="QLineEdit" name="{escape(binding.line_edit)}"/></item>')
+		if binding.reset:
+			items.append(f'<item><widget class="QPushButton" name="{escape(binding.reset)}"/></item>')
+	return ('<?xml version="1.0" encoding="UTF-8"?>\n<ui version="4.0"><class>Form</class>'
+			'<widget class="QWidget" name="Form"><layout class="QVBoxLayout" name="CollapseLayout">'
+			+ ''.join(items) +
+			'</layout></widget><resources/><connections/></ui>\n')
+
+
+def write_forms(ui_dir, registry, tabs):
+	"""Write synthetic main02.ui and body-part .ui files for the bound widgets."""
+	os.makedirs(ui_dir, exist_ok=True)
+	with open(os.path.join(ui_dir, 'main02.ui'), 'w') as f:
+		f.write(form_xml(registry.in_ui('ui'), with_tab_button=True))
+	for title, ui_name, ui_file in tabs:
+		with open(os.path.join(ui_dir, os.path.basename(ui_file)), 'w') as f:
+			f.write(form_xml(registry.in_ui(ui_name)))
+
+
+def use_ui_dir(module, ui_dir):
+	"""Point the tool at a directory of .ui files."""
+	module.SCRIPT_LOC = os.path.dirname(ui_dir)
+	module.BODY_PART_TABS = [(title, ui_name, os.path.join(ui_dir, os.path.basename(ui_file)))
+							 for title, ui_name, ui_file in module.BODY_PART_TABS]
+
+
+# =======================================================================================================
+# Measurement
+# =======================================================================================================
+def percentile(samples, pct):
+	ordered = sorted(samples)
+	return ordered[min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))]
+
+
+class Recorder(object):
+	"""Latency samples and Maya call counts per interaction."""
+	def __init__(self):
+		self.samples 	= {}
+		self.calls 		= {}
+
+	def measure(self, interaction, func):
+		before = dict(CALLS)
+		start = time.perf_counter()
+		func()
+		elapsed = (time.perf_counter() - start) * 1000.0
+		self.samples.setdefault(interaction, []).append(elapsed)
+		calls = self.calls.setdefault(interaction, {'set': 0, 'get': 0})
+		calls['set'] += sum(CALLS[name] - before.get(name, 0) for name in SET_CALLS)
+		calls['get'] += sum(CALLS[name] - before.get(name, 0) for name in GET_CALLS)
+
+	def report(self):
+		rows = {}
+		for interaction, samples in self.samples.items():
+			rows[interaction] = {
+				'count'		: len(samples),
+				'p50_ms'	: percentile(samples, 50),
+				'p99_ms'	: percentile(samples, 99),
+				'setAttr'	: self.calls[interaction]['set'],
+				'getAttr'	: self.calls[interaction]['get'],
+			}
+		return rows
+
+
+def wait_until(app, condition, timeout=0.5):
+	"""Process events until condition() holds. Returns False on timeout."""
+	end = time.perf_counter() + timeout
+	while not condition():
+		if time.perf_counter() > end:
+			return False
+		app.processEvents()
+	return True
+
+
+def drag(app, recorder, slider, ticks, tick_interval, kind='slider'):
+	"""Drag a slider back and forth, pacing ticks like mouse move events."""
+	slider.setSliderDown(True)
+	origin = slider.value()
+	for i in range(ticks):
+		value = origin + (i % 40 if (i // 40) % 2 == 0 else 40 - i % 40) - 20
+		next_tick = time.perf_counter() + tick_interval
+		recorder.measure(f'{kind} tick', lambda: (slider.setValue(value), app.processEvents()))
+		while time.perf_counter() < next_tick:
+			app.processEvents()
+	recorder.measure(f'{kind} release', lambda: (slider.setSliderDown(False), app.processEvents()))
+
+
+def table_scaling(app, recorder, window, registry, rows):
+	"""Open the parameter table on a rig with the given number of rows, cycling the bound plugs."""
+	import BindingRegistry
+	import ParameterTable
+	bound = list(registry)
+	for count in rows:
+		bindings = BindingRegistry.BindingRegistry()
+		for i in range(count):
+			binding = bound[i % len(bound)]
+			bindings.add(BindingRegistry.SliderBinding(binding.ui, f"row{i}", binding.control, binding.attribute,
+													   minimum=binding.minimum, maximum=binding.maximum))
+		views = []
+		def open_table():
+			model = ParameterTable.ParameterModel(bindings, window.plug_cache.read)
+			views.append(ParameterTable.ParameterView(model))
+			views[-1].resize(400, 600)
+			views[-1].show()
+			app.processEvents()
+		recorder.measure(f"table open ({count} rows)", open_table)
+		views[-1].close()
+
+
+def search_scaling(recorder, registry, rows, query="neck scale"):
+	"""Index N rows by slider, control and attribute, then type a query one keystroke at a time."""
+	import SearchIndex
+	bound = list(registry)
+	for count in rows:
+		index = SearchIndex.SearchIndex()
+		def build():
+			for i in range(count):
+				binding = bound[i % len(bound)]
+				index.add(i, f"{binding.slider}{i}", f"char{i // len(bound):03d}:{binding.control}", binding.attribute)
+			index.build()
+		recorder.measure(f"search index ({count} rows)", build)
+		for end in range(1, len(query) + 1):
+			recorder.measure(f"search keystroke ({count} rows)", lambda: index.search(query[:end]))
+
+
+def style_scaling(app, recorder, counts):
+	"""Show N sliders styled by the window theme vs one setStyleSheet per slider."""
+	from PySide2.QtWidgets import QWidget, QVBoxLayout, QSlider
+	from PySide2.QtCore import Qt
+	import Theme
+	for count in counts:
+		for label, per_slider in (("theme", False), ("per-slider", True)):
+			root = QWidget()
+			if not per_slider:
+				Theme.apply(root)
+			def build():
+				layout = QVBoxLayout(root)
+				for i in range(count):
+					slider = QSlider(Qt.Horizontal)
+					if per_slider:
+						slider.setStyleSheet(Theme.STYLESHEET)
+					layout.addWidget(slider)
+				root.show()
+				app.processEvents()
+			recorder.measure(f"style {label} ({count})", build)
+			root.close()
+			root.deleteLater()
+		app.processEvents()
+
+
+def character_scaling(recorder, window, registry, counts, ticks):
+	"""Fan one slider out to N namespaced copies of the rig: batched frame flushes vs a cmds.setAttr loop."""
+	from maya import cmds
+	binding = next(iter(registry))
+	leads 	= [node for node in SCENE_STATE.nodes.values() if ':' not in node.name]
+	for count in counts:
+		namespaces = [f"char{i:03d}" for i in range(count)]
+		for namespace in namespaces:
+			for node in leads:
+				if f"{namespace}:{node.name}" not in SCENE_STATE.nodes:
+					SCENE_STATE.create(f"{namespace}:{node.name}", node.attrs)
+		window.set_targets(namespaces)
+		paths = window.plug_cache.paths(binding.control, binding.attribute)
+		for tick in range(ticks):
+			value = binding.from_slider(tick % 20)
+			window.write_queue.push(binding.control, binding.attribute, value)
+			recorder.measure(f"frame flush ({count} chars)", window.write_queue.flush)
+			recorder.measure(f"setAttr loop ({count} chars)", lambda: [cmds.setAttr(path, value) for path in paths])
+	window.set_targets([''])
+
+
+def preset_scaling(recorder, window, work_dir, counts):
+	"""Load N presets from a JSON file and from a preset library: parse everything vs map and read the index."""
+	import numpy as np
+	import PosePresets
+	import PresetLibrary
+	schema = window.presets.schema
+	for count in counts:
+		names 	= [f"preset{i:05d}" for i in range(count)]
+		presets = PosePresets.PresetSet.from_rows(schema, names, np.random.default_rng(count).random((count, len(schema))))
+		json_path 		= os.path.join(work_dir, f"presets{count}.json")
+		library_path 	= os.path.join(work_dir, f"presets{count}{PresetLibrary.EXTENSION}")
+		presets.save(json_path)
+		PresetLibrary.write_library(library_path, presets, {name: {'index': i} for i, name in enumerate(names)})
+		recorder.measure(f"preset load json ({count})", lambda: PosePresets.PresetSet.load(json_path).conform(schema))
+		libraries = []
+		recorder.measure(f"preset library open ({count})", lambda: libraries.append(PresetLibrary.PresetLibrary(library_path)))
+		recorder.measure(f"preset library fetch ({count})", lambda: libraries[-1].metadata(names[-1]))
+		for library in libraries:
+			library.close()
+
+
+def run(args):
+	_fake.LATENCY['cmds'] 	= args.latency_us / 1e6
+	_fake.LATENCY['api'] 	= args.latency_us / 1e6 * args.api_ratio
+	_fake.LATENCY['redraw'] = args.redraw_ms / 1e3
+	os.environ['ATTR_CONTROLLER_FORM_CACHE'] 	= os.path.join(args.work_dir, 'forms')
+	os.environ['ATTR_CONTROLLER_SCHEMA_CACHE'] 	= os.path.join(args.work_dir, 'schemas')
+
+	app = QApplication.instance() or QApplication(sys.argv)
+	start = time.perf_counter()
+	import mainCoreC
+	import Startup
+	import_ms = (time.perf_counter() - start) * 1000.0
+	import BindingRegistry
+
+	registry = BindingRegistry.BindingRegistry.load(mainCoreC.BINDINGS_SPEC)
+	build_scene(registry, os.path.join(args.work_dir, 'rig.ma'))
+	ui_dir = os.path.join(ROOT, 'ui')
+	if args.synthetic_ui or not os.path.isdir(ui_dir):
+		ui_dir = os.path.join(args.work_dir, 'ui')
+		write_forms(ui_dir, registry, mainCoreC.BODY_PART_TABS)
+	use_ui_dir(mainCoreC, ui_dir)
+
+	recorder 	= Recorder()
+	result 		= {'latency_us': args.latency_us, 'redraw_ms': args.redraw_ms, 'drag_fps': args.drag_fps}
+	result['import_ms'] = import_ms
+
+	# Startup: cold open, then a second open as show_window would do
+	windows = []
+	def open_window():
+		windows.append(mainCoreC.MyWindow())
+		windows[-1].show()
+		app.processEvents()
+	recorder.measure('startup (cold)', open_window)
+	windows[-1].close()
+	app.processEvents()
+	recorder.measure('startup (warm)', open_window)
+	window = windows[-1]
+	window.viewport.fps = args.drag_fps
+
+	# Closing hides the window; show_window reuses it and refreshes only what changed meanwhile
+	mainCoreC.get_maya_window 	= lambda: None
+	mainCoreC.my_window 		= window
+	first = next(iter(registry))
+	for i in range(5):
+		window.close()
+		app.processEvents()
+		SCENE_STATE.set(SCENE_STATE.nodes[first.control], first.attribute,
+						_fake.to_internal(first.attribute, first.from_slider(i + 1)))
+		recorder.measure('reopen (reused)', lambda: (mainCoreC.show_window(), app.processEvents()))
+
+	for tab in window.tabs:
+		recorder.measure('tab expand', tab.expand)
+	app.processEvents()
+	bindings = [binding for binding in registry if window.binding_widgets(binding)[0]]
+
+	# Typing into the search box filters rows and tabs on every keystroke, then clearing it restores them
+	for query in ("neck", "head scale", "foot"):
+		for end in range(1, len(query) + 1):
+			recorder.measure('search keystroke', lambda: (window.search_edit.setText(query[:end]), app.processEvents()))
+		window.search_edit.clear()
+
+	for binding in bindings:
+		slider, line_edit, reset_button = window.binding_widgets(binding)
+		drag(app, recorder, slider, args.ticks, args.tick_ms / 1000.0)
+
+		if line_edit:
+			line_edit.setText(f"{binding.from_slider(slider.value() + 3):.1f}")
+			recorder.measure('line edit commit', lambda: (line_edit.editingFinished.emit(), app.processEvents()))
+
+		if reset_button and binding.default is not None:
+			recorder.measure('reset click', lambda: (reset_button.click(), app.processEvents()))
+
+		# An edit from outside the tool, e.g. the channel box
+		node 	= SCENE_STATE.nodes[binding.control]
+		step 	= slider.value() - 5 if slider.value() - 5 >= slider.minimum() else slider.value() + 5
+		value 	= binding.from_slider(step)
+		def external_change():
+			SCENE_STATE.set(node, binding.attribute, _fake.to_internal(binding.attribute, value))
+			if not wait_until(app, lambda: slider.value() == binding.to_slider(value)):
+				print(f"warning: {binding.slider} did not refresh after an external change")
+		recorder.measure('external change', external_change)
+
+	# A macro drag mixes one value into several plugs; its ticks should cost about as much as a slider's
+	for macro in window.macros:
+		slider, line_edit = window.macro_widgets[macro.index]
+		drag(app, recorder, slider, args.ticks, args.tick_ms / 1000.0, 'macro')
+
+	# A recorded drag stays in memory; stopping keys it with one ktv setAttr per curve
+	window.record_action.setChecked(True)
+	drag(app, recorder, window.binding_widgets(bindings[0])[0], args.ticks, args.tick_ms / 1000.0, 'recorded')
+	recorder.measure('key commit', lambda: window.record_action.setChecked(False))
+	result['recording'] = {'samples': window.recorder.samples, 'curves': len(SCENE_STATE.curves),
+						   'keys': sum(len(keys) for keys in SCENE_STATE.curves.values())}
+
+	# Undo steps refresh only the bindings they changed
+	from maya import cmds
+	settled = lambda: not (window.scene_watcher.pending or window.dispatcher.dirty)
+	for i in range(min(args.undo_steps, len(SCENE_STATE.undo_queue))):
+		recorder.measure('undo', lambda: (cmds.undo(), wait_until(app, settled)))
+
+	table_scaling(app, recorder, window, registry, args.table_rows)
+	search_scaling(recorder, registry, args.table_rows)
+	style_scaling(app, recorder, args.styled_sliders)
+	character_scaling(recorder, window, registry, args.characters, max(1, args.ticks // 4))
+	preset_scaling(recorder, window, args.work_dir, args.presets)
+
+	window.close()
+	app.processEvents()
+
+	result['interactions'] 	= recorder.report()
+	result['write_queue'] 	= window.write_queue.stats()
+	result['echoes'] 		= window.dispatcher.suppressed
+	result['calls'] 		= dict(CALLS)
+	result['undo_entries'] 	= len(SCENE_STATE.undo_queue)
+	result['redraws'] 		= CALLS['viewport redraw']
+	result['rig_scan'] 		= {'bindings': len(window.bindings), 'cache hits': window.scanner.hits,
+							   'scans': window.scanner.misses}
+	result['spans'] 		= window.profiler.category_totals()
+	result['imports'] 		= {name: elapsed for name, (elapsed, kind) in Startup.IMPORT_TIMES.items()}
+	result['lazy_imports'] 	= [name for name, (elapsed, kind) in Startup.IMPORT_TIMES.items() if kind == 'lazy']
+	if args.trace:
+		window.profiler.export_chrome_trace(args.trace)
+	return result
+
+
+def print_report(result):
+	print(f"Simulated Maya call latency: {result['latency_us']} us, viewport redraw: {result['redraw_ms']} ms, "
+		  f"drag redraw rate: {result['drag_fps'] or 'unlimited'} fps")
+	print(f"{'interaction':<30}{'count':>7}{'p50 ms':>10}{'p99 ms':>10}{'setAttr':>10}{'getAttr':>10}")
+	for interaction, row in result['interactions'].items():
+		print(f"{interaction:<30}{row['count']:>7}{row['p50_ms']:>10.3f}{row['p99_ms']:>10.3f}"
+			  f"{row['setAttr']:>10}{row['getAttr']:>10}")
+	print(f"write queue: {result['write_queue']}")
+	print(f"echo events suppressed: {result['echoes']}")
+	print(f"undo queue entries: {result['undo_entries']}")
+	print(f"viewport redraws: {result['redraws']}")
+	print(f"key recording: {result['recording']}")
+	print(f"rig discovery: {result['rig_scan']}")
+	slowest = sorted(result['imports'].items(), key=lambda item: -item[1])[:5]
+	print(f"mainCoreC import: {result['import_ms']:.1f} ms, slowest tool modules: "
+		  + ", ".join(f"{name} {ms:.1f} ms" for name, ms in slowest))
+	print(f"imported on first use: {', '.join(result['lazy_imports']) or 'none'}")
+	print("time by category: " + ", ".join(f"{category} {ms:.1f} ms" for category, ms in result['spans'].items()))
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument('--latency-us', type=float, default=20.0, help="simulated cost of one maya.cmds call")
+	parser.add_argument('--api-ratio', type=float, default=0.1, help="API call cost relative to a cmds call")
+	parser.add_argument('--redraw-ms', type=float, default=2.0, help="simulated cost of one viewport redraw")
+	parser.add_argument('--drag-fps', type=int, default=15, help="viewport redraw cap while dragging, 0 for none")
+	parser.add_argument('--ticks', type=int, default=120, help="valueChanged ticks per slider drag")
+	parser.add_argument('--tick-ms', type=float, default=4.0, help="time between drag ticks")
+	parser.add_argument('--table-rows', type=int, nargs='*', default=[100, 1000, 10000],
+						help="parameter table sizes to open")
+	parser.add_argument('--characters', type=int, nargs='*', default=[1, 10, 50, 200],
+						help="numbers of namespaced characters to drive at once")
+	parser.add_argument('--styled-sliders', type=int, nargs='*', default=[100, 1000],
+						help="slider counts to style through the theme and one stylesheet each")
+	parser.add_argument('--presets', type=int, nargs='*', default=[100, 1000, 5000],
+						help="preset counts to load from JSON and from a preset library")
+	parser.add_argument('--undo-steps', type=int, default=20, help="undo steps to time after the interactions")
+	parser.add_argument('--synthetic-ui', action='store_true', help="generate .ui files even if ui/ exists")
+	parser.add_argument('--json', help="also write the results to this file")
+	parser.add_argument('--trace', help="write the tool's instrumentation spans as a Chrome trace")
+	args = parser.parse_args(argv)
+
+	with tempfile.TemporaryDirectory() as work_dir:
+		args.work_dir = work_dir
+		result = run(args)
+	print_report(result)
+	if args.json:
+		with open(args.json, 'w') as f:
+			json.dump(result, f, indent=1)
+	return result
+
+
+if __name__ == '__main__':
+	main()
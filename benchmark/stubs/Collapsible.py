@@ -0,0 +1,33 @@
+"""Stand-in for the studio Collapsible module, with the interface the tool relies on."""
+from PySide2.QtWidgets import QFrame, QPushButton, QVBoxLayout, QWidget
+
+
+class CollapsibleTab(QFrame):
+	def __init__(self, title, parent=None):
+		super(CollapsibleTab, self).__init__(parent)
+		self.main_layout = QVBoxLayout(self)
+		self.main_layout.setContentsMargins(0, 0, 0, 0)
+
+		self.toggle_button = QPushButton(title, self)
+		self.toggle_button.setCheckable(True)
+		self.toggle_button.setChecked(True)
+		self.toggle_button.clicked.connect(self.toggle_content)
+
+		self.content_area = QWidget(self)
+		self.content_layout = QVBoxLayout(self.content_area)
+		self.content_layout.setContentsMargins(0, 0, 0, 0)
+
+		self.main_layout.addWidget(self.toggle_button)
+		self.main_layout.addWidget(self.content_area)
+
+	def toggle_content(self):
+		self.content_area.setVisible(self.toggle_button.isChecked())
+		self.updateGeometry()
+
+	def expand(self):
+		self.toggle_button.setChecked(True)
+		self.toggle_content()
+
+	def collapse(self):
+		self.toggle_button.setChecked(False)
+		self.toggle_content()
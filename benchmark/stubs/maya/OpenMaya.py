@@ -0,0 +1 @@
+"""Stand-in for maya.OpenMaya (API 1.0); the tool imports it but drives Maya through API 2.0."""
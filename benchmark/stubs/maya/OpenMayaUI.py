@@ -0,0 +1,7 @@
+"""Stand-in for maya.OpenMayaUI; there is no Maya main window to parent to."""
+
+
+class MQtUtil(object):
+	@staticmethod
+	def mainWindow():
+		return None
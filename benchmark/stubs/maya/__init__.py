@@ -0,0 +1 @@
+"""Stand-in for the maya package used by the headless benchmark; see _fake.py."""
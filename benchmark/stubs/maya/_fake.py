@@ -0,0 +1,202 @@
+"""In-memory scene shared by the maya.cmds and maya.api.OpenMaya stand-ins.
+
+Every public call is counted in CALLS and can be slowed down by a simulated
+per-call latency, so the hot paths of the tool can be measured without Maya.
+"""
+import math
+import time
+import collections
+
+CALLS 	= collections.Counter()
+LATENCY = {'cmds': 0.0, 'api': 0.0, 'redraw': 0.0}		# seconds spent per call / viewport redraw
+
+# Message kinds
+ATTRIBUTE_CHANGED 	= 'attributeChanged'
+PRE_REMOVAL 		= 'preRemoval'
+NAME_CHANGED 		= 'nameChanged'
+NODE_ADDED 			= 'nodeAdded'
+SCENE 				= 'scene'
+EVENT 				= 'event'
+
+# Attributes hold internal units (radians, centimetres); cmds works in Maya's default UI units (degrees, centimetres)
+ANGLE_TYPE 		= 'doubleAngle'
+LINEAR_TYPE 	= 'doubleLinear'
+UI_PER_RADIAN 	= 180.0 / math.pi
+
+
+def charge(name, kind='cmds'):
+	"""Count a call and spin for the simulated latency of its kind."""
+	CALLS[name] += 1
+	delay = LATENCY[kind]
+	if delay:
+		end = time.perf_counter() + delay
+		while time.perf_counter() < end:
+			pass
+
+
+def reset_counters():
+	CALLS.clear()
+
+
+def attribute_type(attribute):
+	"""Return the getAttr type of an attribute, derived from its name."""
+	if attribute.startswith('rotate'):
+		return ANGLE_TYPE
+	if attribute.startswith('translate'):
+		return LINEAR_TYPE
+	return 'double'
+
+
+def to_ui(attribute, value):
+	"""Convert an internal-unit attribute value to UI units."""
+	return value * UI_PER_RADIAN if attribute_type(attribute) == ANGLE_TYPE else value
+
+
+def to_internal(attribute, value):
+	"""Convert a UI-unit attribute value to internal units."""
+	return value / UI_PER_RADIAN if attribute_type(attribute) == ANGLE_TYPE else value
+
+
+class Node(object):
+	__slots__ = ('name', 'type', 'attrs', 'defaults', 'limits', 'alive')
+
+	def __init__(self, name, attrs=None, node_type='transform'):
+		self.name 		= name
+		self.type 		= node_type
+		self.attrs 		= dict(attrs or {})
+		self.defaults 	= {}		# attribute -> default value
+		self.limits 	= {}		# attribute -> (minimum or None, maximum or None)
+		self.alive 		= True
+
+
+class Scene(object):
+	"""Nodes, their numeric attributes, registered callbacks and a simple undo queue."""
+	def __init__(self):
+		self.nodes 			= {}
+		self.callbacks 		= {}	# id -> (kind, key, func, client data)
+		self.next_id 		= 1
+		self.undo_queue 	= []	# [[(node, attribute, previous value)]]
+		self.chunk 			= None
+		self.chunk_depth 	= 0
+		self.current_time 	= 1.0
+		self.scene_name 	= ''
+		self.references 	= []		# referenced file paths
+		self.selection 		= []		# selected node names
+		self.suspended 		= False		# cmds.refresh(suspend=True)
+		self.panels 		= {'modelPanel4': 'smoothShaded'}
+		self.curves 		= {}		# anim curve name -> {frame: value}
+		self.connections 	= {}		# 'node.attribute' -> anim curve name driving it
+
+	# Nodes -------------------------------------------------------------------------------------------------
+	def create(self, name, attrs=None, node_type='transform'):
+		node = self.nodes[name] = Node(name, attrs, node_type)
+		self.emit(NODE_ADDED, None, node)
+		return node
+
+	def delete(self, name):
+		node = self.nodes.pop(name)
+		self.emit(PRE_REMOVAL, node, node)
+		node.alive = False
+
+	def rename(self, name, new_name):
+		node = self.nodes.pop(name)
+		node.name = new_name
+		self.nodes[new_name] = node
+		self.emit(NAME_CHANGED, node, node, name)
+
+	def new_scene(self, message_before, message_after):
+		self.emit(SCENE, message_before)
+		for name in list(self.nodes):
+			self.nodes.pop(name).alive = False
+		self.undo_queue = []
+		self.emit(SCENE, message_after)
+
+	# Attributes --------------------------------------------------------------------------------------------
+	def get(self, node, attribute):
+		return node.attrs[attribute]
+
+	def set(self, node, attribute, value, undoable=True):
+		previous = node.attrs[attribute]
+		node.attrs[attribute] = float(value)
+		if not self.suspended:
+			self.redraw()
+		if undoable:
+			if self.chunk is not None:
+				self.chunk.append((node, attribute, previous))
+			else:
+				self.undo_queue.append([(node, attribute, previous)])
+		self.emit_attribute_changed(node, attribute)
+
+	def set_many(self, values):
+		"""Set [(node, attribute, value)] as one non-undoable batch with a single redraw."""
+		for node, attribute, value in values:
+			if not node.alive:
+				raise RuntimeError("(kInvalidParameter): Object is no longer valid")
+		for node, attribute, value in values:
+			node.attrs[attribute] = float(value)
+			self.emit_attribute_changed(node, attribute)
+		if values and not self.suspended:
+			self.redraw()
+
+	def redraw(self):
+		"""Simulate the viewport redraw Maya runs after a change."""
+		charge('viewport redraw', 'redraw')
+
+	def emit_attribute_changed(self, node, attribute):
+		from maya.api import OpenMaya
+		plug = None
+		for kind, key, func, client in list(self.callbacks.values()):
+			if kind == ATTRIBUTE_CHANGED and key is node:
+				plug = plug or OpenMaya.MPlug(node, attribute)
+				func(OpenMaya.MNodeMessage.kAttributeSet, plug, OpenMaya.MPlug(), client)
+
+	# Undo --------------------------------------------------------------------------------------------------
+	def open_chunk(self):
+		self.chunk_depth += 1
+		if self.chunk is None:
+			self.chunk = []
+
+	def close_chunk(self):
+		self.chunk_depth = max(0, self.chunk_depth - 1)
+		if self.chunk_depth == 0 and self.chunk is not None:
+			if self.chunk:
+				self.undo_queue.append(self.chunk)
+			self.chunk = None
+
+	def undo(self):
+		if not self.undo_queue:
+			return False
+		for node, attribute, previous in reversed(self.undo_queue.pop()):
+			if node.alive:
+				node.attrs[attribute] = previous
+				self.emit_attribute_changed(node, attribute)
+		self.emit(EVENT, 'Undo')
+		return True
+
+	# Callbacks ---------------------------------------------------------------------------------------------
+	def add_callback(self, kind, key, func, client=None):
+		callback_id = self.next_id
+		self.next_id += 1
+		self.callbacks[callback_id] = (kind, key, func, client)
+		return callback_id
+
+	def remove_callback(self, callback_id):
+		if callback_id not in self.callbacks:
+			raise RuntimeError(f"Unknown callback id {callback_id}")
+		del self.callbacks[callback_id]
+
+	def emit(self, kind, key, *args):
+		from maya.api import OpenMaya
+		for cb_kind, cb_key, func, client in list(self.callbacks.values()):
+			if cb_kind != kind:
+				continue
+			if kind == NODE_ADDED:
+				func(OpenMaya.MObject(args[0]), client)
+			elif kind in (PRE_REMOVAL, NAME_CHANGED):
+				if cb_key is key:
+					func(OpenMaya.MObject(args[0]), *args[1:], client)
+			elif cb_key == key:
+				func(client)
+
+
+SCENE_STATE = Scene()
@@ -0,0 +1,207 @@
+"""Counting stand-in for the subset of maya.api.OpenMaya the tool uses."""
+from maya import _fake
+from maya._fake import SCENE_STATE, charge
+
+
+class MFn(object):
+	kAttribute 				= 1
+	kDoubleAngleAttribute 	= 2
+	kDoubleLinearAttribute 	= 3
+	kFloatAngleAttribute 	= 4
+	kFloatLinearAttribute 	= 5
+
+	TYPES = {_fake.ANGLE_TYPE: kDoubleAngleAttribute, _fake.LINEAR_TYPE: kDoubleLinearAttribute}
+
+
+class MObject(object):
+	def __init__(self, node=None, api_type=None):
+		self._node 		= node
+		self._api_type 	= api_type
+
+	def isNull(self):
+		return self._node is None
+
+	def apiType(self):
+		return self._api_type
+
+
+class MAngle(object):
+	kRadians = 1
+	kDegrees = 2
+
+	def __init__(self, value=0.0, unit=kRadians):
+		self._radians = value if unit == self.kRadians else value / _fake.UI_PER_RADIAN
+
+	@staticmethod
+	def uiUnit():
+		return MAngle.kDegrees
+
+	def asUnits(self, unit):
+		return self._radians if unit == self.kRadians else self._radians * _fake.UI_PER_RADIAN
+
+
+class MDistance(object):
+	kCentimeters = 6
+
+	def __init__(self, value=0.0, unit=kCentimeters):
+		self._value = value
+
+	@staticmethod
+	def uiUnit():
+		return MDistance.kCentimeters
+
+	def asUnits(self, unit):
+		return self._value
+
+
+class MObjectHandle(object):
+	def __init__(self, mobject):
+		self._node = mobject._node
+
+	def isValid(self):
+		return self._node is not None and self._node.alive
+
+	def isAlive(self):
+		return self.isValid()
+
+	def object(self):
+		return MObject(self._node)
+
+	def hashCode(self):
+		return id(self._node)
+
+
+class MSelectionList(object):
+	def __init__(self):
+		self._nodes = []
+
+	def add(self, name):
+		charge('MSelectionList.add', 'api')
+		node = SCENE_STATE.nodes.get(name)
+		if node is None:
+			raise RuntimeError(f"(kInvalidParameter): Object does not exist: {name}")
+		self._nodes.append(node)
+		return self
+
+	def getDependNode(self, index):
+		return MObject(self._nodes[index])
+
+
+class MPlug(object):
+	def __init__(self, node=None, attribute=None):
+		self._node 		= node
+		self._attribute = attribute
+
+	@property
+	def isCompound(self):
+		return False
+
+	def isNull(self):
+		return self._node is None
+
+	def node(self):
+		return MObject(self._node)
+
+	def attribute(self):
+		return MObject(self._node, MFn.TYPES.get(_fake.attribute_type(self._attribute), MFn.kAttribute))
+
+	def name(self):
+		return f"{self._node.name}.{self._attribute}"
+
+	def partialName(self, includeNodeName=False, includeNonMandatoryIndices=False, includeInstancedIndices=False,
+					useAlias=False, useFullAttributePath=False, useLongNames=False):
+		if includeNodeName:
+			return self.name()
+		return self._attribute
+
+	def asDouble(self):
+		charge('MPlug.asDouble', 'api')
+		return SCENE_STATE.get(self._node, self._attribute)
+
+	def setDouble(self, value):
+		charge('MPlug.setDouble', 'api')
+		if not self._node.alive:
+			raise RuntimeError("(kInvalidParameter): Object is no longer valid")
+		SCENE_STATE.set(self._node, self._attribute, value, undoable=False)
+
+
+class MFnDependencyNode(object):
+	def __init__(self, mobject=None):
+		self._node = mobject._node if mobject is not None else None
+
+	def name(self):
+		return self._node.name
+
+	def findPlug(self, attribute, wantNetworkedPlug):
+		charge('MFnDependencyNode.findPlug', 'api')
+		if attribute not in self._node.attrs:
+			raise RuntimeError(f"(kInvalidParameter): No such attribute: {attribute}")
+		return MPlug(self._node, attribute)
+
+
+class MDGModifier(object):
+	def __init__(self):
+		self._values = []
+
+	def newPlugValueDouble(self, plug, value):
+		charge('MDGModifier.newPlugValueDouble', 'api')
+		self._values.append((plug._node, plug._attribute, value))
+		return self
+
+	def doIt(self):
+		charge('MDGModifier.doIt', 'api')
+		values, self._values = self._values, []
+		SCENE_STATE.set_many(values)
+
+
+class MMessage(object):
+	@staticmethod
+	def removeCallback(callback_id):
+		SCENE_STATE.remove_callback(callback_id)
+
+	@staticmethod
+	def removeCallbacks(callback_ids):
+		for callback_id in callback_ids:
+			SCENE_STATE.remove_callback(callback_id)
+
+
+class MNodeMessage(MMessage):
+	kAttributeSet = 1 << 11
+
+	@staticmethod
+	def addAttributeChangedCallback(mobject, func, clientData=None):
+		return SCENE_STATE.add_callback(_fake.ATTRIBUTE_CHANGED, mobject._node, func, clientData)
+
+	@staticmethod
+	def addNodePreRemovalCallback(mobject, func, clientData=None):
+		return SCENE_STATE.add_callback(_fake.PRE_REMOVAL, mobject._node, func, clientData)
+
+	@staticmethod
+	def addNameChangedCallback(mobject, func, clientData=None):
+		return SCENE_STATE.add_callback(_fake.NAME_CHANGED, mobject._node, func, clientData)
+
+
+class MDGMessage(MMessage):
+	@staticmethod
+	def addNodeAddedCallback(func, nodeType="dependNode", clientData=None):
+		return SCENE_STATE.add_callback(_fake.NODE_ADDED, None, func, clientData)
+
+
+class MSceneMessage(MMessage):
+	kAfterNew 				= 2
+	kBeforeNew 				= 3
+	kAfterOpen 				= 5
+	kBeforeOpen 			= 6
+	kAfterLoadReference 	= 21
+	kAfterUnloadReference 	= 23
+	kAfterCreateReference 	= 35
+
+	@staticmethod
+	def addCallback(message, func, clientData=None):
+		return SCENE_STATE.add_callback(_fake.SCENE, message, func, clientData)
+
+
+class MEventMessage(MMessage):
+	@staticmethod
+	def addEventCallback(event, func, clientData=None):
+		return SCENE_STATE.add_callback(_fake.EVENT, event, func, clientData)
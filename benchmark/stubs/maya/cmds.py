@@ -0,0 +1,209 @@
+"""Counting stand-in for the subset of maya.cmds the tool uses."""
+import fnmatch
+
+from maya import _fake
+from maya._fake import SCENE_STATE, charge
+
+
+def _split(plug):
+	node_name, _, attribute = plug.partition('.')
+	node = SCENE_STATE.nodes.get(node_name)
+	if node is None or attribute not in node.attrs:
+		raise RuntimeError(f"No object matches name: {plug}")
+	return node, attribute
+
+
+def objExists(name):
+	charge('objExists')
+	if '.' in name:
+		node_name, _, attribute = name.partition('.')
+		node = SCENE_STATE.nodes.get(node_name)
+		return node is not None and attribute in node.attrs
+	return name in SCENE_STATE.nodes
+
+
+def getAttr(plug, type=False, **kwargs):
+	charge('getAttr')
+	node, attribute = _split(plug)
+	if type:
+		return _fake.attribute_type(attribute)
+	return _fake.to_ui(attribute, SCENE_STATE.get(node, attribute))
+
+
+def setAttr(plug, *values, size=None, **kwargs):
+	charge('setAttr')
+	curve, _, attribute = plug.partition('.')
+	if curve in SCENE_STATE.curves and attribute.startswith('ktv['):
+		# ktv[first:last] followed by time, value pairs
+		first = int(attribute[4:-1].split(':')[0])
+		keys = SCENE_STATE.curves[curve]
+		ordered = sorted(keys.items())
+		for i, (frame, value) in enumerate(zip(values[0::2], values[1::2]), first):
+			if i < len(ordered):
+				del keys[ordered[i][0]]
+			keys[float(frame)] = float(value)
+		return
+	node, attribute = _split(plug)
+	SCENE_STATE.set(node, attribute, _fake.to_internal(attribute, values[0]))
+
+
+def currentUnit(query=False, time=False, angle=False, **kwargs):
+	charge('currentUnit')
+	return 'film' if time else 'deg' if angle else 'cm'
+
+
+def currentTime(query=False, **kwargs):
+	charge('currentTime')
+	return SCENE_STATE.current_time
+
+
+def createNode(node_type, name=None, **kwargs):
+	charge('createNode')
+	name = name or node_type
+	while name in SCENE_STATE.curves or name in SCENE_STATE.nodes:
+		name += '1'
+	if node_type.startswith('animCurve'):
+		SCENE_STATE.curves[name] = {}
+	else:
+		SCENE_STATE.create(name, node_type=node_type)
+	return name
+
+
+def connectAttr(source, destination, **kwargs):
+	charge('connectAttr')
+	_split(destination)
+	SCENE_STATE.connections[destination] = source.partition('.')[0]
+
+
+def listConnections(plug, source=True, destination=True, type=None, **kwargs):
+	charge('listConnections')
+	curve = SCENE_STATE.connections.get(plug)
+	return [curve] if curve and source else []
+
+
+def cutKey(curve, time=None, clear=False, **kwargs):
+	charge('cutKey')
+	keys = SCENE_STATE.curves[curve]
+	for frame in [frame for frame in keys if time is None or time[0] <= frame <= time[1]]:
+		del keys[frame]
+
+
+def setKeyframe(curve, time=None, value=None, **kwargs):
+	charge('setKeyframe')
+	SCENE_STATE.curves[curve][float(time)] = float(value)
+
+
+def keyframe(curve, query=False, timeChange=False, valueChange=False, **kwargs):
+	charge('keyframe')
+	ordered = sorted(SCENE_STATE.curves[curve].items())
+	if timeChange:
+		return [frame for frame, value in ordered]
+	if valueChange:
+		return [value for frame, value in ordered]
+	return len(ordered)
+
+
+def ls(*patterns, type=None, objectsOnly=False, selection=False, **kwargs):
+	charge('ls')
+	if selection:
+		return list(SCENE_STATE.selection)
+	found = []
+	for pattern in patterns or ['*']:
+		node_pattern, _, attribute = pattern.partition('.')
+		for node in SCENE_STATE.nodes.values():
+			if not fnmatch.fnmatchcase(node.name, node_pattern):
+				continue
+			if type and node.type != type:
+				continue
+			if attribute:
+				if attribute in node.attrs:
+					found.append(node.name if objectsOnly else f"{node.name}.{attribute}")
+			else:
+				found.append(node.name)
+	return list(dict.fromkeys(found))
+
+
+def listAttr(node_name, keyable=False, scalar=False, **kwargs):
+	charge('listAttr')
+	node = SCENE_STATE.nodes.get(node_name)
+	if node is None:
+		raise ValueError(f"No object matches name: {node_name}")
+	return list(node.attrs)
+
+
+def attributeQuery(attribute, node=None, **flags):
+	charge('attributeQuery')
+	node = SCENE_STATE.nodes.get(node)
+	if node is None or attribute not in node.attrs:
+		raise RuntimeError(f"No attribute named {attribute}")
+	minimum, maximum = node.limits.get(attribute, (None, None))
+	if flags.get('listDefault'):
+		return [node.defaults.get(attribute, 0.0)]
+	if flags.get('minExists'):
+		return minimum is not None
+	if flags.get('maxExists'):
+		return maximum is not None
+	if flags.get('minimum'):
+		return [minimum]
+	if flags.get('maximum'):
+		return [maximum]
+	return False
+
+
+def file(query=False, reference=False, sceneName=False, **kwargs):
+	charge('file')
+	if query and reference:
+		return list(SCENE_STATE.references)
+	if query and sceneName:
+		return SCENE_STATE.scene_name
+	return None
+
+
+def referenceQuery(path, filename=False, withoutCopyNumber=False, **kwargs):
+	charge('referenceQuery')
+	return path.split('{')[0]
+
+
+def undoInfo(openChunk=False, closeChunk=False, chunkName=None, **kwargs):
+	charge('undoInfo')
+	if openChunk:
+		SCENE_STATE.open_chunk()
+	if closeChunk:
+		SCENE_STATE.close_chunk()
+
+
+def refresh(suspend=None, currentView=False, force=False, **kwargs):
+	charge('refresh')
+	if suspend is not None:
+		SCENE_STATE.suspended = bool(suspend)
+	else:
+		SCENE_STATE.redraw()
+
+
+def getPanel(type=None, **kwargs):
+	charge('getPanel')
+	return list(SCENE_STATE.panels)
+
+
+def modelEditor(panel, query=False, edit=False, displayAppearance=None, **kwargs):
+	charge('modelEditor')
+	if panel not in SCENE_STATE.panels:
+		raise RuntimeError(f"Object '{panel}' not found.")
+	if query:
+		return SCENE_STATE.panels[panel]
+	if edit and displayAppearance:
+		SCENE_STATE.panels[panel] = displayAppearance
+
+
+def playblast(completeFilename=None, format=None, **kwargs):
+	charge('playblast')
+	# A 1x1 PNG stands in for the captured viewport
+	with open(completeFilename, 'wb') as f:
+		f.write(bytes.fromhex('89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489'
+							  '0000000d49444154789c6360f8cf00000301010018dd8db00000000049454e44ae426082'))
+	return completeFilename
+
+
+def undo():
+	charge('undo')
+	SCENE_STATE.undo()
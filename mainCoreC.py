@@ -1,24 +1,48 @@
 import os
+import time
 import logging
-import maya.OpenMaya as om
-import maya.OpenMayaUI as omui
-import maya.cmds as cmds
 from functools import partial
+from contextlib import contextmanager
 from shiboken2 import wrapInstance, isValid
-from PySide2.QtWidgets import QWidget, QMainWindow, QScrollArea, QLabel, QVBoxLayout, QMessageBox
-from PySide2.QtCore import QFile
-from PySide2 import QtUiTools
+from PySide2.QtWidgets import (QWidget, QMainWindow, QScrollArea, QVBoxLayout, QMessageBox,
+							   QFileDialog, QInputDialog, QActionGroup, QDockWidget, QFormLayout, QHBoxLayout,
+							   QSlider, QLineEdit, QSplitter)
+from PySide2.QtGui import QKeySequence
+from PySide2.QtCore import Qt, QFile
 
 import importlib
 
-# External modules
-import LoadCollapsed_widget
-import Collapsible
-import MainCallbackManager
-
-importlib.reload(Collapsible)
-importlib.reload(LoadCollapsed_widget)
-importlib.reload(MainCallbackManager)
+# Import timing and the dev/production switch; reloaded first so dev mode picks up its own edits
+import Startup
+if Startup.DEV_MODE:
+	importlib.reload(Startup)
+
+# External modules, reloaded on every import of this module only in dev mode (ATTR_CONTROLLER_DEV=1)
+Instrumentation 	= Startup.load('Instrumentation')
+Collapsible 		= Startup.load('Collapsible')		# before LazyCollapsible, whose tabs subclass it
+LazyCollapsible 	= Startup.load('LazyCollapsible')
+AttributeWriteQueue = Startup.load('AttributeWriteQueue')
+PlugCache 			= Startup.load('PlugCache')
+BindingRegistry 	= Startup.load('BindingRegistry')
+UiFormCache 		= Startup.load('UiFormCache')
+AttributeDispatcher = Startup.load('AttributeDispatcher')
+PosePresets 		= Startup.load('PosePresets')
+ViewportThrottle 	= Startup.load('ViewportThrottle')
+ParameterTable 		= Startup.load('ParameterTable')
+RigScanner 			= Startup.load('RigScanner')
+Symmetry 			= Startup.load('Symmetry')
+SceneEvents 		= Startup.load('SceneEvents')
+MacroSliders 		= Startup.load('MacroSliders')
+SearchIndex 		= Startup.load('SearchIndex')
+Theme 				= Startup.load('Theme')
+
+# Imported the first time they are used: numpy, streaming, key recording, the Maya main window and the runtime .ui parser
+np 					= Startup.lazy('numpy', reload=False)
+FrameServer 		= Startup.lazy('FrameServer')
+KeyRecorder 		= Startup.lazy('KeyRecorder')
+PresetLibrary 		= Startup.lazy('PresetLibrary')
+omui 				= Startup.lazy('maya.OpenMayaUI', reload=False)
+QtUiTools 			= Startup.lazy('PySide2.QtUiTools', reload=False)
 
 # Paths and Styles
 SCRIPT_LOC 			= os.path.dirname(__file__)
@@ -32,39 +56,30 @@ collapseHandUI 		= os.path.join(SCRIPT_LOC, 'ui', 'Hand.ui')
 collapseTorsoUI 	= os.path.join(SCRIPT_LOC, 'ui', 'Torso.ui')
 collapseLegUI 		= os.path.join(SCRIPT_LOC, 'ui', 'Leg.ui')
 collapseFootUI 		= os.path.join(SCRIPT_LOC, 'ui', 'Foot.ui')
-
-SLIDER_STYLESHEET = """
-				QSlider::groove:horizontal {
-					border: 1px solid #999;
-					height: 6px;
-					background: #ccc;
-					margin: 0px;
-					border-radius: 3px;
-				}
-				QSlider::handle:horizontal {
-					background: #5c5c5c;
-					border: 1px solid #444;
-					width: 14px;
-					margin: -5px 0;
-					border-radius: 7px;
-				}
-				QSlider::handle:horizontal:hover {
-					background: #787878;
-					border: 1px solid #555;
-				}
-				QSlider::sub-page:horizontal {
-					background: #409eff;
-					border: 1px solid #5a9;
-					height: 6px;
-					border-radius: 3px;
-				}
-				QSlider::add-page:horizontal {
-					background: #ccc;
-					border: 1px solid #999;
-					height: 6px;
-					border-radius: 3px;
-				}
-				"""
+BINDINGS_SPEC 		= os.path.join(SCRIPT_LOC, 'bindings.json')
+
+# Preset files: binary libraries, and the JSON files of earlier versions
+PRESET_FILE_FILTER 	= "Preset Library (*.apl);;Pose Presets (*.json)"
+
+# More presets than this are picked in the library browser instead of getting a blend slider each
+MAX_BLEND_PRESETS 	= 50
+
+# Viewport redraw rates offered in Edit > Drag Redraw Rate; 0 redraws on every change
+DRAG_FPS_CHOICES 	= (0, 10, 15, 30, 60)
+
+# (tab title, window attribute, ui file) of each body-part tab, top to bottom
+BODY_PART_TABS = [
+	("HEAD-TAB",		"headUI",		collapseWidgetUI),
+	("NECK-TAB",		"NeckUI",		collapseNeckUI),
+	("NOSE-TAB",		"NoseUI",		collapseNoseUI),
+	("Ear-TAB",			"EarUI",		collapseEarUI),
+	("Shoulder-TAB",	"ShoulderUI",	collapseShoulderrUI),
+	("Arm-TAB",			"ArmUI",		collapseArmUI),
+	("Hand-TAB",		"HandUI",		collapseHandUI),
+	("Torso-TAB",		"TorsoUI",		collapseTorsoUI),
+	("Leg-TAB",			"LegUI",		collapseLegUI),
+	("Foot-TAB",		"FootUI",		collapseFootUI),
+]
 
 def get_maya_window():
 	"""Get Maya's main window as a PySide2 object."""
@@ -73,8 +88,16 @@ def get_maya_window():
 		raise RuntimeError("Failed to obtain Maya's main window.")
 	return wrapInstance(int(main_window_ptr), QWidget)  # Replace 'long' with 'int'
 
+# Compiled form classes, kept across show_window calls
+FORM_CACHE = UiFormCache.UiFormCache()
+
 def load_ui(ui_file, parent=None):
 	"""Load the .ui file and return the corresponding widget."""
+	ui_widget = FORM_CACHE.load(ui_file, parent) if os.path.exists(ui_file) else None
+	if ui_widget:
+		return ui_widget
+
+	# Cache miss without a compiler: parse the XML at runtime
 	loader = QtUiTools.QUiLoader()
 	ui_file = QFile(ui_file)
 	if not ui_file.exists():
@@ -90,165 +113,162 @@ class MyWindow(QMainWindow):
 	"""Main UI Window."""
 	def __init__(self, parent=None):
 		super(MyWindow, self).__init__(parent)
+		self.startup_timings = {}	# phase -> milliseconds
+		started = time.perf_counter()
 		
 		self.main_ui = os.path.join(SCRIPT_LOC, "ui", "main02.ui")
 		if not os.path.exists(self.main_ui):
 			raise FileNotFoundError(f"UI file not found: {self.main_ui}")
 		
 		# Load UI
-		self.ui = load_ui(self.main_ui, parent=self)
+		with self.timed("load main ui"):
+			self.ui = load_ui(self.main_ui, parent=self)
 		self.setWindowTitle("Maya Attribute Controller")
 		self.resize(600, 700)
 
-		self.headUI 		= None
-		self.NeckUI			= None
-		self.NoseUI			= None
-		self.EarUI 			= None
-		self.ShoulderUI		= None
+		# One stylesheet for every slider of the window, its docks and dialogs
+		Theme.apply(self)
+
+		# Body-part UIs are built when their tab is first expanded
+		for title, ui_name, ui_file in BODY_PART_TABS:
+			setattr(self, ui_name, None)
+
+		self.tabs 						= None
+		self.tab_by_ui 		= {}
+
+		# Hot-path spans (Maya writes, tool handlers, widget refreshes and repaints), shown in a dock panel
+		self.profiler 			= Instrumentation.Profiler(enabled=Instrumentation.PROFILE)
+		self.paint_timer 		= Instrumentation.PaintTimer(self.profiler, self)
+		self.instrument_panel 	= Instrumentation.InstrumentPanel(self.profiler, self)
+		self.addDockWidget(Qt.BottomDockWidgetArea, self.instrument_panel)
+		self.instrument_panel.hide()
+
+		# One record per slider: widgets, control, attribute, default, range and scale
+		with self.timed("load bindings"):
+			self.bindings 	= BindingRegistry.BindingRegistry.load(BINDINGS_SPEC)
+			self.macros 	= MacroSliders.MacroMixer.load(BINDINGS_SPEC)
+
+		# Keyable attributes of every control found in the rig, rescanned only when the rig files change
+		with self.timed("discover controls"):
+			self.scanner 	= RigScanner.RigScanner()
+			RigScanner.bindings_from_schema(self.scanner.schema(), self.bindings)
+
+		# Plugs resolved once through the API, coalesced slider writes flushed once per UI frame
+		with self.timed("resolve plugs"):
+			self.plug_cache 	= PlugCache.PlugCache()
+			self.plug_cache.resolve_all(self.bindings.plugs() + self.macros.outputs)
+		self.write_queue 	= AttributeWriteQueue.AttributeWriteQueue(self.plug_cache, parent=self,
+																	  profiler=self.profiler)
+
+		# One attribute-changed callback per node, routed back to the bound widgets unless it echoes our own write
+		self.dispatcher 	= AttributeDispatcher.AttributeDispatcher(self.plug_cache, self.refresh_bindings,
+																	  echo_filter=self.write_queue.consume_echo,
+																	  parent=self, profiler=self.profiler)
+
+		# Values the widgets show, per binding index; scene changes, undo/redo and reopening refresh only what differs
+		self.shown 			= np.full(len(self.bindings), np.nan)
+		self.suspended 		= False
+		self.scene_watcher 	= SceneEvents.SceneWatcher(parent=self)
+		self.scene_watcher.sceneChanged.connect(self.on_scene_changed)
+		self.scene_watcher.valuesChanged.connect(self.refresh_changed)
+		self.scene_watcher.valuesChanged.connect(self.rebase_macros)
+
+		# Pose presets over every bound plug, in binding order
+		self.presets 		= PosePresets.PresetSet(self.bindings.plugs())
+		self.presets_file 	= None
+		self.blend_dialog 	= None
+		self._pose_start 	= None
+
+		# Preset files are read and written on a worker thread, created with the first Open or Save
+		self.preset_io 		= None
+		self.preset_browser = None
+		self.preset_library = None		# open PresetLibrary; self.presets then holds only presets saved into it
+
+		# Value of each plug when its slider was pressed, so a drag commits as one undoable step
+		self._drag_start 	= {}
+
+		# Capped viewport redraws, optionally on proxy display, while a slider is dragged
+		self.viewport 		= ViewportThrottle.ViewportThrottle(profiler=self.profiler, parent=self)
+
+		# Values written while recording, keyed in bulk when recording stops; created on first use
+		self.recorder 		= None
+
+		# Optional local socket streaming (binding id, value) frames from external drivers into the write queue
+		self.frame_server 	= None
+
+		# Every binding as one row of a virtualized table, an alternative to the hand-built tabs
+		self.create_parameter_table()
+
+		# Sliders mixing one value into many plugs through a weight matrix
+		self.macro_widgets = {}		# macro index -> (slider, line edit)
+		self.create_macro_panel()
 
-		self.tabs 			= None
-		# self.NoseUI		= None
-		self.globalContrl 	= "con_world_L"
-		self.controlname 	= ['con_headScaleUp']
-		
-		self.slider_label_map 		= {
-									'sliderSacler01'		: 'lineEditSacler01', 
-									'sliderSacler02'		: 'lineEditSacler02',
-									'HeadSliderSize'		: 'HeadLineEditSize',
-									"HeadSliderScaleX"		: "HeadLineEditScaleX",
-									"HeadSliderScaleY"		: "HeadLineEditScaleY",
-									"HeadSliderScaleZ"		: "HeadLineEditScaleZ",
-									"HeadSliderUpDn"		: "HeadLineEditUpDn",
-									"HeadSliderFntBack"		: "HeadLineEditFntBack",
-									"HeadSliderRotate"		: "HeadLineEditRotate",
-									'NeckUP_Size_SD'		: 'NeckUP_Size_LD',
-									"NeckUP_ScaleY_SD"		: "NeckUP_ScaleY_LD",
-									"NeckUP_ScaleZ_SD"		: "NeckUP_ScaleZ_LD",
-									"NeckDN_Size_SD"		: "NeckDN_Size_LD",
-									"NeckDN_ScaleY_SD"		: "NeckDN_ScaleY_LD",
-									"NeckDN_ScaleZ_SD"		: "NeckDN_ScaleZ_LD",
-									"NeckRootUP_Dn_SD"		: "NeckRootUP_Dn_LD",
-									"NeckRootFront_Back_SD"	: "NeckRootFront_Back_LD",
-								}
-		
-		self.slider_attr_map 		= {
-									'sliderSacler01': 'all_scale',
-									'sliderSacler02': 'all_translate',
-								}
-		
-		self.sliderLabel_map 		= {
-
-									'HeadSliderSize'	: ('HeadLineEditSize',		'HeadRestSize'),
-									"HeadSliderScaleX"	: ("HeadLineEditScaleX",	'HeadRestSizeX'),
-									"HeadSliderScaleY"	: ("HeadLineEditScaleY",	'HeadRestSizeY'),
-									"HeadSliderScaleZ"	: ("HeadLineEditScaleZ",	'HeadRestSizeZ'),
-									"HeadSliderUpDn"	: ("HeadLineEditUpDn",		'HeadRestUpDn'),
-									"HeadSliderFntBack"	: ("HeadLineEditFntBack",	'HeadRestFntBack'),
-									"HeadSliderRotate"	: ("HeadLineEditRotate",	'HeadRestRotate'),
-									
-									'NeckUP_Size_SD'	: ('NeckUP_Size_LD',		'NeckUP_Size_BT'),
-									"NeckUP_ScaleY_SD"	: ("NeckUP_ScaleY_LD",		'NeckUP_ScaleY_BT'),
-									"NeckUP_ScaleZ_SD"	: ("NeckUP_ScaleZ_LD",		'NeckUP_ScaleZ_BT'),
-									"NeckDN_Size_SD"	: ("NeckDN_Size_LD",		'NeckDN_Size_BT'),
-									"NeckDN_ScaleY_SD"	: ("NeckDN_ScaleY_LD",		'NeckDN_ScaleY_BT'),
-									"NeckDN_ScaleZ_SD"	: ("NeckDN_ScaleZ_LD",		'NeckDN_ScaleZ_BT'),
-									"NeckRootUP_Dn_SD"	: ("NeckRootUP_Dn_LD",		'NeckRootUP_Dn_BT'),
-									"NeckRootFront_Back_SD"	: ("NeckRootFront_Back_LD",	'NeckRootFront_Back_BT'),
-								}
-		
-		self.sliderAttr_map			= {
-									'headUI': [
-										('self.headUI',	'HeadSliderSize', 	'con_headScaleUp', 'size'),
-										('self.headUI',	'HeadSliderScaleX', 'con_headScaleUp', 'scaleX'),
-										('self.headUI',	'HeadSliderScaleY', 'con_headScaleUp', 'scaleY'),
-										('self.headUI',	'HeadSliderScaleZ', 'con_headScaleUp', 'scaleZ'),
-										('self.headUI',	'HeadSliderUpDn', 	'con_headPosition', 'translateY'),
-										('self.headUI',	'HeadSliderFntBack','con_headPosition','translateZ'),
-										('self.headUI',	'HeadSliderRotate', 'con_headRotate', 	'rotateY'),
-									],
-
-									'NeckUI': [
-										('self.NeckUI',	'NeckUP_Size_SD', 		'con_headScaleDn', 'size'),
-										('self.NeckUI',	'NeckUP_ScaleY_SD', 	'con_headScaleDn', 'scaleY'),
-										('self.NeckUI',	'NeckUP_ScaleZ_SD', 	'con_headScaleDn', 'scaleZ'),
-										('self.NeckUI',	'NeckDN_Size_SD', 		'con_neck', 		'size'),
-										('self.NeckUI',	'NeckDN_ScaleY_SD', 	'con_neck', 		'scaleY'),
-										('self.NeckUI',	'NeckDN_ScaleZ_SD', 	'con_neck', 		'scaleZ'),
-										('self.NeckUI',	'NeckRootUP_Dn_SD', 	'con_neckPosition', 'translateY'),
-										('self.NeckUI',	'NeckRootFront_Back_SD','con_neckPosition', 'translateZ'),
-									],
-
-								}
-		
-		self.restAttr				= {
-									'headUI': [
-										('HeadRestSize',	'HeadSliderSize', 	'con_headScaleUp', 'size', '1'),
-										('HeadRestSizeX',	'HeadSliderScaleX', 'con_headScaleUp', 'scaleX','1'),
-										('HeadRestSizeY',	'HeadSliderScaleY', 'con_headScaleUp', 'scaleY','1'),
-										('HeadRestSizeZ',	'HeadSliderScaleZ', 'con_headScaleUp', 'scaleZ','1'),
-										('HeadRestUpDn',	'HeadSliderUpDn', 	'con_headPosition', 'translateY','0'),
-										('HeadRestFntBack',	'HeadSliderFntBack','con_headPosition','translateZ','0'),
-										('HeadRestRotate',	'HeadSliderRotate', 'con_headRotate', 	'rotateY','0'),
-									],
-									'neckUI': [
-										('NeckUP_Size_BT',		'NeckUP_Size_SD', 		'con_headScaleDn', 'size', '1'),
-										('NeckUP_ScaleY_BT',	'NeckUP_ScaleY_SD', 	'con_headScaleDn', 'scaleY', '1'),
-										('NeckUP_ScaleZ_BT',	'NeckUP_ScaleZ_SD', 	'con_headScaleDn', 'scaleZ', '1'),
-										('NeckDN_Size_BT',		'NeckDN_Size_SD', 		'con_neck', 		'size', '1'),
-										('NeckDN_ScaleY_BT',	'NeckDN_ScaleY_SD', 	'con_neck', 		'scaleY', '1'),
-										('NeckDN_ScaleZ_BT',	'NeckDN_ScaleZ_SD', 	'con_neck', 		'scaleZ', '1'),
-										('NeckRootUP_Dn_BT',	'NeckRootUP_Dn_SD', 	'con_neckPosition', 'translateY', '0'),
-										('NeckRootFront_Back_BT','NeckRootFront_Back_SD','con_neckPosition', 'translateZ', '0'),
-									],
-									# 'NoseUI': [
-									# 	('self.NoseUI',	'NoseTranslateY_SD', 'con_nosePosition', 'translateY'),
-									# 	('self.NoseUI',	'NoseTranslateZ_SD', 'con_nosePosition', 'translateZ'),
-									# 	('self.NoseUI',	'NoseRotateX_SD', 	'con_noseRotate',  	'rotateX'),
-									# 	('self.NoseUI',	'NoseScaleX_SD', 	'con_nose', 	'scaleX'),
-									# 	('self.NoseUI',	'NoseScaleY_SD', 	'con_nose', 	'scaleY'),
-									# 	('self.NoseUI',	'NoseScaleZ_SD', 	'con_nose', 	'scaleZ'),
-									# ],
-
-								}
-		
-		self.attribute_slider_pairs = {
-			'con_headScaleDn': [
-				('size', 'NeckUP_Size_SD', 'NeckUP_Size_LD'),
-				('scaleY', 'NeckUP_ScaleY_SD', 'NeckUP_ScaleY_LD'),
-				('scaleZ', 'NeckUP_ScaleZ_SD', 'NeckUP_ScaleZ_LD'),
-			],
-			'con_neck': [
-				('size', 'NeckDN_Size_SD', 'NeckDN_Size_LD'),
-				('scaleY', 'NeckDN_ScaleY_SD', 'NeckDN_ScaleY_LD'),
-				('scaleZ', 'NeckDN_ScaleZ_SD', 'NeckDN_ScaleZ_LD'),
-			],
-			'con_neckPosition': [
-				('translateY', 'NeckRootUP_Dn_SD', 'NeckRootUP_Dn_LD'),
-				('translateZ', 'NeckRootFront_Back_SD', 'NeckRootFront_Back_LD'),
-			],
-		}
-		
 		# Scrollable Area
 		self.scroll_area = QScrollArea(self)
 		self.scroll_area.setWidget(self.ui)
 		self.scroll_area.setWidgetResizable(True)
-		self.setCentralWidget(self.scroll_area)
+
+		# Search box above the tabs; rows are filtered through an index built once, widgets are only hidden
+		self.search_index 	= None
+		self.search_hidden 	= set()		# binding indices whose rows the search hides
+		self._tab_state 	= None		# tab -> expanded, from before the search started
+		self.search_edit = QLineEdit(self)
+		self.search_edit.setPlaceholderText("Search sliders, controls, attributes and tabs")
+		self.search_edit.setClearButtonEnabled(True)
+		self.search_edit.textChanged.connect(self.filter_rows)
+		central = QWidget(self)
+		central_layout = QVBoxLayout(central)
+		central_layout.setContentsMargins(0, 0, 0, 0)
+		central_layout.addWidget(self.search_edit)
+		central_layout.addWidget(self.scroll_area)
+		self.setCentralWidget(central)
 
 		# Configure UI
 		self.create_menu_bar()
-		self.setup_sliders()
-		self.connect_sliders()
-		self.initialize_ui_values()
-		self.globalCntrl_connection()
-
-		self.add_ui_widget()
+		with self.timed("create tabs"):
+			self.add_ui_widget()
+		with self.timed("build search index"):
+			self.build_search_index()
 		self.connection()
-		self.dynamic_sliders_styleSheet()
-		self.dynamic_connect_sliders()
-		self.dynaicInitialize_ui_values()
-		self.dynamicRest_value()
-		self.dynamic_callback_connection()
+		with self.timed("configure global sliders"):
+			self.configure_bindings(self.bindings.in_ui('ui'))
+		with self.timed("register callbacks"):
+			self.dispatcher.watch(self.bindings)
+			self.scene_watcher.watch()
+			self.shown = self.bulk_read()
 		self.on_slider_click()
+		self.startup_timings["window total"] = (time.perf_counter() - started) * 1000.0
+		Startup.check_budget(self.startup_timings["window total"])
+
+	@contextmanager
+	def timed(self, phase):
+		"""Record how long a block of the window startup takes."""
+		start = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.startup_timings[phase] = (time.perf_counter() - start) * 1000.0
+
+	def startup_report(self):
+		"""Return a readable summary of the window startup and tab load times."""
+		lines = ["Startup timings:"]
+		for phase, elapsed in self.startup_timings.items():
+			lines.append(f"  {phase:<28}{elapsed:8.1f} ms")
+		lines.append(f"  {'live callbacks':<28}{self.dispatcher.callback_count:8d}")
+		lines.append(f"  {'echo events suppressed':<28}{self.dispatcher.suppressed:8d}")
+		total = Startup.import_total() + self.startup_timings.get("window total", 0.0)
+		lines.append(f"  {'imports + window':<28}{total:8.1f} ms of {Startup.STARTUP_BUDGET_MS:.0f} ms budget")
+		lines.extend(Startup.import_report())
+		loaded = [tab for tab in self.tabs or [] if tab.loaded]
+		if loaded:
+			lines.append("Tabs loaded on demand:")
+			for tab in loaded:
+				lines.append(f"  {tab.title:<28}{tab.load_time:8.1f} ms")
+		return "\n".join(lines)
+
+	def show_startup_report(self):
+		"""Display the startup timings."""
+		QMessageBox.information(self, "Startup Report", self.startup_report())
 
 	# =======================================================================================================
 	# Create Custom MenuBar
@@ -259,8 +279,15 @@ class MyWindow(QMainWindow):
 
 		# File menu
 		file_menu = menu_bar.addMenu("File")
-		file_menu.addAction("Open")
-		file_menu.addAction("Save")
+		open_action = file_menu.addAction("Open")
+		open_action.triggered.connect(self.open_presets)
+		save_action = file_menu.addAction("Save")
+		save_action.triggered.connect(self.save_preset)
+		blend_action = file_menu.addAction("Blend Presets...")
+		blend_action.triggered.connect(self.show_blend_dialog)
+		file_menu.addSeparator()
+		rescan_action = file_menu.addAction("Rescan Rig")
+		rescan_action.triggered.connect(self.rescan_rig)
 		file_menu.addSeparator()
 		exit_action = file_menu.addAction("Exit")
 		exit_action.triggered.connect(self.close)
@@ -269,140 +296,732 @@ class MyWindow(QMainWindow):
 		edit_menu = menu_bar.addMenu("Edit")
 		edit_menu.addAction("Undo")
 		edit_menu.addAction("Redo")
+		find_action = edit_menu.addAction("Find")
+		find_action.setShortcut(QKeySequence.Find)
+		find_action.triggered.connect(self.focus_search)
+		edit_menu.addSeparator()
+		fps_menu 	= edit_menu.addMenu("Drag Redraw Rate")
+		fps_group 	= QActionGroup(self)
+		for fps in DRAG_FPS_CHOICES:
+			fps_action = fps_menu.addAction(f"{fps} fps" if fps else "Unlimited")
+			fps_action.setCheckable(True)
+			fps_action.setChecked(fps == self.viewport.fps)
+			fps_action.triggered.connect(partial(setattr, self.viewport, 'fps', fps))
+			fps_group.addAction(fps_action)
+		proxy_action = edit_menu.addAction("Proxy Display While Dragging")
+		proxy_action.setCheckable(True)
+		proxy_action.setChecked(self.viewport.proxy)
+		proxy_action.toggled.connect(partial(setattr, self.viewport, 'proxy'))
+		mirror_action = edit_menu.addAction("Mirror Edits L/R")
+		mirror_action.setCheckable(True)
+		mirror_action.toggled.connect(self.set_mirroring)
+		self.stream_action = edit_menu.addAction("Accept Streamed Frames")
+		self.stream_action.setCheckable(True)
+		self.stream_action.toggled.connect(self.set_streaming)
+		self.record_action = edit_menu.addAction("Record Keys")
+		self.record_action.setCheckable(True)
+		self.record_action.toggled.connect(self.set_recording)
 		edit_menu.addSeparator()
 		edit_menu.addAction("Preferences")
 
+		# View menu
+		view_menu = menu_bar.addMenu("View")
+		view_menu.addAction(self.parameter_dock.toggleViewAction())
+		view_menu.addAction(self.macro_dock.toggleViewAction())
+
+		# Targets menu: which characters every slider drives
+		targets_menu = menu_bar.addMenu("Targets")
+		selected_action = targets_menu.addAction("Drive Selected Characters")
+		selected_action.triggered.connect(self.target_selection)
+		namespaces_action = targets_menu.addAction("Drive Namespaces...")
+		namespaces_action.triggered.connect(self.target_namespaces)
+		root_action = targets_menu.addAction("Drive Root Namespace Only")
+		root_action.triggered.connect(partial(self.set_targets, ['']))
+
 		# Help menu
 		help_menu = menu_bar.addMenu("Help")
 		about_action = help_menu.addAction("About")
 		about_action.triggered.connect(self.show_about_dialog)
+		startup_action = help_menu.addAction("Startup Report")
+		startup_action.triggered.connect(self.show_startup_report)
+		help_menu.addAction(self.instrument_panel.toggleViewAction())
 
 	def show_about_dialog(self):
 		"""Display an About dialog."""
 		QMessageBox.about(self, "About", "Master File Manager ver2.0\nCreated using PySide2 for Maya.")
 	# =======================================================================================================
-	#  Global Control Setup:-
+	#  Binding Widgets:-
 	# =======================================================================================================
-	def globalCntrl_connection(self):
-		"""Initialize the Callback Manager"""
-		self.callback_manager = MainCallbackManager.CallbackManager(self.globalContrl,
-																	self.slider_label_map, 
-																	self.ui)
-
-	def setup_sliders(self):
-		"""Apply stylesheets to sliders."""
-		for slider_name in self.slider_label_map.keys():
-			slider = getattr(self.ui, slider_name, None)
-			if slider:
-				slider.setStyleSheet(SLIDER_STYLESHEET)
-				slider.setMinimum(0)
-				slider.setMaximum(100)
+	def binding_widgets(self, binding):
+		"""Return the (slider, line edit, reset button) of a binding, None where missing."""
+		ui_object = getattr(self, binding.ui, None)
+		if not ui_object:
+			return None, None, None
+		slider 			= getattr(ui_object, binding.slider, None)
+		line_edit 		= getattr(ui_object, binding.line_edit, None) if binding.line_edit else None
+		reset_button 	= getattr(ui_object, binding.reset, None) if binding.reset else None
+		return slider, line_edit, reset_button
+
+	def configure_bindings(self, bindings):
+		"""Style, connect and initialize the widgets of the given bindings."""
+		self.setup_sliders(bindings)
+		self.connect_sliders(bindings)
+		self.initialize_ui_values(bindings)
+
+	def setup_sliders(self, bindings):
+		"""Apply ranges to bound sliders; their style comes from the window theme."""
+		for binding in bindings:
+			slider, line_edit, reset_button = self.binding_widgets(binding)
+			if not slider:
+				print(f"Warning: Slider '{binding.slider}' not found in {binding.ui}.")
+				continue
+			slider.installEventFilter(self.paint_timer)
+			if binding.minimum is not None:
+				slider.setMinimum(binding.to_slider(binding.minimum))
+			if binding.maximum is not None:
+				slider.setMaximum(binding.to_slider(binding.maximum))
 
-	def connect_sliders(self):
-		"""Connect sliders and QLineEdits to update Maya attributes."""
-		for slider_name, attribute in self.slider_attr_map .items():
-			slider 			= getattr(self.ui, slider_name, None)
-			line_edit_name 	= self.slider_label_map.get(slider_name)
-			line_edit 		= getattr(self.ui, line_edit_name, None)
+	def connect_sliders(self, bindings):
+		"""Connect sliders, QLineEdits and reset buttons to update Maya attributes."""
+		for binding in bindings:
+			slider, line_edit, reset_button = self.binding_widgets(binding)
 
 			# Connect slider to update Maya attribute and QLineEdit
 			if slider:
-				slider.sliderPressed.connect(self.on_slider_click)
-				slider.sliderReleased.connect(self.on_slider_release)
-				slider.valueChanged.connect(partial(self.update_attribute_from_slider, attribute, slider_name))
+				slider.sliderPressed.connect(partial(self.on_slider_click, binding))
+				slider.sliderReleased.connect(partial(self.on_slider_release, binding))
+				slider.valueChanged.connect(partial(self.update_attribute_from_slider, binding))
 
 			# Connect QLineEdit to update Maya attribute and QSlider
 			if line_edit and slider:
-				line_edit.editingFinished.connect(partial(self.update_slider_from_line_edit, line_edit, slider, attribute))
+				line_edit.editingFinished.connect(partial(self.update_slider_from_line_edit, binding))
+
+			# Connect reset button to reset Maya attribute, slider and line edit
+			if reset_button and binding.default is not None:
+				reset_button.clicked.connect(partial(self.reset_attribute, binding))
 
-	def update_attribute_from_slider(self, attribute, slider_name, slider_value):
+	def update_attribute_from_slider(self, binding, slider_value):
 		"""Update Maya attribute and QLineEdit when slider is moved."""
-		float_value = slider_value / 10.0
-		if cmds.objExists(self.globalContrl):
-			cmds.setAttr(f"{self.globalContrl}.{attribute}", float_value)
-		# Update QLineEdit
-		line_edit_name = self.slider_label_map.get(slider_name)
-		line_edit = getattr(self.ui, line_edit_name, None)
-		if line_edit:
-			line_edit.setText(f"{float_value:.1f}")
-
-	def update_slider_from_line_edit(self, line_edit, slider, attribute):
+		with self.profiler.span(Instrumentation.PYTHON, 'slider tick', binding.plug):
+			float_value = binding.from_slider(slider_value)
+			if binding.plug in self._drag_start:
+				# Dragging: the value goes into history once, on release
+				self.drag_to(binding, float_value)
+			else:
+				# Keyboard, wheel or page step: every step is its own undoable change
+				self.set_value(binding, float_value)
+			# Update QLineEdit
+			slider, line_edit, reset_button = self.binding_widgets(binding)
+			if line_edit:
+				line_edit.setText(f"{float_value:.1f}")
+			if slider:
+				self.mark_modified(binding, slider)
+			self.note_values([binding], [float_value])
+
+	@staticmethod
+	def mark_modified(binding, slider):
+		"""Tint a slider away from its binding default; re-polishes only when that changes."""
+		Theme.set_modified(slider, binding.default is not None and slider.value() != binding.to_slider(binding.default))
+
+	def update_slider_from_line_edit(self, binding):
 		"""Update slider and Maya attribute when QLineEdit value is changed."""
+		self.profiler.mark(Instrumentation.PYTHON, 'line edit commit', binding.plug)
+		slider, line_edit, reset_button = self.binding_widgets(binding)
 		try:
 			float_value = float(line_edit.text())
-			slider_value = int(float_value * 10)
 
 			# Update the QSlider
 			slider.blockSignals(True)
-			slider.setValue(slider_value)
+			slider.setValue(binding.to_slider(float_value))
 			slider.blockSignals(False)
 
-			# Update Maya attribute
-			if cmds.objExists(self.globalContrl):
-				cmds.setAttr(f"{self.globalContrl}.{attribute}", float_value)
+			# Update Maya attribute as one undoable step
+			self.set_value(binding, float_value)
+			self.note_values([binding], [float_value])
 
 		except ValueError:
 			print("Invalid input in QLineEdit. Please enter a numeric value.")
 
-	def initialize_ui_values(self):
+	def initialize_ui_values(self, bindings):
 		"""Initialize slider and QLineEdit values with Maya attribute values."""
-
-		for slider_name, attribute in self.slider_attr_map .items():
-			if cmds.objExists(self.globalContrl):
-				current_value = cmds.getAttr(f"{self.globalContrl}.{attribute}")
-				slider = getattr(self.ui, slider_name, None)
-				line_edit_name = self.slider_label_map.get(slider_name)
-				line_edit = getattr(self.ui, line_edit_name, None)
-
+		self.apply_snapshot(bindings, self.snapshot(bindings))
+
+	def snapshot(self, bindings=None):
+		"""Read every plug of the given bindings (default: all) in one pass, in binding order."""
+		bindings = self.bindings if bindings is None else bindings
+		with self.profiler.span(Instrumentation.MAYA, 'plug read'):
+			return self.plug_cache.read_many([binding.plug for binding in bindings])
+
+	def apply_snapshot(self, bindings, values):
+		"""Populate sliders and QLineEdits from a snapshot without emitting their signals."""
+		span = self.profiler.span
+		for binding, value in zip(bindings, values):
+			if value is None:
+				continue
+			with span(Instrumentation.QT, 'widget refresh', binding.plug):
+				slider, line_edit, reset_button = self.binding_widgets(binding)
 				if slider:
-					slider.setValue(int(current_value * 10))
+					slider.blockSignals(True)
+					slider.setValue(binding.to_slider(value))
+					slider.blockSignals(False)
+					self.mark_modified(binding, slider)
 				if line_edit:
-					line_edit.setText(f"{current_value:.1f}")
+					line_edit.blockSignals(True)
+					line_edit.setText(f"{value:.1f}")
+					line_edit.blockSignals(False)
+		self.note_values(bindings, values)
+
+	def note_values(self, bindings, values):
+		"""Remember the values now shown for bindings and hand them to the parameter table."""
+		self.parameter_model.set_values(bindings, values)
+		if len(self.shown) < len(self.bindings):
+			self.shown = np.concatenate([self.shown, np.full(len(self.bindings) - len(self.shown), np.nan)])
+		for binding, value in zip(bindings, values):
+			if value is not None:
+				self.shown[binding.index] = value
+
+	def bulk_read(self):
+		"""Read every bound plug in one pass as an array indexed like the bindings, NaN where missing."""
+		return np.array([np.nan if value is None else value for value in self.snapshot()], dtype=float)
+
+	def refresh_changed(self):
+		"""Diff a bulk read against the shown values and refresh only the bindings that differ."""
+		with self.profiler.span(Instrumentation.PYTHON, 'diff refresh'):
+			current = self.bulk_read()
+			shown 	= self.shown
+			if len(shown) < len(current):
+				shown = np.concatenate([shown, np.full(len(current) - len(shown), np.nan)])
+			changed = np.flatnonzero(~np.isclose(current, shown, rtol=0.0, atol=AttributeWriteQueue.ECHO_TOLERANCE,
+												 equal_nan=True))
+			if changed.size:
+				bindings = self.bindings.bindings
+				self.apply_snapshot([bindings[i] for i in changed],
+									[None if np.isnan(current[i]) else float(current[i]) for i in changed])
+			self.shown = current
+		return int(changed.size)
+
+	def refresh_all(self):
+		"""Re-read every bound plug, e.g. after switching characters or loading a scene."""
+		self.refresh_bindings(list(self.bindings))
+
+	def reset_attribute(self, binding, checked=False):
+		"""Reset Maya attribute, slider and QLineEdit to the binding default."""
+		value = float(binding.default)
+		self.profiler.mark(Instrumentation.PYTHON, 'reset', binding.plug)
+		self.set_value(binding, value, action="Reset")
+
+		# The attribute is already written; keep the slider from queueing the same value again
+		self.apply_snapshot([binding], [value])
+
+	# =======================================================================================================
+	# Value Transactions: one undoable step per drag, line edit, reset or table edit
+	# =======================================================================================================
+	def begin_drag(self, binding):
+		"""Start a drag transaction: remember the values undo should return to, one per target."""
+		for key in self.write_queue.linked(binding.plug):
+			self._drag_start[key] = self.plug_cache.read_targets(*key)
+		self.viewport.begin()
+
+	def drag_to(self, binding, value):
+		"""Preview a dragged value through the frame-paced write queue."""
+		self.write_queue.push(binding.control, binding.attribute, value)
+		self.viewport.changed()
+		self.show_mirror(binding, value)
+
+	def end_drag(self, binding, final):
+		"""End a drag transaction, leaving only the final value in undo history."""
+		restore = {key: self._drag_start.pop(key, None) for key in self.write_queue.linked(binding.plug)}
+		start 	= restore[binding.plug]
+		lead 	= start[0] if start else None
+		if final is not None and lead is not None and abs(final - lead) > AttributeWriteQueue.ECHO_TOLERANCE:
+			# Put the start values back silently, then write only the final values into history
+			with self.profiler.span(Instrumentation.MAYA, 'drag commit', binding.plug):
+				self.write_queue.commit({binding.plug: final}, f"Drag {binding.control}.{binding.attribute}",
+										restore=restore)
+		else:
+			self.write_queue.flush()
+		# Full display and one redraw once the final value is in
+		self.viewport.end()
+
+	def set_value(self, binding, value, action="Set"):
+		"""Write a value as one undoable step."""
+		self.write_queue.commit({binding.plug: value}, f"{action} {binding.control}.{binding.attribute}")
+		self.show_mirror(binding, value)
+
+	def show_mirror(self, binding, value):
+		"""Show the value written to the opposite side while mirroring; its echo is suppressed."""
+		if self.write_queue.symmetry and binding.plug in self.write_queue.symmetry:
+			mirrored = self.write_queue.mirrored({binding.plug: value})
+			del mirrored[binding.plug]
+			self.show_values(mirrored)
+
+	def set_mirroring(self, enabled):
+		"""Pair every bound plug with its opposite side once, or stop mirroring."""
+		self.write_queue.flush()
+		if enabled:
+			self.write_queue.symmetry = Symmetry.SymmetryTable.build(self.plug_cache, self.bindings.plugs())
+			logging.info(f"Mirroring {len(self.write_queue.symmetry)} left/right plug pairs.")
+		else:
+			self.write_queue.symmetry = None
+
+	def show_values(self, values):
+		"""Show {plug: value} written by the tool in the bound widgets."""
+		bindings = [binding for plug in values for binding in self.bindings.by_plug.get(plug, [])]
+		self.apply_snapshot(bindings, [values[binding.plug] for binding in bindings])
+
+	# =======================================================================================================
+	# Key Recording: edits captured in memory, keyed in one undo chunk when recording stops
+	# =======================================================================================================
+	def set_recording(self, enabled):
+		"""Start recording from the current frame, or stop and key what was recorded."""
+		if enabled:
+			self.write_queue.flush()
+			if self.recorder is None:
+				self.recorder = self.write_queue.recorder = KeyRecorder.KeyRecorder(self.plug_cache.read)
+			self.recorder.start()
+			return
+		if not (self.recorder and self.recorder.recording):
+			return
+		self.write_queue.flush()
+		with self.profiler.span(Instrumentation.PYTHON, 'key simplify'):
+			curves = self.recorder.stop()
+		with self.profiler.span(Instrumentation.MAYA, 'key commit'):
+			keyed = self.recorder.commit(curves, self.plug_cache.paths)
+		keys = sum(len(frames) for frames, values in curves.values())
+		logging.info(f"Recorded {self.recorder.samples} samples into {keys} keys on {keyed} curves.")
+
+	# =======================================================================================================
+	# Streamed Frames: external drivers writing through the same frame-paced queue as a drag
+	# =======================================================================================================
+	def stream_schema(self):
+		"""Return the binding id of every bound plug, sent to each client that connects."""
+		return [{'id': binding.index, 'control': binding.control, 'attribute': binding.attribute}
+				for binding in self.bindings]
+
+	def set_streaming(self, enabled):
+		"""Start or stop the local frame server."""
+		if not enabled:
+			if self.frame_server:
+				self.frame_server.stop()
+			return
+		if self.frame_server is None:
+			self.frame_server = FrameServer.FrameServer(self.apply_stream, parent=self)
+		try:
+			address = self.frame_server.start(self.stream_schema())
+		except OSError as e:
+			logging.warning(f"Failed to start the frame server: {e}")
+			self.stream_action.setChecked(False)
+			return
+		logging.info(f"Accepting streamed frames on {address}.")
+
+	def apply_stream(self, values):
+		"""Queue the newest streamed {binding id: value}; nothing is added to undo history."""
+		with self.profiler.span(Instrumentation.PYTHON, 'stream frame'):
+			bindings 	= self.bindings.bindings
+			written 	= {}
+			for index, value in values.items():
+				if index >= len(bindings):
+					continue
+				binding = bindings[index]
+				if binding.minimum is not None:
+					value = max(value, binding.minimum)
+				if binding.maximum is not None:
+					value = min(value, binding.maximum)
+				self.write_queue.push(binding.control, binding.attribute, value)
+				written[binding.plug] = value
+			self.viewport.changed()
+			self.show_values(self.write_queue.mirrored(written))
+
+	# =======================================================================================================
+	# Pose Presets
+	# =======================================================================================================
+	def preset_worker(self):
+		"""Return the background preset reader/writer, creating it on first use."""
+		if self.preset_io is None:
+			self.preset_io = PresetLibrary.PresetWorker(self)
+			self.preset_io.opened.connect(self.on_presets_opened)
+			self.preset_io.saved.connect(self.on_presets_saved)
+			self.preset_io.details.connect(self.on_preset_details)
+			self.preset_io.failed.connect(self.on_preset_io_failed)
+		return self.preset_io
+
+	def open_presets(self):
+		"""Load a preset library or JSON preset file in the background."""
+		path, _ = QFileDialog.getOpenFileName(self, "Open Presets", "", PRESET_FILE_FILTER)
+		if not path:
+			return
+		self.statusBar().showMessage(f"Loading {os.path.basename(path)}...")
+		self.preset_worker().open(path, self.presets.schema)
+
+	def on_presets_opened(self, path, library, presets):
+		"""Use presets loaded by the worker: browse a mapped library, blend a small JSON file."""
+		self.presets_file 	= path
+		self.preset_library = library
+		if library is not None:
+			self.presets = PosePresets.PresetSet(self.presets.schema)
+			self.statusBar().showMessage(f"Opened {len(library)} presets in {os.path.basename(path)}.", 5000)
+			self.show_preset_browser(library.names, os.path.basename(path))
+		else:
+			self.presets = presets
+			self.statusBar().showMessage(f"Loaded {len(presets)} presets from {os.path.basename(path)}.", 5000)
+			self.show_blend_dialog()
+
+	def save_preset(self):
+		"""Store the current pose as a named preset and write the preset file in the background."""
+		name, ok = QInputDialog.getText(self, "Save Preset", "Preset name:")
+		if not ok or not name:
+			return
+		path = self.presets_file
+		if not path:
+			path, _ = QFileDialog.getSaveFileName(self, "Save Presets", "", PRESET_FILE_FILTER)
+			if not path:
+				return
+		self.presets.add(name, self.current_pose())
+		thumbnails = {}
+		if path.lower().endswith(PresetLibrary.EXTENSION):
+			thumbnails[name] = PresetLibrary.capture_thumbnail()
+		self.presets_file = path
+		self.statusBar().showMessage(f"Saving {os.path.basename(path)}...")
+		# The worker writes a copy; later edits of self.presets do not race with it
+		self.preset_worker().save(path, self.presets.conform(self.presets.schema),
+								  {name: PresetLibrary.preset_metadata()}, thumbnails)
+
+	def on_presets_saved(self, path, library):
+		self.statusBar().showMessage(f"Saved {os.path.basename(path)}.", 5000)
+		if library is not None:
+			self.preset_library = library
+			if self.preset_browser:
+				self.preset_browser.set_names(library.names)
+
+	def on_preset_io_failed(self, path, message):
+		self.statusBar().clearMessage()
+		QMessageBox.warning(self, "Presets", f"Failed to read or write {path}:\n{message}")
+
+	def show_preset_browser(self, names, title):
+		"""Open the filterable list of a library's presets."""
+		if self.preset_browser:
+			self.preset_browser.close()
+		self.preset_browser = PresetLibrary.PresetBrowser(names, title, parent=self)
+		self.preset_browser.detailsRequested.connect(self.preset_worker().fetch)
+		self.preset_browser.applyRequested.connect(self.apply_preset)
+		self.preset_browser.blendRequested.connect(self.blend_presets)
+		self.preset_browser.show()
+
+	def on_preset_details(self, name, metadata, thumbnail):
+		if self.preset_browser:
+			self.preset_browser.show_details(name, metadata, thumbnail)
+
+	def apply_preset(self, name):
+		"""Apply one preset at full weight as one undoable step, reading only its row of a library."""
+		try:
+			if self.preset_library is not None:
+				pose = self.preset_library.vector(name, self.presets.schema)
+			else:
+				pose = self.presets.vector(name)
+		except ValueError as e:
+			self.statusBar().showMessage(str(e), 5000)
+			return
+		self.begin_pose()
+		self.commit_pose(pose)
+
+	def blend_presets(self, names):
+		"""Open the blend dialog for a few presets picked in the browser, copying only their rows."""
+		try:
+			if self.preset_library is not None:
+				presets = self.preset_library.preset_set(names, self.presets.schema)
+			else:
+				rows 	= [self.presets.names.index(name) for name in names]
+				presets = PosePresets.PresetSet.from_rows(self.presets.schema, names, self.presets.matrix[rows])
+		except ValueError as e:
+			self.statusBar().showMessage(str(e), 5000)
+			return
+		self.show_blend_dialog(presets)
+
+	def show_blend_dialog(self, presets=None):
+		"""Open one weight slider per preset (default: every loaded preset)."""
+		if presets is None and self.preset_library is not None:
+			# A library's presets are picked in its browser
+			self.show_preset_browser(self.preset_library.names, os.path.basename(self.presets_file))
+			return
+		presets = self.presets if presets is None else presets
+		if not len(presets):
+			QMessageBox.information(self, "Blend Presets", "No presets loaded. Use File > Open or File > Save first.")
+			return
+		if len(presets) > MAX_BLEND_PRESETS:
+			QMessageBox.information(self, "Blend Presets", f"{len(presets)} presets are loaded; pick the ones to "
+									"blend in the preset library browser.")
+			self.show_preset_browser(presets.names, "Preset Library")
+			return
+		if self.blend_dialog:
+			self.blend_dialog.close()
+		self.blend_dialog = PosePresets.PresetBlendDialog(presets, self.current_pose, parent=self)
+		self.blend_dialog.started.connect(self.begin_pose)
+		self.blend_dialog.preview.connect(self.preview_pose)
+		self.blend_dialog.commit.connect(self.commit_pose)
+		self.blend_dialog.show()
+
+	def current_pose(self):
+		"""Read the pose vector of every preset plug, NaN where a plug is missing."""
+		values = self.plug_cache.read_many(self.presets.schema)
+		return np.array([np.nan if value is None else value for value in values], dtype=float)
+
+	def pose_values(self, pose):
+		"""Return {plug: value} for the plugs a pose vector sets."""
+		return {plug: float(value) for plug, value in zip(self.presets.schema, pose) if not np.isnan(value)}
+
+	def begin_pose(self):
+		"""Remember the pose before a blend so undo returns to it."""
+		self._pose_start = {plug: self.plug_cache.read_targets(*plug) for plug in self.presets.schema}
+
+	def preview_pose(self, pose):
+		"""Apply a blended pose through the frame-paced write queue while scrubbing."""
+		values = self.pose_values(pose)
+		for (control, attribute), value in values.items():
+			self.write_queue.push(control, attribute, value, mirror=False)
+		self.show_values(values)
+
+	def commit_pose(self, pose):
+		"""Apply a blended pose as one batched write in one undo chunk."""
+		values = self.pose_values(pose)
+		self.write_queue.commit(values, "Apply Pose Preset", restore=self._pose_start, mirror=False)
+		self._pose_start = None
+		self.show_values(values)
+
+	# =======================================================================================================
+	# Parameter Table
+	# =======================================================================================================
+	def create_parameter_table(self):
+		"""Create the dockable table of every binding; rows are read only when shown."""
+		self.parameter_model 	= ParameterTable.ParameterModel(self.bindings, self.plug_cache.read, self)
+		self.parameter_view 	= ParameterTable.ParameterView(self.parameter_model)
+		self.parameter_dock 	= QDockWidget("Parameter Table", self)
+		self.parameter_dock.setObjectName("ParameterTable")
+		self.parameter_dock.setWidget(self.parameter_view)
+		self.addDockWidget(Qt.RightDockWidgetArea, self.parameter_dock)
+		self.parameter_dock.hide()
+
+		delegate = self.parameter_view.delegate
+		delegate.pressed.connect(self.on_table_pressed)
+		delegate.moved.connect(self.on_table_moved)
+		delegate.released.connect(self.on_table_released)
+		self.parameter_model.edited.connect(self.on_table_edited)
+
+	# =======================================================================================================
+	# Macro Sliders: one value mixed into many plugs, written in one batch per frame
+	# =======================================================================================================
+	def create_macro_panel(self):
+		"""Create the dockable panel with a slider and line edit per macro."""
+		panel 	= QWidget()
+		layout 	= QFormLayout(panel)
+		for macro in self.macros:
+			slider = QSlider(Qt.Horizontal)
+			slider.setRange(macro.to_slider(macro.minimum), macro.to_slider(macro.maximum))
+			slider.setValue(macro.to_slider(macro.default))
+			line_edit = QLineEdit(f"{macro.default:.2f}")
+			line_edit.setFixedWidth(50)
+			slider.sliderPressed.connect(partial(self.begin_macro, macro))
+			slider.valueChanged.connect(partial(self.on_macro_moved, macro))
+			slider.sliderReleased.connect(partial(self.on_macro_released, macro))
+			line_edit.editingFinished.connect(partial(self.on_macro_edited, macro))
+			row = QHBoxLayout()
+			row.addWidget(slider)
+			row.addWidget(line_edit)
+			layout.addRow(macro.name, row)
+			self.macro_widgets[macro.index] = (slider, line_edit)
+		self.macro_dock = QDockWidget("Macro Sliders", self)
+		self.macro_dock.setObjectName("MacroSliders")
+		self.macro_dock.setWidget(panel)
+		self.addDockWidget(Qt.RightDockWidgetArea, self.macro_dock)
+		self.macro_dock.hide()
+
+	def begin_macro(self, macro):
+		"""Start a macro drag: its plugs' current values are the base it offsets and what undo returns to."""
+		plugs = self.macros.driven(macro)
+		self.macros.begin(macro, self.plug_cache.read_many(plugs))
+		for plug in plugs:
+			for key in self.write_queue.linked(plug):
+				self._drag_start[key] = self.plug_cache.read_targets(*key)
+		self.viewport.begin()
+
+	def macro_to(self, macro, value):
+		"""Preview a dragged macro value: one matrix-vector product, queued for the next batched write."""
+		if self.macros.dragging is not macro:
+			return
+		with self.profiler.span(Instrumentation.PYTHON, 'macro mix', macro.name):
+			values = self.macros.move(macro, value)
+		for (control, attribute), plug_value in values.items():
+			self.write_queue.push(control, attribute, plug_value)
+		self.viewport.changed()
+		self.show_values(self.write_queue.mirrored(values))
+
+	def end_macro(self, macro, final):
+		"""End a macro drag, leaving only the final values of its plugs in undo history."""
+		if self.macros.dragging is not macro:
+			return
+		moved 	= self.macros.moved(final)
+		values 	= self.macros.move(macro, final)
+		self.macros.end()
+		restore = {key: self._drag_start.pop(key, None) for plug in self.macros.driven(macro)
+				   for key in self.write_queue.linked(plug)}
+		if moved:
+			with self.profiler.span(Instrumentation.MAYA, 'drag commit', macro.name):
+				self.write_queue.commit(values, f"Macro {macro.name}", restore=restore)
+			self.show_values(self.write_queue.mirrored(values))
+		else:
+			self.write_queue.flush()
+		self.viewport.end()
+
+	def set_macro(self, macro, value):
+		"""Move a macro to a value as one undoable step."""
+		self.macros.begin(macro, self.plug_cache.read_many(self.macros.driven(macro)))
+		values = self.macros.move(macro, value)
+		self.macros.end()
+		self.write_queue.commit(values, f"Macro {macro.name}")
+		self.show_values(self.write_queue.mirrored(values))
+
+	def rebase_macros(self):
+		"""Show every macro at its default again; macros offset whatever the plugs hold now.
+
+		A macro drag in progress is cancelled: its queued previews are dropped so they do not
+		overwrite what undo or the new scene put in the plugs, and the rest of the drag is ignored.
+		"""
+		dragged = self.macros.dragging
+		if dragged:
+			for plug in self.macros.driven(dragged):
+				for key in self.write_queue.linked(plug):
+					self.write_queue.pending.pop(key, None)
+					self._drag_start.pop(key, None)
+			self.viewport.end()
+		self.macros.rebase()
+		for macro in self.macros:
+			slider, line_edit = self.macro_widgets[macro.index]
+			slider.blockSignals(True)
+			slider.setValue(macro.to_slider(macro.default))
+			slider.blockSignals(False)
+			line_edit.setText(f"{macro.default:.2f}")
+
+	def on_macro_moved(self, macro, step):
+		value = macro.from_slider(step)
+		slider, line_edit = self.macro_widgets[macro.index]
+		line_edit.setText(f"{value:.2f}")
+		if slider.isSliderDown():
+			self.macro_to(macro, value)
+		else:
+			self.set_macro(macro, value)
+
+	def on_macro_released(self, macro):
+		slider, line_edit = self.macro_widgets[macro.index]
+		self.end_macro(macro, macro.from_slider(slider.value()))
+
+	def on_macro_edited(self, macro):
+		slider, line_edit = self.macro_widgets[macro.index]
+		try:
+			value = min(max(float(line_edit.text()), macro.minimum), macro.maximum)
+		except ValueError:
+			logging.warning(f"Invalid value for macro {macro.name}: {line_edit.text()}")
+			return
+		if abs(value - self.macros.values[macro.index]) < 1e-9:
+			return
+		slider.blockSignals(True)
+		slider.setValue(macro.to_slider(value))
+		slider.blockSignals(False)
+		self.set_macro(macro, value)
+
+	# =======================================================================================================
+	# Targets: the same edit fanned out to many referenced characters
+	# =======================================================================================================
+	def set_targets(self, namespaces, checked=False):
+		"""Drive the given namespaces; the first one is shown in the UI."""
+		self.write_queue.flush()
+		self.dispatcher.teardown()
+		self.plug_cache.set_targets(namespaces)
+		self.dispatcher.watch(self.bindings)
+		self.set_mirroring(self.write_queue.symmetry is not None)
+		self.parameter_model.invalidate()
+		self.refresh_all()
+		count = len(self.plug_cache.namespaces)
+		lead = self.plug_cache.lead or "root"
+		self.setWindowTitle(f"Maya Attribute Controller - {lead}" + (f" (+{count - 1})" if count > 1 else ""))
+
+	def target_selection(self):
+		"""Drive the characters of the selected nodes."""
+		namespaces = PlugCache.selected_namespaces()
+		if not namespaces:
+			QMessageBox.information(self, "Targets", "Select one control of every character to drive.")
+			return
+		self.set_targets(namespaces)
+
+	def target_namespaces(self):
+		"""Drive a comma-separated list of namespaces."""
+		text, ok = QInputDialog.getText(self, "Targets", "Namespaces (comma-separated, first is shown):",
+										text=", ".join(self.plug_cache.namespaces))
+		if ok:
+			self.set_targets([namespace.strip().strip(':') for namespace in text.split(',')])
+
+	def rescan_rig(self):
+		"""Scan the rig again, ignoring the cached schema, and add rows for newly found attributes."""
+		added = RigScanner.bindings_from_schema(self.scanner.schema(rescan=True), self.bindings)
+		if added:
+			self.plug_cache.resolve_all([binding.plug for binding in added])
+			self.dispatcher.watch(added)
+			self.parameter_model.add_bindings(added)
+			self.presets = self.presets.conform(self.bindings.plugs())
+			self.set_mirroring(self.write_queue.symmetry is not None)
+		logging.info(f"Rig scan found {len(added)} new attributes.")
+
+	def on_table_pressed(self, binding):
+		self.profiler.mark(Instrumentation.QT, 'slider pressed', binding.slider)
+		self.begin_drag(binding)
+
+	def on_table_moved(self, binding, value):
+		with self.profiler.span(Instrumentation.PYTHON, 'slider tick', binding.plug):
+			if binding.plug in self._drag_start:
+				self.drag_to(binding, value)
+			else:
+				self.set_value(binding, value)
+			self.show_values({binding.plug: value})
+
+	def on_table_released(self, binding, value):
+		self.end_drag(binding, value)
+		self.show_values({binding.plug: value})
+
+	def on_table_edited(self, binding, value):
+		self.profiler.mark(Instrumentation.PYTHON, 'line edit commit', binding.plug)
+		self.set_value(binding, value)
+		self.show_values({binding.plug: value})
 
 	# =======================================================================================================
 	# Add Collapse Tab in Main UI : - collapseLegUI
 	# =======================================================================================================
 	def add_ui_widget(self):
 		"""Add collapsible functionality to the layout."""
-		self.headUI 	= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseWidgetUI)._loadUI()
-		self.NeckUI 	= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseNeckUI)._loadUI()
-		self.NoseUI 	= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseNoseUI)._loadUI()
-		self.EarUI 		= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseEarUI)._loadUI()
-		self.ShoulderUI = LoadCollapsed_widget._loadWidget(widgetCollapse=collapseShoulderrUI)._loadUI()
-		self.ArmUI 		= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseArmUI)._loadUI()
-		self.HandUI 	= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseHandUI)._loadUI()
-		self.TorsoUI 	= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseTorsoUI)._loadUI()
-		self.LegUI 		= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseLegUI)._loadUI()
-		self.FootUI 	= LoadCollapsed_widget._loadWidget(widgetCollapse=collapseFootUI)._loadUI()
-
 		main_layout = getattr(self.ui, "CollapseLayout", None)
 		if not main_layout:
 			logging.warning("Main layout not found. Creating a new QVBoxLayout.")
 			main_layout = QVBoxLayout(self.ui)
 			self.ui.setLayout(main_layout)
 
-		# Add collapsible tabs
+		# Add collapsible tabs holding placeholders until first expanded
 		self.tabs = []
-
-		def create_tab(title, content):
-			tab = Collapsible.CollapsibleTab(title)
-			tab.content_layout.addWidget(content)
+		for title, ui_name, ui_file in BODY_PART_TABS:
+			tab = LazyCollapsible.LazyCollapsibleTab(title, partial(self.load_body_part, ui_name, ui_file))
 			main_layout.addWidget(tab)
 			self.tabs.append(tab)
-
-		create_tab("HEAD-TAB", self.headUI)
-		create_tab("NECK-TAB", self.NeckUI)
-		create_tab("NOSE-TAB", self.NoseUI)
-		create_tab("Ear-TAB", self.EarUI)
-		create_tab("Shoulder-TAB", self.ShoulderUI)
-		create_tab("Arm-TAB", self.ArmUI)
-		create_tab("Hand-TAB", self.HandUI)
-		create_tab("Torso-TAB", self.TorsoUI)
-		create_tab("Leg-TAB", self.LegUI)
-		create_tab("Foot-TAB", self.FootUI)
+			self.tab_by_ui[ui_name] = tab
 
 		main_layout.addStretch()
 
+	def load_body_part(self, ui_name, ui_file):
+		"""Load a body-part UI, then connect and initialize its bindings."""
+		content = load_ui(ui_file)
+		setattr(self, ui_name, content)
+		self.configure_bindings(self.bindings.in_ui(ui_name))
+		# Opened by a search: rows it does not match start out hidden
+		for binding in self.bindings.in_ui(ui_name):
+			if binding.index in self.search_hidden:
+				self.set_row_visible(binding, False)
+		return content
+
 	def connection(self):
 		"""Connect button actions to specific tab operations."""
 		# Connect the button to expand the "HEAD-TAB"
@@ -415,222 +1034,175 @@ class MyWindow(QMainWindow):
 				tab.expand()  # Expand the "HEAD-TAB"
 			else:
 				tab.collapse()  # Collapse all other tabs
-				
-	def dynamic_sliders_styleSheet(self):
-		"""Apply stylesheets and configure sliders and splitters"""
-		# Iterate over UI elements and their attribute mappings
-		for ui_element, slider_mappings in self.sliderAttr_map.items():
-			for ui, slider_name, control, attribute in slider_mappings:
-				# Map ui_element to corresponding UI object
-				ui_object = None
-				if ui_element in 'headUI':
-					ui_object = self.headUI
-				
-				elif ui_element in 'NeckUI':
-					ui_object = self.NeckUI
-
-				elif ui_element in 'NoseUI':
-					ui_object = self.NoseUI
-				
-				# Apply the stylesheet if the slider exists
-				if ui_object:
-					slider = getattr(ui_object, slider_name, None)
-					if slider:
-						slider.setStyleSheet(SLIDER_STYLESHEET)
-					else:
-						print(f"Warning: Slider '{slider_name}' not found in {ui_element}.")
-
-	def dynamic_connect_sliders(self):
-		"""Connect sliders and QLineEdits to update Maya attributes."""
-		for ui_element, slider_mappings in self.sliderAttr_map.items():
-			# Determine the target UI object
-			Gui = None
-			if ui_element == 'headUI':
-				Gui = self.headUI
-			elif ui_element == 'NeckUI':
-				Gui = self.NeckUI
-
-			# Skip if no valid UI object is found
-			if not Gui:
-				continue
-
-			# Iterate through slider mappings
-			for ui, slider_name, controlname, attribute in slider_mappings:
-				slider = getattr(Gui, slider_name, None)
-				line_edit_name = self.sliderLabel_map.get(slider_name, [None])
-				line_edit = getattr(Gui, line_edit_name[0], None)
-
-				# Connect slider to update Maya attribute and QLineEdit
-				if slider:
-					slider.valueChanged.connect(partial(
-						self.dynamicUpdate_attribute_from_slider,
-						controlname, attribute, slider_name, Gui
-					))
-
-				# Connect QLineEdit to update Maya attribute and QSlider
-				if line_edit and slider:
-					line_edit.editingFinished.connect(partial(
-						self.dynamicUpdate_slider_from_line_edit,
-						line_edit, slider, attribute, controlname
-					))
-
-	def dynamicUpdate_attribute_from_slider(self, control, 
-										 attribute, slider_name, 
-										 Gui, slider_value):
-		"""Update Maya attribute and QLineEdit when slider is moved."""
-		float_value = slider_value / 10.0
-
-		# Update Maya attribute
-		if cmds.objExists(control):
-			cmds.setAttr(f"{control}.{attribute}", float_value)
-
-		# Update QLineEdit
-		line_edit_name = self.sliderLabel_map.get(slider_name, [None])
-		line_edit = getattr(Gui, line_edit_name[0], None)
-		if line_edit:
-			line_edit.setText(f"{float_value:.1f}")
 
-	def dynamicUpdate_slider_from_line_edit(self, line_edit, 
-										slider, attribute,
-										controlname):
-		"""Update slider and Maya attribute when QLineEdit value is changed."""
-		try:
-			float_value = float(line_edit.text())
-			slider_value = int(float_value * 10)
-
-			# Update the QSlider
-			slider.blockSignals(True)
-			slider.setValue(slider_value)
-			slider.blockSignals(False)
-
-			# Update Maya attribute
-			if cmds.objExists(controlname):
-				cmds.setAttr(f"{controlname}.{attribute}", float_value)
-		except ValueError:
-			print("Invalid input in QLineEdit. Please enter a numeric value.")
-
-	def dynaicInitialize_ui_values(self):
-		"""Initialize slider and QLineEdit values with Maya attribute values."""
-		"""Connect sliders and QLineEdits to update Maya attributes."""	
-		for ui_element, slider_mappings in self.sliderAttr_map.items():
-			for ui, slider_name, controlname, attribute in slider_mappings:
-				if ui_element in 'headUI':
-					if cmds.objExists(controlname):
-						current_value 	= cmds.getAttr(f"{controlname}.{attribute}")
-						slider 			= getattr(self.headUI, slider_name, None)
-						line_edit_name 	= self.sliderLabel_map.get(slider_name)
-						line_edit 		= getattr(self.headUI, line_edit_name[0], None)
-
-						if slider:
-							slider.setValue(int(current_value * 10))
-						if line_edit:
-							line_edit.setText(f"{current_value:.1f}")
-
-				if ui_element in 'NeckUI':
-					if cmds.objExists(controlname):
-						current_value 	= cmds.getAttr(f"{controlname}.{attribute}")
-						slider 			= getattr(self.NeckUI, slider_name, None)
-						line_edit_name 	= self.sliderLabel_map.get(slider_name)
-						line_edit 		= getattr(self.NeckUI, line_edit_name[0], None)
-
-						if slider:
-							slider.setValue(int(current_value * 10))
-						if line_edit:
-							line_edit.setText(f"{current_value:.1f}")
-
-	def dynamicRest_value(self):
-		# Iterate over UI elements and their attribute mappings
-		for ui_element, slider_mappings in self.restAttr.items():
-			for restbtn, slider_name, control, attribute, value in slider_mappings:
-				# Identify UI to operate on
-				if ui_element in 'headUI':
-					ui 	= self.headUI
-				
-				elif ui_element in 'neckUI':
-					ui = self.NeckUI
-				
-				else:
-					continue
-
-				reset_button 	= getattr(ui, restbtn, None)
-				slider 			= getattr(ui, slider_name, None)
-				line_edit_name 	= self.sliderLabel_map.get(slider_name, None)
-				line_edit 		= getattr(ui, line_edit_name[0], None) if line_edit_name else None
-
-				if reset_button:
-					# Connect reset button to update Maya attribute
-					reset_button.clicked.connect(
-						lambda ctrl=control, attr=attribute, val=value: cmds.setAttr(f"{ctrl}.{attr}", float(val))
-					)
-					# Connect reset button to reset slider and line edit
-					reset_button.clicked.connect(
-						partial(self.reset_attribute, line_edit, slider_name, float(value), ui)
-					)
-
-	def reset_attribute(self, line_edit, slider_name, value, ui):
-		slider 			= getattr(ui, slider_name, None)
-		line_edit_name 	= self.sliderLabel_map.get(slider_name, None)
-		line_edit 		= getattr(ui, line_edit_name[0], None) if line_edit_name else None
-
-		if line_edit:
-			line_edit.setText(f"{value:.1f}")
+	# =======================================================================================================
+	#  Search:-
+	# =======================================================================================================
+	def build_search_index(self):
+		"""Index every tab by its title and every binding in a tab by slider, control, attribute and tab title."""
+		self.search_index = SearchIndex.SearchIndex()
+		for tab in self.tabs:
+			self.search_index.add(tab, tab.title)
+		titles = {ui_name: title for title, ui_name, ui_file in BODY_PART_TABS}
+		for binding in self.bindings:
+			if binding.ui == 'ui' or binding.ui in titles:
+				self.search_index.add(binding, binding.slider, binding.control, binding.attribute, titles.get(binding.ui))
+		self.search_index.build()
+
+	def focus_search(self):
+		self.search_edit.setFocus()
+		self.search_edit.selectAll()
+
+	def filter_rows(self, text):
+		"""Show only the rows matching text and expand only the tabs holding them; empty text shows everything."""
+		with self.profiler.span(Instrumentation.PYTHON, 'search', text):
+			if not text.strip():
+				self.hide_rows(set())
+				for tab, expanded in (self._tab_state or {}).items():
+					self.set_tab_expanded(tab, expanded)
+				self._tab_state = None
+				return
+
+			if self._tab_state is None:
+				self._tab_state = {tab: tab.toggle_button.isChecked() for tab in self.tabs}
+			matches = set(self.search_index.search(text))
+			indexed = [item for item in self.search_index.items if isinstance(item, BindingRegistry.SliderBinding)]
+			self.hide_rows({binding.index for binding in indexed if binding not in matches})
+
+			# Rows are hidden first, so a tab loaded by expanding it starts out filtered
+			open_uis = {item.ui for item in matches if isinstance(item, BindingRegistry.SliderBinding)}
+			for ui_name, tab in self.tab_by_ui.items():
+				self.set_tab_expanded(tab, tab in matches or ui_name in open_uis)
+
+	@staticmethod
+	def set_tab_expanded(tab, expanded):
+		if tab.toggle_button.isChecked() == expanded:
+			return
+		if expanded:
+			tab.expand()
+		else:
+			tab.collapse()
+
+	def hide_rows(self, hidden):
+		"""Hide the rows of the given binding indices and show the others, touching only rows that change."""
+		changed = hidden ^ self.search_hidden
+		self.search_hidden = hidden
+		for index in changed:
+			self.set_row_visible(self.bindings.bindings[index], index not in hidden)
+
+	def set_row_visible(self, binding, visible):
+		"""Show or hide a binding's row: the splitter holding its widgets if there is one, else the widgets."""
+		rows = []
+		for widget in self.binding_widgets(binding):
+			if widget is None:
+				continue
+			parent = widget.parentWidget()
+			row = parent if isinstance(parent, QSplitter) else widget
+			if row not in rows:
+				rows.append(row)
+				row.setVisible(visible)
 
-		if slider:
-			slider.setValue(int(value * 10))  # Assuming scaling by 10 is correct
-
-	def dynamic_callback_connection(self):
-		"""Initialize the Callback Manager"""
-		for ui_element, slider_mappings in self.restAttr.items():
-			for restbtn, slider_name, control, attribute, value in slider_mappings:
-				# Map ui_element to corresponding UI object
-				ui_object = None
-				if ui_element in 'headUI':
-					ui_object = self.headUI
-				
-				elif ui_element in 'NeckUI':
-					ui_object = self.NeckUI
-				
-				self.callback_manager = MainCallbackManager.CallbackManager(control, self.slider_label_map, ui_object)
-
-				# -------------------------------------------------------------------------------------------------------------
-		"""Initialize the Callback Manager"""
-		# Dictionary of node names with their attribute mappings
-		self.dynamiccallback_manager = MainCallbackManager.DynamicCallbackManager(self.NeckUI)				
-		# Loop through dictionary to add mappings dynamically
-		for node_name, attributes in self.attribute_slider_pairs.items():
-			for attribute_name, slider_name, line_edit_name in attributes:
-				self.dynamiccallback_manager.add_attribute_slider_pair(node_name, attribute_name, slider_name, line_edit_name)
+	# =======================================================================================================
+	#  Callback Setup:-
+	# =======================================================================================================
+	def refresh_bindings(self, bindings):
+		"""Push current Maya values into the widgets of the given bindings."""
+		self.parameter_model.invalidate(bindings)
+		bindings = [binding for binding in bindings if getattr(self, binding.ui, None)]
+		self.apply_snapshot(bindings, self.snapshot(bindings))
 
 	# =======================================================================================================
-	def on_slider_click(self):
-		"""Handle slider click events."""
-		slider = self.sender()
+	def on_slider_click(self, binding=None):
+		"""Start a drag transaction: remember the value undo should return to."""
+		slider = self.binding_widgets(binding)[0] if binding else self.sender()
 		if slider:
-			slider_name = slider.objectName()
-			print(f"Clicked on Slider: {slider_name}")
-			# slider.setStyleSheet("background-color: lightblue;")  # Highlight slider
+			self.profiler.mark(Instrumentation.QT, 'slider pressed', slider.objectName())
+		if binding:
+			self.begin_drag(binding)
+
+	def on_slider_release(self, binding=None):
+		"""End a drag transaction; the theme drops the pressed look by itself."""
+		if binding:
+			slider = self.binding_widgets(binding)[0]
+			self.end_drag(binding, binding.from_slider(slider.value()) if slider else None)
+		else:
+			self.write_queue.flush()
+			self.viewport.end()
 
-	def on_slider_release(self):
-		"""Reset slider appearance after release."""
-		slider = self.sender()
-		if slider:
-			slider.setStyleSheet(SLIDER_STYLESHEET)  # Reset slider to default style
+	# =======================================================================================================
+	#  Scene Changes and Reopening:-
+	# =======================================================================================================
+	def on_scene_changed(self):
+		"""Attach to the nodes of the new scene or reference and refresh the bindings whose values differ."""
+		# Writes, drags and recorded samples still pending belong to the previous nodes
+		self.write_queue.pending.clear()
+		if self.recorder:
+			self.recorder.cancel()
+		self.record_action.setChecked(False)
+		self._drag_start.clear()
+		self.dispatcher.teardown()
+		self.dispatcher.watch(self.bindings)
+		self.set_mirroring(self.write_queue.symmetry is not None)
+		self.refresh_changed()
+		self.rebase_macros()
+
+	def suspend(self):
+		"""Stop listening to Maya while the window is closed; plugs stay cached for a fast reopen."""
+		self.stream_action.setChecked(False)
+		self.record_action.setChecked(False)
+		self.write_queue.flush()
+		self.viewport.end()
+		self._drag_start.clear()
+		self.dispatcher.teardown()
+		self.scene_watcher.teardown()
+		self.suspended = True
+
+	def resume(self):
+		"""Listen to Maya again and refresh only what changed while the window was closed."""
+		if not self.suspended:
+			return 0
+		self.suspended = False
+		self.dispatcher.watch(self.bindings)
+		self.scene_watcher.watch()
+		self.set_mirroring(self.write_queue.symmetry is not None)
+		return self.refresh_changed()
+
+	def shutdown(self):
+		"""Remove every callback for good, before the window is deleted."""
+		self.suspend()
+		self.plug_cache.teardown()
+		if self.preset_io:
+			self.preset_io.shutdown()
 
 	def closeEvent(self, event):
-		"""Clean up when the window is closed."""
-		self.callback_manager.remove_callback()
-		self.dynamiccallback_manager.remove_callbacks()
-		# callback_manager.remove_callback()
+		"""Hide the window and stop listening to Maya until it is shown again."""
+		self.suspend()
 		event.accept()
 
 # ============================================================================================================
 def show_window():
-	"""Show the window."""
+	"""Show the window, reusing the one already built."""
 	global my_window
+	start = time.perf_counter()
+	window = globals().get('my_window')
+	if window is not None and type(window) is MyWindow and isValid(window):
+		changed = window.resume()
+		window.show()
+		window.raise_()
+		window.activateWindow()
+		window.startup_timings["reopen window (total)"] = (time.perf_counter() - start) * 1000.0
+		logging.info(f"Reopened the attribute controller; {changed} values changed while it was closed.")
+		return window
+
+	# A window built by an earlier version of this module
 	try:
-		my_window.close()
-		my_window.deleteLater()
+		getattr(window, 'shutdown', window.close)()
+		window.close()
+		window.deleteLater()
 	except:
 		pass
 	my_window = MyWindow(parent=get_maya_window())
-	my_window.show()
\ No newline at end of file
+	my_window.show()
+	my_window.startup_timings["open window (total)"] = (time.perf_counter() - start) * 1000.0
+	logging.info(my_window.startup_report())
+	return my_window